@@ -0,0 +1,35 @@
+from rest_framework.permissions import SAFE_METHODS
+
+
+class SparseFieldsetMixin:
+    """
+    Serializer mixin that narrows the rendered fields with ``?fields=`` and
+    ``?exclude=`` (comma-separated field names) on read requests.
+
+    Fields are dropped when the serializer is built, so a ``QueryPlanMixin``
+    serializer also leaves their columns out of ``only()`` and skips joins
+    that only those fields needed. Only serializers given the request in
+    their own ``context`` are narrowed; nested serializers are left alone.
+    Unknown names are ignored.
+    """
+    fields_query_param = 'fields'
+    exclude_query_param = 'exclude'
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        request = kwargs.get('context', {}).get('request')
+        if request is None or request.method not in SAFE_METHODS:
+            return
+
+        params = getattr(request, 'query_params', request.GET)
+        requested = split_names(params.get(self.fields_query_param, ''))
+        excluded = split_names(params.get(self.exclude_query_param, ''))
+
+        for name in list(self.fields):
+            if (requested and name not in requested) or name in excluded:
+                self.fields.pop(name)
+
+
+def split_names(value):
+    return {name.strip() for name in value.split(',') if name.strip()}
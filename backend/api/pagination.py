@@ -0,0 +1,192 @@
+import base64
+import json
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination over a composite, unique ordering such as
+    ``(-created_at, -id)``.
+
+    Each page is fetched with a ``WHERE (a, b) < (x, y)`` style predicate
+    instead of an ``OFFSET``, so deep pages cost the same as the first one.
+    The total row count is only computed when the client asks for it with
+    ``?count=true``.
+    """
+    ordering = ('-created_at', '-id')
+    page_size = api_settings.PAGE_SIZE
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    cursor_query_param = 'cursor'
+    count_query_param = 'count'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+
+        self.count = None
+        if self.wants_count(request):
+            self.count = queryset.count()
+
+        cursor = self.decode_cursor(request)
+        if cursor is None:
+            values, reverse = None, False
+        else:
+            values, reverse = cursor
+
+        fields = [name.lstrip('-') for name in self.ordering]
+        queryset = self.load_ordering_fields(queryset, fields)
+        if values is not None:
+            queryset = queryset.filter(self.get_keyset_filter(fields, values, reverse))
+
+        ordering = self.ordering
+        if reverse:
+            ordering = [self.flip(name) for name in ordering]
+
+        results = list(queryset.order_by(*ordering)[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+        if reverse:
+            results.reverse()
+
+        # A cursor always proves that rows exist on the side we came from.
+        if reverse:
+            self.has_next = values is not None
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = values is not None
+
+        self.first_position = self.get_position(results[0], fields) if results else None
+        self.last_position = self.get_position(results[-1], fields) if results else None
+        self.page = results
+        return results
+
+    def paginate_nested(self, queryset, base_url, page_size):
+        """
+        The first ``page_size`` rows of ``queryset`` for embedding in a parent
+        resource, plus a link to the next page of the sub-resource at
+        ``base_url`` (``None`` when there is no more).
+        """
+        self.base_url = replace_query_param(base_url, self.page_size_query_param, page_size)
+        fields = [name.lstrip('-') for name in self.ordering]
+        queryset = self.load_ordering_fields(queryset, fields)
+
+        results = list(queryset.order_by(*self.ordering)[:page_size + 1])
+        if len(results) <= page_size:
+            return results, None
+
+        results = results[:page_size]
+        return results, self.encode_cursor(self.get_position(results[-1], fields), reverse=False)
+
+    def get_paginated_response(self, data):
+        payload = {
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        }
+        if self.count is not None:
+            payload['count'] = self.count
+        return Response(payload)
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def wants_count(self, request):
+        value = request.query_params.get(self.count_query_param, '')
+        return value.lower() in ('1', 'true', 'yes')
+
+    def get_keyset_filter(self, fields, values, reverse):
+        """
+        Build ``(f1 > v1) OR (f1 = v1 AND f2 > v2) OR ...`` honouring the
+        direction of every ordering field.
+        """
+        predicate = Q()
+        for index, name in enumerate(self.ordering):
+            descending = name.startswith('-')
+            if reverse:
+                descending = not descending
+            lookup = 'lt' if descending else 'gt'
+
+            term = Q(**{f'{fields[index]}__{lookup}': values[index]})
+            for prefix_field, prefix_value in zip(fields[:index], values[:index]):
+                term &= Q(**{prefix_field: prefix_value})
+            predicate |= term
+        return predicate
+
+    def load_ordering_fields(self, queryset, fields):
+        """
+        Keep the cursor columns in a narrowed ``only()`` column list, so
+        building the cursor does not load deferred fields row by row.
+        """
+        names, defer = queryset.query.deferred_loading
+        if names and not defer:
+            queryset = queryset.only(*names, *fields)
+        return queryset
+
+    def get_position(self, instance, fields):
+        position = []
+        for name in fields:
+            field = instance._meta.get_field(name)
+            position.append(field.value_to_string(instance))
+        return position
+
+    def get_next_link(self):
+        if not self.has_next or self.last_position is None:
+            return None
+        return self.encode_cursor(self.last_position, reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if self.first_position is None:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.first_position, reverse=True)
+
+    def encode_cursor(self, position, reverse):
+        raw = json.dumps({'p': position, 'r': int(reverse)}, separators=(',', ':'))
+        encoded = base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii')
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            raw = base64.urlsafe_b64decode(encoded.encode('ascii')).decode('utf-8')
+            data = json.loads(raw)
+            position = data['p']
+            reverse = bool(data.get('r', 0))
+        except (TypeError, ValueError, KeyError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
+
+    @staticmethod
+    def flip(name):
+        return name[1:] if name.startswith('-') else f'-{name}'
+
+
+class ProjectKeysetPagination(KeysetPagination):
+    ordering = ('-created', '-id')
+
+
+class MemberKeysetPagination(KeysetPagination):
+    ordering = ('joined_date', 'id')
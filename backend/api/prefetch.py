@@ -0,0 +1,173 @@
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+from rest_framework import serializers
+
+
+class QueryPlan:
+    """
+    The ``select_related`` / ``prefetch_related`` / ``only`` sets a
+    serializer needs to render a queryset without per-row queries.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.select = set()
+        self.prefetch = {}
+        self.only = {model._meta.pk.name}
+        self.can_defer = True
+
+    def apply(self, queryset):
+        if self.select:
+            queryset = queryset.select_related(*sorted(self.select))
+        if self.prefetch:
+            lookups = [
+                Prefetch(lookup, queryset=related) if related is not None else lookup
+                for lookup, related in sorted(self.prefetch.items())
+            ]
+            queryset = queryset.prefetch_related(*lookups)
+        if self.can_defer:
+            queryset = queryset.only(*sorted(self.only))
+        return queryset
+
+
+def build_query_plan(serializer, model):
+    plan = QueryPlan(model)
+    _collect(serializer, model, '', plan)
+    return plan
+
+
+def _collect(serializer, model, prefix, plan):
+    method_sources = getattr(getattr(serializer, 'Meta', None), 'method_field_sources', {})
+
+    for field in serializer.fields.values():
+        if field.write_only:
+            continue
+
+        if isinstance(field, serializers.SerializerMethodField):
+            sources = method_sources.get(field.field_name)
+            if sources is None:
+                # Nothing tells us which columns the method reads.
+                plan.can_defer = False
+                continue
+            for source in sources:
+                _add_path(model, prefix, source.split('.'), plan)
+            continue
+
+        if field.source == '*':
+            plan.can_defer = False
+            continue
+
+        if isinstance(field, serializers.ListSerializer):
+            _add_nested_many(model, prefix, field, plan)
+        elif isinstance(field, serializers.BaseSerializer):
+            _add_nested_one(model, prefix, field, plan)
+        else:
+            _add_path(model, prefix, field.source_attrs, plan)
+
+
+def _add_path(model, prefix, bits, plan):
+    """
+    Walk a dotted source through forward relations, joining each hop with
+    ``select_related``; anything else along the way falls back to a prefetch.
+    """
+    for index, bit in enumerate(bits):
+        lookup = f'{prefix}{bit}'
+        try:
+            model_field = model._meta.get_field(bit)
+        except FieldDoesNotExist:
+            # A property or method: we cannot tell which columns it touches.
+            plan.can_defer = False
+            return
+
+        is_last = index == len(bits) - 1
+
+        if model_field.many_to_many or model_field.one_to_many:
+            plan.prefetch.setdefault(lookup, None)
+            plan.can_defer = False
+            return
+
+        if model_field.is_relation and model_field.concrete:
+            if is_last:
+                # Only the local foreign-key column is rendered.
+                plan.only.add(lookup)
+                return
+            plan.select.add(lookup)
+            model = model_field.related_model
+            prefix = f'{lookup}__'
+            continue
+
+        if model_field.is_relation:
+            # Reverse one-to-one.
+            if is_last:
+                plan.can_defer = False
+                return
+            plan.select.add(lookup)
+            model = model_field.related_model
+            prefix = f'{lookup}__'
+            continue
+
+        plan.only.add(lookup)
+        return
+
+
+def _add_nested_one(model, prefix, field, plan):
+    bits = field.source_attrs
+    try:
+        model_field = model._meta.get_field(bits[0])
+    except FieldDoesNotExist:
+        plan.can_defer = False
+        return
+
+    if len(bits) > 1 or not model_field.is_relation or model_field.many_to_many:
+        plan.can_defer = False
+        return
+
+    lookup = f'{prefix}{bits[0]}'
+    plan.select.add(lookup)
+    if model_field.concrete:
+        plan.only.add(lookup)
+    _collect(field, model_field.related_model, f'{lookup}__', plan)
+
+
+def _add_nested_many(model, prefix, field, plan):
+    bits = field.source_attrs
+    try:
+        model_field = model._meta.get_field(bits[0])
+    except FieldDoesNotExist:
+        plan.can_defer = False
+        return
+
+    related_model = model_field.related_model
+    if len(bits) > 1 or related_model is None:
+        plan.can_defer = False
+        return
+
+    child_plan = build_query_plan(field.child, related_model)
+    if model_field.one_to_many:
+        # The prefetch joins back through the child's foreign key.
+        child_plan.only.add(model_field.field.name)
+    else:
+        child_plan.can_defer = False
+
+    plan.prefetch[f'{prefix}{bits[0]}'] = child_plan.apply(related_model._default_manager.all())
+
+
+class QueryPlanMixin:
+    """
+    Serializer mixin that derives the queryset optimisations needed to render
+    its declared fields.
+
+    Related lookups reached through ``source`` (``creator.email``), nested
+    serializers and related fields are joined or prefetched automatically.
+    ``SerializerMethodField`` is opaque, so serializers list what each method
+    reads in ``Meta.method_field_sources``::
+
+        method_field_sources = {
+            'assignee_name': ['assignee.first_name', 'assignee.last_name'],
+        }
+    """
+
+    @classmethod
+    def setup_queryset(cls, queryset, context=None):
+        serializer = cls(context=context or {})
+        return build_query_plan(serializer, queryset.model).apply(queryset)
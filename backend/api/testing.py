@@ -0,0 +1,25 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+def assert_constant_query_count(make_request, page_sizes=(1, 10, 50)):
+    """
+    Call ``make_request(page_size)`` once per page size and fail unless every
+    call issued the same number of queries.
+
+    Returns the per-size counts so callers can also pin an absolute number::
+
+        counts = assert_constant_query_count(
+            lambda size: client.get(f'/api/tasks/?page_size={size}')
+        )
+    """
+    counts = {}
+    for page_size in page_sizes:
+        with CaptureQueriesContext(connection) as context:
+            make_request(page_size)
+        counts[page_size] = len(context.captured_queries)
+
+    if len(set(counts.values())) > 1:
+        details = ', '.join(f'{size}: {count}' for size, count in counts.items())
+        raise AssertionError(f"Query count grows with page size ({details})")
+    return counts
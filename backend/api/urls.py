@@ -2,22 +2,31 @@ from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 
 from apps.tasks.views import TaskViewSet, CommentListAPIView
-from apps.projects.views import ProjectViewSet
+from apps.projects.views import (
+    ProjectViewSet, ProjectMemberAPIView, ProjectTaskListAPIView, project_stats, project_activities,
+)
+from apps.jobs.views import JobViewSet
 
 
 router = DefaultRouter()
 router.register(r'tasks', TaskViewSet)
 router.register(r'projects', ProjectViewSet)
+router.register(r'jobs', JobViewSet)
 
 urlpatterns = [
     path('', include(router.urls)),
     path('tasks/<uuid:task_id>/comments/', CommentListAPIView.as_view(), name='task-comments'),
+    path('projects/<uuid:project_id>/stats/', project_stats, name='project-stats'),
+    path('projects/<uuid:project_id>/activities/', project_activities, name='project-activities'),
+    path('projects/<uuid:project_id>/members/', ProjectMemberAPIView.as_view(), name='project-members'),
+    path('projects/<uuid:project_id>/tasks/', ProjectTaskListAPIView.as_view(), name='project-tasks'),
 ]
 
-from apps.tasks.views import task_list, mark_task_complete
+from apps.tasks.views import task_list, mark_task_complete, download_export
 
 urlpatterns += [
     path('tasks/list/', task_list, name='tasks-list-alt'),
+    path('tasks/exports/<uuid:export_id>/', download_export, name='task-export-download'),
     path('tasks/<uuid:task_id>/complete/', mark_task_complete, name='complete-task'),
 ]
 
@@ -27,4 +36,45 @@ urlpatterns += [
     path('auth/login/', login_view, name='api-login'),
     path('auth/register/', register_view, name='api-register'),
     path('auth/refresh-token/', refresh_token_view, name='refresh-token'),
-]
\ No newline at end of file
+]
+from api.views import request_metrics
+
+urlpatterns += [
+    path('admin/request-metrics/', request_metrics, name='request-metrics'),
+]
+
+from apps.projects.feed import project_event_stream
+
+urlpatterns += [
+    path('projects/<uuid:project_id>/events/', project_event_stream, name='project-events'),
+]
+
+from apps.projects.sync import sync_changes
+
+urlpatterns += [
+    path('sync/', sync_changes, name='sync'),
+]
+
+from apps.projects.views import rebuild_project_stats
+
+urlpatterns += [
+    path('projects/<uuid:project_id>/stats/rebuild/', rebuild_project_stats, name='project-stats-rebuild'),
+]
+
+from apps.search.views import search_tasks
+
+urlpatterns += [
+    path('search/', search_tasks, name='search'),
+]
+
+from apps.tasks.uploads import (
+    start_upload, upload_session, upload_part, complete_upload, download_attachment,
+)
+
+urlpatterns += [
+    path('tasks/<uuid:task_id>/attachments/uploads/', start_upload, name='upload-start'),
+    path('uploads/<uuid:session_id>/', upload_session, name='upload-session'),
+    path('uploads/<uuid:session_id>/parts/<int:index>/', upload_part, name='upload-part'),
+    path('uploads/<uuid:session_id>/complete/', complete_upload, name='upload-complete'),
+    path('attachments/<uuid:attachment_id>/download/', download_attachment, name='attachment-download'),
+]
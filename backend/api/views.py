@@ -0,0 +1,19 @@
+from rest_framework import permissions
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
+
+from taskforge.audit import audit_log
+from taskforge.instrumentation import registry
+
+
+@api_view(['GET', 'DELETE'])
+@permission_classes([permissions.IsAdminUser])
+def request_metrics(request):
+    """
+    Per-endpoint latency histograms and query counts collected by
+    ``RequestMetricsMiddleware`` in this process, plus the audit log's
+    written/dropped row counters. ``DELETE`` resets the histograms.
+    """
+    if request.method == 'DELETE':
+        registry.reset()
+    return Response({**registry.snapshot(), 'audit': audit_log.stats()})
@@ -1,10 +1,15 @@
 import jwt
 import datetime
+import uuid
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.utils import timezone
 from rest_framework import authentication
 from rest_framework.exceptions import AuthenticationFailed
 
+from .revocation import revocation_store, token_id
+from .user_cache import user_cache
+
 User = get_user_model()
 
 class JWTAuthentication(authentication.BaseAuthentication):
@@ -18,7 +23,9 @@ class JWTAuthentication(authentication.BaseAuthentication):
         except IndexError:
             raise AuthenticationFailed('Invalid token format')
         
-        
+        return self.authenticate_credentials(token)
+    
+    def authenticate_credentials(self, token):
         try:
             payload = jwt.decode(
                 token, 
@@ -30,18 +37,31 @@ class JWTAuthentication(authentication.BaseAuthentication):
         except jwt.InvalidTokenError:
             raise AuthenticationFailed('Invalid token')
         
+        if revocation_store.is_revoked(token_id(payload, token)):
+            raise AuthenticationFailed('Token revoked')
         
-        try:
-            user = User.objects.get(id=payload['user_id'])
-        except User.DoesNotExist:
-            raise AuthenticationFailed('User not found')
         
-        if not user.is_active:
-            raise AuthenticationFailed('User inactive or deleted')
+        user = user_cache.get_user(payload['user_id'])
+        check_token_user(user, payload)
         
         return (user, token)
 
 
+def check_token_user(user, payload):
+    """
+    Reject tokens for missing or inactive users, and tokens issued before the
+    user's ``tokens_valid_after`` (set by a password change).
+    """
+    if user is None:
+        raise AuthenticationFailed('User not found')
+    
+    if not user.is_active:
+        raise AuthenticationFailed('User inactive or deleted')
+    
+    if user.tokens_valid_after and payload.get('iat', 0) < user.tokens_valid_after.timestamp():
+        raise AuthenticationFailed('Token revoked')
+
+
 def generate_jwt_token(user):
     """Generate a JWT token for a user."""
     expiration = datetime.datetime.utcnow() + datetime.timedelta(hours=24)
@@ -50,6 +70,7 @@ def generate_jwt_token(user):
         'user_id': str(user.id),
         'exp': expiration,
         'iat': datetime.datetime.utcnow(),
+        'jti': uuid.uuid4().hex,
         'email': user.email 
     }
     
@@ -72,6 +93,8 @@ def validate_token(token):
             settings.JWT_SECRET, 
             algorithms=[settings.JWT_ALGORITHM]
         )
+        if revocation_store.is_revoked(token_id(payload, token)):
+            return None
         return payload
     except jwt.ExpiredSignatureError:
         return None
@@ -80,30 +103,41 @@ def validate_token(token):
 
 
 def refresh_token(token):
-    """Refresh a JWT token."""
+    """
+    Refresh a JWT token.
+    
+    Tokens are accepted up to ``JWT_REFRESH_GRACE`` seconds after they
+    expire, and only if they would otherwise still authenticate: not revoked,
+    issued after the user's last password change, and for an active user.
+    """
     try:
         payload = jwt.decode(
             token, 
             settings.JWT_SECRET, 
             algorithms=[settings.JWT_ALGORITHM],
-            options={"verify_exp": False}
+            leeway=settings.JWT_REFRESH_GRACE
         )
-        
-        
-        try:
-            user = User.objects.get(id=payload['user_id'])
-        except User.DoesNotExist:
-            return None
-        
-        return generate_jwt_token(user)
     except jwt.InvalidTokenError:
         return None
+    
+    if revocation_store.is_revoked(token_id(payload, token)):
+        return None
+    
+    # Read the row directly rather than through user_cache so a password
+    # change or deactivation made by another worker is seen immediately.
+    user = User.objects.filter(id=payload.get('user_id')).first()
+    try:
+        check_token_user(user, payload)
+    except AuthenticationFailed:
+        return None
+    
+    return generate_jwt_token(user)
 
 
 def blacklist_token(token):
     """
     Blacklist a JWT token and log the user out.
-    This function is not complete and doesn't actually blacklist the token.
+    The token's ``jti`` is recorded in the revocation store until it expires.
     """
     try:
         payload = jwt.decode(
@@ -112,18 +146,16 @@ def blacklist_token(token):
             algorithms=[settings.JWT_ALGORITHM],
             options={"verify_exp": False}
         )
-        
-        print(f"Blacklisting token for user {payload['user_id']}")
-        
-        from .models import Token
-        Token.objects.create(
-            user_id=payload['user_id'],
-            token=token
-        )
-        
-        return True
-    except:
+    except jwt.InvalidTokenError:
         return False
+    
+    if 'exp' in payload:
+        expires_at = datetime.datetime.fromtimestamp(payload['exp'], tz=datetime.timezone.utc)
+    else:
+        expires_at = timezone.now() + datetime.timedelta(seconds=settings.JWT_EXPIRATION_DELTA)
+    
+    revocation_store.revoke(token_id(payload, token), payload['user_id'], expires_at)
+    return True
 
 
 def extract_user_id(token):
@@ -0,0 +1,182 @@
+import hashlib
+import io
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db.models import Q
+from PIL import Image, ImageOps
+
+from .user_cache import user_cache
+
+
+# (model label, image field); each has a ``<field>_variants`` JSON field.
+IMAGE_FIELDS = [
+    ('accounts.User', 'profile_picture'),
+    ('accounts.UserProfile', 'avatar'),
+]
+
+HASH_BLOCK_SIZE = 64 * 1024
+
+FORMAT_EXTENSIONS = {'WEBP': 'webp', 'JPEG': 'jpg', 'PNG': 'png'}
+
+
+def variant_sizes():
+    """``{name: pixels}`` of the square variants to generate."""
+    return getattr(settings, 'IMAGE_VARIANTS', {'small': 64, 'medium': 256, 'large': 512})
+
+
+def variants_field(field):
+    return f'{field}_variants'
+
+
+def hash_file(handle):
+    digest = hashlib.sha256()
+    handle.seek(0)
+    while True:
+        block = handle.read(HASH_BLOCK_SIZE)
+        if not block:
+            break
+        digest.update(block)
+    handle.seek(0)
+    return digest.hexdigest()
+
+
+def variant_name(digest, pixels):
+    """
+    Storage name of a variant. Names depend only on the source content and
+    the output settings, so identical uploads share variants and a variant
+    that exists never has to be rendered again.
+    """
+    image_format = getattr(settings, 'IMAGE_VARIANT_FORMAT', 'WEBP')
+    quality = getattr(settings, 'IMAGE_VARIANT_QUALITY', 80)
+    directory = getattr(settings, 'IMAGE_VARIANT_DIR', 'variants')
+    extension = FORMAT_EXTENSIONS.get(image_format, image_format.lower())
+    return f'{directory}/{digest[:2]}/{digest}-{pixels}q{quality}.{extension}'
+
+
+def render_variants(file, force=False):
+    """
+    Write the variants of an image file to the default storage and return
+    ``{'source': name, 'sha256': digest, <variant>: name, ...}``.
+
+    The source is decoded once, reduced while decoding where the format
+    allows it (JPEG draft mode), and each variant is center-cropped to a
+    square without upscaling. Variants already in storage are reused
+    unless ``force`` is set.
+    """
+    image_format = getattr(settings, 'IMAGE_VARIANT_FORMAT', 'WEBP')
+    quality = getattr(settings, 'IMAGE_VARIANT_QUALITY', 80)
+    sizes = variant_sizes()
+
+    file.open('rb')
+    try:
+        digest = hash_file(file)
+        names = {name: variant_name(digest, pixels) for name, pixels in sizes.items()}
+        missing = {
+            name: pixels for name, pixels in sizes.items()
+            if force or not default_storage.exists(names[name])
+        }
+
+        if missing:
+            with Image.open(file) as image:
+                largest = max(missing.values())
+                image.draft('RGB', (largest, largest))
+                image = ImageOps.exif_transpose(image)
+                has_alpha = image.mode in ('RGBA', 'LA') or 'transparency' in image.info
+                mode = 'RGBA' if has_alpha and image_format != 'JPEG' else 'RGB'
+                image = image.convert(mode)
+
+                for name, pixels in sorted(missing.items(), key=lambda item: -item[1]):
+                    side = min(pixels, *image.size)
+                    variant = ImageOps.fit(image, (side, side), Image.LANCZOS)
+                    buffer = io.BytesIO()
+                    variant.save(buffer, image_format, quality=quality, optimize=True)
+                    if force and default_storage.exists(names[name]):
+                        default_storage.delete(names[name])
+                    names[name] = default_storage.save(names[name], ContentFile(buffer.getvalue()))
+    finally:
+        file.close()
+
+    return {'source': file.name, 'sha256': digest, **names}
+
+
+def save_variants(model, pk, field, variants, source):
+    """
+    Store ``variants`` unless the image was replaced in the meantime.
+    Bypasses ``save()`` so no signal handler schedules another run.
+    """
+    unchanged = Q(**{field: source}) if source else Q(**{field: ''}) | Q(**{f'{field}__isnull': True})
+    updated = model.objects.filter(unchanged, pk=pk).update(**{variants_field(field): variants})
+    if model._meta.label == 'accounts.User':
+        user_cache.invalidate(pk)
+    return bool(updated)
+
+
+def refresh_variants(label, pk, field, force=False):
+    """
+    Bring the stored variants of ``label`` row ``pk`` in line with its
+    current image. Returns the variants, or ``None`` if the row is gone.
+    """
+    model = apps.get_model(label)
+    instance = model.objects.filter(pk=pk).only(model._meta.pk.name, field, variants_field(field)).first()
+    if instance is None:
+        return None
+
+    file = getattr(instance, field)
+    current = getattr(instance, variants_field(field))
+    if not file:
+        if current:
+            save_variants(model, pk, field, {}, None)
+        return {}
+    if not force and current.get('source') == file.name and all(name in current for name in variant_sizes()):
+        return current
+
+    variants = render_variants(file, force=force)
+    save_variants(model, pk, field, variants, file.name)
+    return variants
+
+
+def schedule_variants(instance, field):
+    """
+    Queue a job to render the variants when the image has changed since
+    they were last generated; clear them right away if it was removed.
+    """
+    from apps.jobs.registry import enqueue
+
+    file = getattr(instance, field)
+    current = getattr(instance, variants_field(field)) or {}
+    if not file:
+        if current:
+            setattr(instance, variants_field(field), {})
+            save_variants(type(instance), instance.pk, field, {}, None)
+        return None
+    if current.get('source') == file.name:
+        return None
+    return enqueue(
+        'accounts.image_variants', label=instance._meta.label, pk=str(instance.pk), field=field
+    )
+
+
+def variant_urls(instance, field, request=None):
+    """
+    ``{'original': url, <variant>: url, ...}`` for an image field, or
+    ``None`` without an image. Variants not generated yet point at the
+    original, so clients can always use the size they need.
+    """
+    file = getattr(instance, field)
+    if not file:
+        return None
+
+    def absolute(url):
+        return request.build_absolute_uri(url) if request is not None else url
+
+    original = absolute(file.url)
+    current = getattr(instance, variants_field(field)) or {}
+    fresh = current.get('source') == file.name
+    urls = {'original': original}
+    for name in variant_sizes():
+        stored = current.get(name) if fresh else None
+        urls[name] = absolute(default_storage.url(stored)) if stored else original
+    return urls
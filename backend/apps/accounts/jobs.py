@@ -0,0 +1,11 @@
+from apps.jobs.registry import register_job
+from .images import refresh_variants
+
+
+@register_job('accounts.image_variants')
+def render_image_variants(label, pk, field, force=False):
+    """Render the resized variants of an uploaded profile image."""
+    variants = refresh_variants(label, pk, field, force=force)
+    if variants is None:
+        return {"skipped": "deleted"}
+    return {"variants": sorted(name for name in variants if name not in ('source', 'sha256'))}
@@ -0,0 +1,45 @@
+import datetime
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.accounts.models import RevokedToken, Token
+
+
+class Command(BaseCommand):
+    help = "Delete revoked-token rows whose tokens have expired, in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=5000,
+            help="Rows deleted per statement.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        now = timezone.now()
+
+        revoked = self.delete_in_batches(
+            RevokedToken.objects.filter(expires_at__lte=now), batch_size
+        )
+
+        # Issued-token rows are no longer written; anything older than the
+        # token lifetime refers to a token that can no longer be used.
+        lifetime = datetime.timedelta(seconds=settings.JWT_EXPIRATION_DELTA)
+        legacy = self.delete_in_batches(
+            Token.objects.filter(created_at__lte=now - lifetime), batch_size
+        )
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Deleted {revoked} expired revocations and {legacy} legacy token rows"
+        ))
+
+    def delete_in_batches(self, queryset, batch_size):
+        total = 0
+        while True:
+            ids = list(queryset.order_by().values_list('pk', flat=True)[:batch_size])
+            if not ids:
+                return total
+            deleted, _ = queryset.model.objects.filter(pk__in=ids).delete()
+            total += deleted
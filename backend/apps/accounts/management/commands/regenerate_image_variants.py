@@ -0,0 +1,74 @@
+import multiprocessing
+import os
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from apps.accounts.images import IMAGE_FIELDS, refresh_variants
+
+
+def regenerate(item):
+    """Entry point of a pool process; returns ``(item, error)``."""
+    label, pk, field, force = item
+    try:
+        refresh_variants(label, pk, field, force=force)
+    except Exception as exc:
+        return item, f"{type(exc).__name__}: {exc}"
+    return item, None
+
+
+class Command(BaseCommand):
+    help = "Generate the resized variants of every profile picture and avatar, in parallel."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--processes', type=int, default=os.cpu_count() or 1,
+            help="Worker processes (default: one per CPU).",
+        )
+        parser.add_argument(
+            '--force', action='store_true',
+            help="Re-render variants that already exist, e.g. after changing IMAGE_VARIANT_QUALITY.",
+        )
+        parser.add_argument(
+            '--model', choices=[label for label, _ in IMAGE_FIELDS], action='append',
+            help="Only this model; can be repeated.",
+        )
+
+    def handle(self, *args, **options):
+        labels = set(options['model'] or [label for label, _ in IMAGE_FIELDS])
+        items = []
+        for label, field in IMAGE_FIELDS:
+            if label not in labels:
+                continue
+            model = apps.get_model(label)
+            pks = model.objects.exclude(**{f'{field}__isnull': True}).exclude(**{field: ''}).values_list(
+                'pk', flat=True
+            )
+            items.extend((label, str(pk), field, options['force']) for pk in pks.iterator())
+
+        if not items:
+            self.stdout.write("No images to process")
+            return
+
+        processes = max(1, min(options['processes'], len(items)))
+        self.stdout.write(f"Processing {len(items)} images with {processes} process(es)")
+
+        if processes == 1:
+            results = map(regenerate, items)
+            failures = [(item, error) for item, error in results if error]
+        else:
+            # Children must not inherit the parent's database connections.
+            connections.close_all()
+            with multiprocessing.get_context().Pool(processes) as pool:
+                failures = [
+                    (item, error)
+                    for item, error in pool.imap_unordered(regenerate, items, chunksize=8)
+                    if error
+                ]
+
+        for (label, pk, field, _), error in failures:
+            self.stderr.write(f"{label} {pk} {field}: {error}")
+        if failures:
+            raise CommandError(f"{len(failures)} of {len(items)} images failed")
+        self.stdout.write(self.style.SUCCESS(f"Generated variants for {len(items)} images"))
@@ -36,6 +36,9 @@ class User(AbstractBaseUser, PermissionsMixin):
     is_staff = models.BooleanField(default=False)
     date_joined = models.DateTimeField(default=timezone.now)
     profile_picture = models.ImageField(upload_to='profile_pics/', null=True, blank=True)
+    # Resized copies of profile_picture, see apps.accounts.images.
+    profile_picture_variants = models.JSONField(default=dict, blank=True)
+    tokens_valid_after = models.DateTimeField(null=True, blank=True)
     
     objects = UserManager()
     
@@ -73,6 +76,7 @@ class UserProfile(models.Model):
     bio = models.TextField(blank=True)
     phone_number = models.CharField(max_length=15, blank=True)
     avatar = models.ImageField(upload_to='avatars/', null=True, blank=True)
+    avatar_variants = models.JSONField(default=dict, blank=True)
     
     
     def is_complete(self):
@@ -89,3 +93,19 @@ class Token(models.Model):
     
     def __str__(self):
         return f"Token for {self.user.email}"
+
+
+class RevokedToken(models.Model):
+    """
+    A revoked JWT, identified by its ``jti`` claim.
+
+    Rows only matter until ``expires_at``; after that the token is rejected
+    as expired anyway and ``manage.py prune_revoked_tokens`` deletes them.
+    """
+    jti = models.CharField(max_length=64, unique=True)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='revoked_tokens')
+    expires_at = models.DateTimeField(db_index=True)
+    revoked_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    
+    def __str__(self):
+        return f"Revoked token {self.jti}"
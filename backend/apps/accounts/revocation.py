@@ -0,0 +1,112 @@
+import datetime
+import hashlib
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils import timezone
+
+from .models import RevokedToken
+
+
+def token_id(payload, token):
+    """
+    The revocation key for a token: its ``jti`` claim, or a digest of the
+    raw token for tokens issued before ``jti`` was added.
+    """
+    jti = payload.get('jti')
+    if jti:
+        return jti
+    return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+
+class RevocationStore:
+    """
+    Answers "is this token revoked?" without touching the database.
+
+    ``RevokedToken`` rows are the source of truth. With
+    ``TOKEN_REVOCATION_BACKEND`` set, each revocation is also written to that
+    shared cache with a timeout matching the token's expiry, and lookups are
+    a single cache ``get``. Otherwise every process keeps an in-memory set of
+    unexpired ids and pulls new rows every ``TOKEN_REVOCATION_SYNC_INTERVAL``
+    seconds, so a revocation made elsewhere takes effect within one interval.
+    """
+    key_prefix = 'revoked-jti:'
+    # Re-read a little history on each sync so rows committed out of order
+    # are not skipped.
+    sync_overlap = datetime.timedelta(seconds=60)
+
+    def __init__(self, backend=None, sync_interval=30):
+        self.backend = backend
+        self.sync_interval = sync_interval
+        self._revoked = {}
+        self._lock = threading.Lock()
+        self._synced_at = None
+        self._next_sync = 0
+
+    @property
+    def shared(self):
+        if self.backend is None:
+            return None
+        return caches[self.backend]
+
+    def is_revoked(self, jti):
+        shared = self.shared
+        if shared is not None:
+            return shared.get(self.key_prefix + jti) is not None
+
+        self._maybe_sync()
+        with self._lock:
+            expires_at = self._revoked.get(jti)
+        return expires_at is not None and expires_at > time.time()
+
+    def revoke(self, jti, user_id, expires_at):
+        RevokedToken.objects.bulk_create(
+            [RevokedToken(jti=jti, user_id=user_id, expires_at=expires_at)],
+            ignore_conflicts=True,
+        )
+        self._remember(jti, expires_at)
+
+    def clear(self):
+        with self._lock:
+            self._revoked.clear()
+            self._synced_at = None
+            self._next_sync = 0
+
+    def _remember(self, jti, expires_at):
+        with self._lock:
+            self._revoked[jti] = expires_at.timestamp()
+
+        shared = self.shared
+        if shared is not None:
+            timeout = max(int((expires_at - timezone.now()).total_seconds()), 1)
+            shared.set(self.key_prefix + jti, True, timeout)
+
+    def _maybe_sync(self):
+        if time.monotonic() < self._next_sync:
+            return
+
+        with self._lock:
+            if time.monotonic() < self._next_sync:
+                return
+            now = timezone.now()
+            rows = RevokedToken.objects.filter(expires_at__gt=now)
+            if self._synced_at is not None:
+                rows = rows.filter(revoked_at__gte=self._synced_at - self.sync_overlap)
+
+            for jti, expires_at in rows.values_list('jti', 'expires_at').iterator():
+                self._revoked[jti] = expires_at.timestamp()
+
+            cutoff = now.timestamp()
+            for jti in [jti for jti, expires in self._revoked.items() if expires <= cutoff]:
+                del self._revoked[jti]
+
+            self._synced_at = now
+            self._next_sync = time.monotonic() + self.sync_interval
+
+
+revocation_store = RevocationStore(
+    backend=getattr(settings, 'TOKEN_REVOCATION_BACKEND', None),
+    sync_interval=getattr(settings, 'TOKEN_REVOCATION_SYNC_INTERVAL', 30),
+)
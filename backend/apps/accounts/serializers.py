@@ -3,26 +3,53 @@ from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
 
+from .images import variant_urls
 from .models import UserProfile, Role
+from taskforge.instrumentation import TimedSerializerMixin
 
 User = get_user_model()
 
 
-class UserSerializer(serializers.ModelSerializer):
+class ImageVariantsField(serializers.Field):
+    """
+    Read-only URLs of an image field's original and resized variants
+    (``IMAGE_VARIANTS``), or ``None`` when there is no image.
+    """
+    
+    def __init__(self, image_field, **kwargs):
+        self.image_field = image_field
+        kwargs['source'] = '*'
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+    
+    def to_representation(self, instance):
+        return variant_urls(instance, self.image_field, self.context.get('request'))
+
+
+class UserSerializer(TimedSerializerMixin, serializers.ModelSerializer):
+    profile_picture_variants = ImageVariantsField('profile_picture')
+    
     class Meta:
         model = User
-        fields = ['id', 'email', 'first_name', 'last_name', 'is_active', 'date_joined']
-        read_only_fields = ['id', 'email', 'is_active', 'date_joined']
+        fields = [
+            'id', 'email', 'first_name', 'last_name', 'is_active', 'date_joined',
+            'profile_picture', 'profile_picture_variants',
+        ]
+        read_only_fields = ['id', 'email', 'is_active', 'date_joined', 'profile_picture']
 
 
-class UserProfileSerializer(serializers.ModelSerializer):
+class UserProfileSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     user_email = serializers.EmailField(source='user.email', read_only=True)
     first_name = serializers.CharField(source='user.first_name', required=False)
     last_name = serializers.CharField(source='user.last_name', required=False)
+    avatar_variants = ImageVariantsField('avatar')
     
     class Meta:
         model = UserProfile
-        fields = ['id', 'user', 'user_email', 'first_name', 'last_name', 'bio', 'phone_number', 'avatar']
+        fields = [
+            'id', 'user', 'user_email', 'first_name', 'last_name', 'bio', 'phone_number', 'avatar',
+            'avatar_variants',
+        ]
         read_only_fields = ['id', 'user', 'user_email']
     
     def update(self, instance, validated_data):
@@ -0,0 +1,26 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .images import schedule_variants
+from .models import User, UserProfile
+from .user_cache import user_cache
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_cached_user(sender, instance, **kwargs):
+    user_cache.invalidate(instance.pk)
+
+
+@receiver(post_save, sender=User)
+def schedule_profile_picture_variants(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or (update_fields is not None and 'profile_picture' not in update_fields):
+        return
+    schedule_variants(instance, 'profile_picture')
+
+
+@receiver(post_save, sender=UserProfile)
+def schedule_avatar_variants(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or (update_fields is not None and 'avatar' not in update_fields):
+        return
+    schedule_variants(instance, 'avatar')
@@ -0,0 +1,129 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db import router
+
+
+class UserCache:
+    """
+    Resolves user ids for the authentication path without a database
+    round-trip for recently seen users.
+
+    Lookups go to an in-process LRU first, then to an optional shared Django
+    cache (``AUTH_USER_CACHE_BACKEND``), then to the database. Entries hold
+    the user's field values rather than live model instances, so every
+    request gets its own ``User`` object.
+
+    Writes through ``User.save`` invalidate both tiers (see
+    ``apps.accounts.signals``). Other processes' local tiers are bounded by
+    ``AUTH_USER_CACHE_TTL``.
+    """
+    key_prefix = 'auth-user:'
+
+    def __init__(self, max_size=1024, ttl=60, backend=None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.backend = backend
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+
+    @property
+    def shared(self):
+        if self.backend is None:
+            return None
+        return caches[self.backend]
+
+    def get_user(self, user_id):
+        """Return a ``User`` for ``user_id``, or ``None`` if it does not exist."""
+        key = str(user_id)
+        values = self._get_local(key)
+        
+        if values is not None:
+            self._count('hits')
+        else:
+            shared = self.shared
+            if shared is not None:
+                values = shared.get(self.key_prefix + key)
+            
+            if values is not None:
+                self._count('shared_hits')
+            else:
+                self._count('misses')
+                values = self._load(user_id)
+                if values is None:
+                    return None
+                if shared is not None:
+                    shared.set(self.key_prefix + key, values, self.ttl)
+            
+            self._set_local(key, values)
+        
+        return self._build(values)
+
+    def invalidate(self, user_id):
+        key = str(user_id)
+        with self._lock:
+            self._entries.pop(key, None)
+        shared = self.shared
+        if shared is not None:
+            shared.delete(self.key_prefix + key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            size = len(self._entries)
+        return {
+            'hits': self.hits,
+            'shared_hits': self.shared_hits,
+            'misses': self.misses,
+            'size': size,
+        }
+
+    def _count(self, counter):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _get_local(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, values = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return values
+
+    def _set_local(self, key, values):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, values)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def _load(self, user_id):
+        User = get_user_model()
+        fields = [field.attname for field in User._meta.concrete_fields]
+        return User.objects.filter(id=user_id).values(*fields).first()
+
+    def _build(self, values):
+        User = get_user_model()
+        db = router.db_for_read(User)
+        return User.from_db(db, list(values), list(values.values()))
+
+
+user_cache = UserCache(
+    max_size=getattr(settings, 'AUTH_USER_CACHE_SIZE', 1024),
+    ttl=getattr(settings, 'AUTH_USER_CACHE_TTL', 60),
+    backend=getattr(settings, 'AUTH_USER_CACHE_BACKEND', None),
+)
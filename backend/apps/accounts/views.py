@@ -1,13 +1,15 @@
 from django.contrib.auth import authenticate, get_user_model
 from django.shortcuts import get_object_or_404
 from rest_framework import status, permissions
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, authentication_classes, permission_classes
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from .models import User, UserProfile, Token
+from django.utils import timezone
+
+from .models import User, UserProfile
 from .serializers import UserSerializer, UserProfileSerializer, LoginSerializer, RegisterSerializer
-from .authentication import generate_jwt_token, validate_token, refresh_token
+from .authentication import generate_jwt_token, refresh_token, blacklist_token
 
 User = get_user_model()
 
@@ -27,14 +29,9 @@ def login_view(request):
             
             token = generate_jwt_token(user)
             
-            Token.objects.create(
-                user=user,
-                token=token
-            )
-            
             return Response({
                 'token': token,
-                'user': UserSerializer(user).data
+                'user': UserSerializer(user, context={'request': request}).data
             })
         else:
             return Response({
@@ -62,23 +59,25 @@ def register_view(request):
         
         token = generate_jwt_token(user)
         
-        
-        Token.objects.create(
-            user=user,
-            token=token
-        )
-        
         return Response({
             'token': token,
-            'user': UserSerializer(user).data
+            'user': UserSerializer(user, context={'request': request}).data
         }, status=status.HTTP_201_CREATED)
     
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
 @api_view(['POST'])
+@authentication_classes([])
+@permission_classes([permissions.AllowAny])
 def refresh_token_view(request):
-    """Refresh a JWT token."""
+    """
+    Refresh a JWT token.
+    
+    The token is checked by ``refresh_token`` rather than by the default
+    authentication, so one that expired within ``JWT_REFRESH_GRACE`` can
+    still be exchanged.
+    """
     
     auth_header = request.headers.get('Authorization')
     if not auth_header:
@@ -94,30 +93,11 @@ def refresh_token_view(request):
         }, status=status.HTTP_401_UNAUTHORIZED)
     
     
-    payload = validate_token(token)
-    if not payload:
-        return Response({
-            'error': 'Invalid or expired token'
-        }, status=status.HTTP_401_UNAUTHORIZED)
-    
-    
     new_token = refresh_token(token)
     if not new_token:
         return Response({
-            'error': 'Failed to refresh token'
-        }, status=status.HTTP_400_BAD_REQUEST)
-    
-    
-    try:
-        user = User.objects.get(id=payload['user_id'])
-        Token.objects.create(
-            user=user,
-            token=new_token
-        )
-    except User.DoesNotExist:
-        return Response({
-            'error': 'User not found'
-        }, status=status.HTTP_404_NOT_FOUND)
+            'error': 'Invalid or expired token'
+        }, status=status.HTTP_401_UNAUTHORIZED)
     
     return Response({
         'token': new_token
@@ -137,7 +117,7 @@ class UserProfileAPIView(APIView):
             profile = UserProfile.objects.create(user=request.user)
         
         
-        serializer = UserProfileSerializer(profile)
+        serializer = UserProfileSerializer(profile, context={'request': request})
         return Response(serializer.data)
     
     def patch(self, request):
@@ -149,7 +129,9 @@ class UserProfileAPIView(APIView):
             profile = UserProfile.objects.create(user=request.user)
         
         
-        serializer = UserProfileSerializer(profile, data=request.data, partial=True)
+        serializer = UserProfileSerializer(
+            profile, data=request.data, partial=True, context={'request': request}
+        )
         if serializer.is_valid():
             serializer.save()
             
@@ -178,7 +160,7 @@ class UserAPIView(APIView):
             
             user = request.user
         
-        serializer = UserSerializer(user)
+        serializer = UserSerializer(user, context={'request': request})
         return Response(serializer.data)
     
     def patch(self, request, user_id=None):
@@ -189,7 +171,9 @@ class UserAPIView(APIView):
                 'error': 'You cannot update other users'
             }, status=status.HTTP_403_FORBIDDEN)
         
-        serializer = UserSerializer(request.user, data=request.data, partial=True)
+        serializer = UserSerializer(
+            request.user, data=request.data, partial=True, context={'request': request}
+        )
         if serializer.is_valid():
             serializer.save()
             return Response(serializer.data)
@@ -215,7 +199,7 @@ def logout_view(request):
         }, status=status.HTTP_401_UNAUTHORIZED)
     
     
-    Token.objects.filter(token=token).delete()
+    blacklist_token(token)
     
     return Response({
         'message': 'Logged out successfully'
@@ -250,19 +234,13 @@ def change_password(request):
     
     
     user.set_password(new_password)
+    # Rejects every token issued before now; `iat` has one-second resolution.
+    user.tokens_valid_after = timezone.now().replace(microsecond=0)
     user.save()
     
-    Token.objects.filter(user=user).delete()
-    
     
     token = generate_jwt_token(user)
     
-    
-    Token.objects.create(
-        user=user,
-        token=token
-    )
-    
     return Response({
         'token': token,
         'message': 'Password changed successfully'
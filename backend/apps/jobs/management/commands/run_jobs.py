@@ -0,0 +1,75 @@
+import multiprocessing
+import signal
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from apps.jobs.worker import Worker
+
+
+def run_worker(threads, poll_interval, once):
+    """Entry point of a worker process."""
+    django.setup()
+    worker = Worker(threads=threads, poll_interval=poll_interval)
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(signum, lambda *args: worker.stop())
+    worker.run(once=once)
+
+
+class Command(BaseCommand):
+    help = "Run queued background jobs until stopped with SIGTERM or Ctrl+C."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--threads', type=int, default=getattr(settings, 'JOB_WORKER_THREADS', 2),
+            help="Worker threads per process.",
+        )
+        parser.add_argument(
+            '--processes', type=int, default=getattr(settings, 'JOB_WORKER_PROCESSES', 1),
+            help="Worker processes; more than one forks children that each run --threads threads.",
+        )
+        parser.add_argument(
+            '--poll-interval', type=float, default=getattr(settings, 'JOB_POLL_INTERVAL', 1.0),
+            help="Seconds an idle worker waits before checking the queue again.",
+        )
+        parser.add_argument(
+            '--once', action='store_true',
+            help="Exit once no job is due instead of waiting for more.",
+        )
+
+    def handle(self, *args, **options):
+        threads = max(1, options['threads'])
+        processes = max(1, options['processes'])
+        poll_interval = options['poll_interval']
+        once = options['once']
+
+        self.stdout.write(
+            f"Running jobs with {processes} process(es) x {threads} thread(s)"
+        )
+        if processes == 1:
+            run_worker(threads, poll_interval, once)
+            return
+
+        # Children must not inherit the parent's database connections.
+        connections.close_all()
+        context = multiprocessing.get_context()
+        children = [
+            context.Process(target=run_worker, args=(threads, poll_interval, once), daemon=False)
+            for _ in range(processes)
+        ]
+        for child in children:
+            child.start()
+
+        def forward(signum, frame):
+            for child in children:
+                if child.is_alive():
+                    child.terminate()
+
+        signal.signal(signal.SIGTERM, forward)
+        signal.signal(signal.SIGINT, forward)
+        for child in children:
+            child.join()
+
+        self.stdout.write(self.style.SUCCESS("Job workers stopped"))
@@ -0,0 +1,52 @@
+import datetime
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.module_loading import autodiscover_modules
+
+from .models import Job
+
+
+JOB_HANDLERS = {}
+
+
+def register_job(name, max_attempts=None):
+    """
+    Register ``func`` as the handler for jobs called ``name``.
+
+    Handlers live in each app's ``jobs`` module, take the job's ``kwargs``
+    as keyword arguments and return a JSON-serializable result. A job that
+    raises is retried with backoff, and one whose worker stops sending
+    heartbeats for ``JOB_TIMEOUT`` is handed to another worker, so handlers
+    must be safe to run twice.
+    """
+    def decorator(func):
+        func.job_name = name
+        func.max_attempts = max_attempts
+        JOB_HANDLERS[name] = func
+        return func
+    return decorator
+
+
+def load_jobs():
+    autodiscover_modules('jobs')
+    return JOB_HANDLERS
+
+
+def enqueue(name, user=None, delay=0, **kwargs):
+    """
+    Queue the job ``name`` and return its ``Job`` row. Inside a transaction
+    the row only becomes visible to workers once it commits.
+    """
+    handler = load_jobs().get(name)
+    if handler is None:
+        raise LookupError(f"No job registered as {name!r}")
+    
+    max_attempts = handler.max_attempts or getattr(settings, 'JOB_MAX_ATTEMPTS', 3)
+    return Job.objects.create(
+        name=name,
+        kwargs=kwargs,
+        max_attempts=max_attempts,
+        run_after=timezone.now() + datetime.timedelta(seconds=delay),
+        created_by=user,
+    )
@@ -0,0 +1,15 @@
+from rest_framework import serializers
+from .models import Job
+from taskforge.instrumentation import TimedSerializerMixin
+
+
+class JobSerializer(TimedSerializerMixin, serializers.ModelSerializer):
+    url = serializers.HyperlinkedIdentityField(view_name='job-detail')
+    
+    class Meta:
+        model = Job
+        fields = [
+            'id', 'url', 'name', 'status', 'attempts', 'max_attempts', 'result', 'error',
+            'created_at', 'run_after', 'finished_at',
+        ]
+        read_only_fields = fields
@@ -0,0 +1,39 @@
+from rest_framework import viewsets, status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from .models import Job
+from .serializers import JobSerializer
+from api.pagination import KeysetPagination
+
+
+def job_accepted(request, job):
+    """``202 Accepted`` pointing the client at the status of ``job``."""
+    serializer = JobSerializer(job, context={'request': request})
+    return Response(
+        serializer.data,
+        status=status.HTTP_202_ACCEPTED,
+        headers={'Location': serializer.data['url']},
+    )
+
+
+class JobViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    Status of background jobs started by the caller (every job for staff).
+    Poll the detail endpoint until ``status`` is ``SUCCEEDED`` or
+    ``FAILED``; ``result`` then holds what the job produced.
+    """
+    queryset = Job.objects.all()
+    serializer_class = JobSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = KeysetPagination
+    
+    def get_queryset(self):
+        queryset = Job.objects.all()
+        if not self.request.user.is_staff:
+            queryset = queryset.filter(created_by=self.request.user)
+        
+        job_status = self.request.query_params.get('status')
+        if job_status:
+            queryset = queryset.filter(status=job_status)
+        return queryset
@@ -0,0 +1,206 @@
+import datetime
+import logging
+import os
+import socket
+import threading
+import traceback
+
+from django.conf import settings
+from django.db import close_old_connections, connection
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Job
+from .registry import load_jobs
+
+
+logger = logging.getLogger('taskforge.jobs')
+
+CLAIM_CANDIDATES = 10
+
+
+def retry_delay(attempts):
+    """Seconds to wait before the next attempt: exponential, capped."""
+    base = getattr(settings, 'JOB_RETRY_BACKOFF', 30)
+    return min(base * 2 ** max(attempts - 1, 0), getattr(settings, 'JOB_RETRY_BACKOFF_MAX', 3600))
+
+
+def claim_next(worker_id):
+    """
+    Take the oldest due job, or return ``None`` if there is nothing to do.
+
+    Claiming is a conditional ``UPDATE ... WHERE status = 'QUEUED'``; the
+    worker that gets a row count of one owns the job, so no row locks or
+    ``SELECT ... FOR UPDATE SKIP LOCKED`` support is needed.
+    """
+    now = timezone.now()
+    candidates = list(
+        Job.objects.filter(status='QUEUED', run_after__lte=now)
+        .order_by('run_after')
+        .values_list('id', flat=True)[:CLAIM_CANDIDATES]
+    )
+    for job_id in candidates:
+        claimed = Job.objects.filter(id=job_id, status='QUEUED').update(
+            status='RUNNING',
+            locked_by=worker_id,
+            locked_at=now,
+            attempts=F('attempts') + 1,
+        )
+        if claimed:
+            return Job.objects.get(id=job_id)
+    return None
+
+
+def claimed(job):
+    """The job's row, as long as this worker's claim on it still stands."""
+    return Job.objects.filter(
+        id=job.id, status='RUNNING', locked_by=job.locked_by, attempts=job.attempts
+    )
+
+
+class Heartbeat(threading.Thread):
+    """
+    Bump ``locked_at`` on a running job every ``interval`` seconds, so
+    ``requeue_stale`` only hands back jobs whose worker has died, however
+    long they take.
+    """
+
+    def __init__(self, job, interval):
+        super().__init__(name=f'job-heartbeat-{job.id}', daemon=True)
+        self.job = job
+        self.interval = interval
+        self.stopped = threading.Event()
+
+    def run(self):
+        try:
+            while not self.stopped.wait(self.interval):
+                try:
+                    beating = claimed(self.job).update(locked_at=timezone.now())
+                except Exception:
+                    logger.exception("Could not record a heartbeat for job %s", self.job.id)
+                    continue
+                if not beating:
+                    logger.warning("Job %s is no longer held by %s", self.job.id, self.job.locked_by)
+                    return
+        finally:
+            connection.close()
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+
+
+def run_job(job):
+    """
+    Run a claimed job and record the outcome. A heartbeat keeps the claim
+    fresh while the handler runs. The final update is made conditional on
+    the claim, so a worker whose job was requeued as stale cannot overwrite
+    the newer attempt.
+    """
+    handler = load_jobs().get(job.name)
+    now = timezone.now
+    heartbeat = Heartbeat(job, getattr(settings, 'JOB_HEARTBEAT_INTERVAL', 30))
+    heartbeat.start()
+    try:
+        if handler is None:
+            raise LookupError(f"No job registered as {job.name!r}")
+        result = handler(**job.kwargs)
+    except Exception:
+        logger.exception("Job %s (%s) failed on attempt %d", job.id, job.name, job.attempts)
+        error = traceback.format_exc()[-10000:]
+        if handler is not None and job.attempts < job.max_attempts:
+            updates = {
+                'status': 'QUEUED',
+                'run_after': now() + datetime.timedelta(seconds=retry_delay(job.attempts)),
+                'locked_by': '',
+                'locked_at': None,
+                'error': error,
+            }
+        else:
+            updates = {'status': 'FAILED', 'finished_at': now(), 'error': error}
+    else:
+        updates = {'status': 'SUCCEEDED', 'finished_at': now(), 'result': result, 'error': ''}
+    finally:
+        heartbeat.stop()
+    
+    claimed(job).update(**updates)
+    for field, value in updates.items():
+        setattr(job, field, value)
+    return job
+
+
+def requeue_stale(timeout=None):
+    """
+    Hand back jobs whose heartbeat is more than ``timeout`` seconds old,
+    i.e. whose worker was killed or lost its database connection. Returns
+    the number of jobs requeued or failed.
+    """
+    timeout = timeout if timeout is not None else getattr(settings, 'JOB_TIMEOUT', 600)
+    now = timezone.now()
+    stale = Job.objects.filter(
+        status='RUNNING', locked_at__lt=now - datetime.timedelta(seconds=timeout)
+    )
+    failed = stale.filter(attempts__gte=F('max_attempts')).update(
+        status='FAILED', finished_at=now, error="Timed out"
+    )
+    requeued = stale.update(status='QUEUED', locked_by='', locked_at=None, run_after=now)
+    return failed + requeued
+
+
+class Worker:
+    """
+    Poll for jobs on ``threads`` threads until ``stop()`` is called, or,
+    with ``once``, until the queue has nothing due. A job that is running
+    when the worker is stopped is finished first.
+    """
+
+    def __init__(self, threads=1, poll_interval=1.0, name=None):
+        self.threads = threads
+        self.poll_interval = poll_interval
+        self.name = name or f'{socket.gethostname()}:{os.getpid()}'
+        self.stopping = threading.Event()
+
+    def stop(self):
+        self.stopping.set()
+
+    def run(self, once=False):
+        load_jobs()
+        threads = [
+            threading.Thread(
+                target=self._loop, args=(f'{self.name}:{index}', once),
+                name=f'job-worker-{index}', daemon=True,
+            )
+            for index in range(self.threads)
+        ]
+        for thread in threads:
+            thread.start()
+        
+        # The main thread stays free for signal handlers and stale-job sweeps.
+        while any(thread.is_alive() for thread in threads):
+            close_old_connections()
+            try:
+                requeued = requeue_stale()
+            except Exception:
+                logger.exception("Could not requeue stale jobs")
+            else:
+                if requeued:
+                    logger.warning("Requeued %d stale jobs", requeued)
+            for thread in threads:
+                thread.join(self.poll_interval)
+        connection.close()
+
+    def _loop(self, worker_id, once):
+        try:
+            while not self.stopping.is_set():
+                close_old_connections()
+                job = claim_next(worker_id)
+                if job is None:
+                    if once:
+                        return
+                    self.stopping.wait(self.poll_interval)
+                    continue
+                
+                logger.info("Running job %s (%s)", job.id, job.name)
+                run_job(job)
+        finally:
+            connection.close()
@@ -0,0 +1,160 @@
+import asyncio
+import datetime
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.db.models import Max
+from django.utils import timezone
+
+from taskforge.pubsub import InProcessBroker, Subscription
+from .models import FeedEvent
+
+
+logger = logging.getLogger('taskforge.events')
+
+# Id ranges wider than this are not tracked as gaps (e.g. after an
+# auto-increment jump); rows in them that commit late are missed.
+MAX_GAP = 1000
+
+
+class DatabaseBroker(InProcessBroker):
+    """
+    Relays events between processes through the ``FeedEvent`` table.
+
+    ``publish`` inserts a row from whichever process made the change (web
+    workers, ``run_jobs``, ``sweep_overdue_tasks``). Every process with
+    subscribers runs one thread that reads new rows every
+    ``EVENT_POLL_INTERVAL`` seconds and fans them out to its subscribers,
+    so events arrive within one interval. The row id is the event id, and
+    a reconnecting client can resume after any id still kept
+    (``EVENT_RETENTION`` seconds, at most ``history`` events).
+
+    Ids are allocated before the insert commits, so a row can become
+    visible after one with a higher id. Skipped ids are re-read for
+    ``gap_timeout`` seconds before they are given up on.
+    """
+    batch_size = 1000
+    gap_timeout = 5.0
+    prune_interval = 60.0
+
+    def __init__(self, history=500, max_pending=1000):
+        super().__init__(history=history, max_pending=max_pending)
+        self.history = history
+        self.poll_interval = getattr(settings, 'EVENT_POLL_INTERVAL', 1.0)
+        self.retention = datetime.timedelta(seconds=getattr(settings, 'EVENT_RETENTION', 3600))
+        self._poller = None
+        self._resuming = []
+        self._high = None
+        self._gaps = {}
+        self._next_prune = 0
+
+    def publish(self, channel, event):
+        return self.publish_many([(channel, event)])[0]
+
+    def publish_many(self, events):
+        rows = [FeedEvent(channel=channel, data=event) for channel, event in events]
+        if len(rows) == 1:
+            rows[0].save()
+        else:
+            FeedEvent.objects.bulk_create(rows, batch_size=500)
+        self._maybe_prune()
+        return [{'id': row.pk, **row.data} for row in rows]
+
+    def _maybe_prune(self):
+        now = time.monotonic()
+        if now < self._next_prune:
+            return
+        self._next_prune = now + self.prune_interval
+        FeedEvent.objects.filter(created_at__lt=timezone.now() - self.retention).delete()
+
+    def subscribe(self, channel, last_event_id=None):
+        """
+        Subscribe the running event loop to ``channel``. Events after
+        ``last_event_id`` are read back by the polling thread and queued
+        before new ones, so this never touches the database itself.
+        """
+        subscription = Subscription(self, channel, asyncio.get_running_loop(), self.max_pending)
+        with self._lock:
+            self._subscribers[channel].add(subscription)
+            if last_event_id is not None:
+                self._resuming.append((subscription, last_event_id))
+            if self._poller is None:
+                self._poller = threading.Thread(
+                    target=self._poll_forever, name='event-broker-poller', daemon=True
+                )
+                self._poller.start()
+        return subscription
+
+    def _poll_forever(self):
+        while True:
+            try:
+                close_old_connections()
+                self.poll()
+            except Exception:
+                logger.exception("Could not read feed events")
+            time.sleep(self.poll_interval)
+
+    def poll(self):
+        """Deliver rows committed since the last poll to local subscribers."""
+        with self._lock:
+            channels = set(self._subscribers)
+            resuming, self._resuming = self._resuming, []
+        if not channels:
+            # Nothing to deliver to; start from the newest row again once a
+            # client subscribes.
+            self._high = None
+            self._gaps.clear()
+            return
+
+        if self._high is None:
+            self._high = FeedEvent.objects.aggregate(high=Max('id'))['high'] or 0
+
+        for subscription, after in resuming:
+            self._replay(subscription, after)
+
+        now = time.monotonic()
+        late = []
+        if self._gaps:
+            late = list(FeedEvent.objects.filter(id__in=list(self._gaps)).values_list('id', 'channel'))
+        new = list(
+            FeedEvent.objects.filter(id__gt=self._high).order_by('id')
+            .values_list('id', 'channel')[:self.batch_size]
+        )
+
+        for event_id, _ in late:
+            del self._gaps[event_id]
+        expected = self._high + 1
+        for event_id, _ in new:
+            if event_id - expected <= MAX_GAP:
+                for missing in range(expected, event_id):
+                    self._gaps[missing] = now
+            expected = event_id + 1
+        if new:
+            self._high = new[-1][0]
+        self._gaps = {
+            event_id: seen for event_id, seen in self._gaps.items() if now - seen < self.gap_timeout
+        }
+
+        wanted = sorted(event_id for event_id, channel in late + new if channel in channels)
+        if wanted:
+            self._deliver(FeedEvent.objects.filter(id__in=wanted).order_by('id'))
+
+    def _replay(self, subscription, after):
+        rows = list(
+            FeedEvent.objects.filter(channel=subscription.channel, id__gt=after, id__lte=self._high)
+            .exclude(id__in=list(self._gaps))
+            .order_by('-id')[:self.history]
+        )
+        for row in reversed(rows):
+            subscription.deliver({'id': row.pk, **row.data})
+
+    def _deliver(self, rows):
+        for row in rows:
+            with self._lock:
+                subscribers = list(self._subscribers.get(row.channel, ()))
+            event = {'id': row.pk, **row.data}
+            for subscription in subscribers:
+                subscription.deliver(event)
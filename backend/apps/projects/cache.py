@@ -0,0 +1,117 @@
+import hashlib
+import math
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.utils.http import http_date, parse_etags, quote_etag
+from rest_framework import status
+from rest_framework.response import Response
+
+
+VERSION_PREFIX = 'project-version:'
+RESPONSE_PREFIX = 'project-response:'
+
+
+def get_cache():
+    """
+    The shared cache for project responses (``PROJECT_CACHE_BACKEND``), or
+    ``None`` to not cache them: invalidations only reach the cache they are
+    made in, so a per-process cache would serve other workers stale
+    responses (and ``304``s) until the TTL.
+    """
+    backend = getattr(settings, 'PROJECT_CACHE_BACKEND', None)
+    return caches[backend] if backend else None
+
+
+def get_ttl():
+    return getattr(settings, 'PROJECT_CACHE_TTL', 300)
+
+
+def current_version(key, cache=None, ttl=None):
+    """
+    The version stored under ``key``: the time of the last change seen.
+    A missing version is set to the current time, which orphans anything
+    cached under a version that has since been evicted. Versions expire
+    with the entries they guard, so a process that missed an invalidation
+    (a per-process cache) still converges within the TTL.
+    """
+    cache = cache or get_cache()
+    ttl = ttl or get_ttl()
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time(), ttl)
+        version = cache.get(key)
+    return version
+
+
+def bump_versions_on_commit(keys, cache=None, ttl=None):
+    """
+    Bump every version in ``keys`` once the current transaction commits,
+    so nothing cached under the new version can see the pre-commit state.
+    """
+    if keys:
+        transaction.on_commit(lambda: _bump_versions(keys, cache or get_cache(), ttl or get_ttl()))
+
+
+def _bump_versions(keys, cache, ttl):
+    now = time.time()
+    cache.set_many({key: now for key in keys}, ttl)
+
+
+def project_version(project_id):
+    """The project's current response cache version."""
+    return current_version(f'{VERSION_PREFIX}{project_id}')
+
+
+def invalidate_projects(project_ids):
+    """Invalidate the cached responses of every given project on commit."""
+    if get_cache() is None:
+        return
+    bump_versions_on_commit(
+        {f'{VERSION_PREFIX}{project_id}' for project_id in project_ids if project_id}
+    )
+
+
+def cached_project_response(request, kind, project_id, visibility, render):
+    """
+    Serve a per-project response from the cache, or ``304 Not Modified``
+    when the client's copy is current.
+
+    Entries are keyed by project, response ``kind``, the project version and
+    the caller's ``visibility`` (their role), so a change to anything the
+    response embeds only has to bump the version. ``render`` is called on a
+    miss and must return serializable data that does not depend on the
+    requesting user beyond ``visibility``. Without a project cache the
+    response is rendered on every request.
+    """
+    cache = get_cache()
+    if cache is None:
+        return Response(render())
+    
+    version = project_version(project_id)
+    digest = hashlib.sha1(f'{kind}:{project_id}:{version!r}:{visibility}'.encode()).hexdigest()
+    etag = quote_etag(digest)
+    # Informational only: HTTP dates have whole-second resolution, so a
+    # change in the same second as the client's copy would look unmodified.
+    # Conditional requests are answered from the ETag alone.
+    last_modified = math.ceil(version)
+
+    etags = parse_etags(request.META.get('HTTP_IF_NONE_MATCH', ''))
+    not_modified = '*' in etags or etag in etags or f'W/{etag}' in etags
+
+    if not_modified:
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        key = f'{RESPONSE_PREFIX}{digest}'
+        data = cache.get(key)
+        if data is None:
+            data = render()
+            cache.set(key, data, get_ttl())
+        response = Response(data)
+
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    response['Cache-Control'] = 'private, no-cache'
+    return response
@@ -0,0 +1,58 @@
+import contextvars
+
+from django.db import transaction
+
+from apps.search.models import Posting
+from apps.tasks.models import Task
+from .feed import publish_project_event
+from .models import Project
+
+
+_deleting_project = contextvars.ContextVar('deleting_project', default=None)
+
+
+def deleting_project():
+    """
+    Whether a ``delete_project`` is in progress here. Task and comment
+    ``post_delete`` handlers skip their per-row work (stats, tombstones,
+    feed events, cache and search updates) while it is: all of it concerns
+    the project being deleted, which is handled once.
+    """
+    return _deleting_project.get() is not None
+
+
+def delete_project(project_id, chunk_size=1000):
+    """
+    Delete a project with its tasks and everything under them, in one
+    transaction. Tasks go in chunks of ``chunk_size`` (a few statements
+    per chunk instead of several per task) together with their search
+    postings; the stats row, the memberships (whose tombstones tell sync
+    clients the project is gone) and the project itself follow. Returns
+    ``(deleted, by_model)`` like ``QuerySet.delete()``.
+    """
+    deleted = 0
+    by_model = {}
+
+    def tally(result):
+        nonlocal deleted
+        deleted += result[0]
+        for label, count in result[1].items():
+            by_model[label] = by_model.get(label, 0) + count
+
+    token = _deleting_project.set(project_id)
+    try:
+        with transaction.atomic():
+            while True:
+                ids = list(Task.objects.filter(project_id=project_id).values_list('id', flat=True)[:chunk_size])
+                if not ids:
+                    break
+                Posting.objects.filter(task_id__in=ids).delete()
+                tally(Task.objects.filter(id__in=ids).delete())
+
+            result = Project.objects.filter(id=project_id).delete()
+            tally(result)
+            if result[0]:
+                publish_project_event(project_id, 'project.deleted', {'id': project_id})
+    finally:
+        _deleting_project.reset(token)
+    return deleted, by_model
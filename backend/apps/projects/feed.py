@@ -0,0 +1,159 @@
+import json
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.http import JsonResponse, StreamingHttpResponse
+from django.utils import timezone
+from rest_framework.exceptions import AuthenticationFailed
+
+from apps.accounts.authentication import JWTAuthentication
+from taskforge.pubsub import get_broker
+from .permissions import load_memberships
+
+
+def channel_for(project_id):
+    return f'project:{project_id}'
+
+
+def publish_project_event(project_id, event_type, data):
+    """
+    Publish an event on the project's feed once the current transaction
+    commits, so subscribers never see a change that was rolled back.
+    """
+    publish_project_events([(project_id, event_type, data)])
+
+
+def publish_project_events(events):
+    """
+    ``publish_project_event`` for many ``(project_id, event_type, data)``
+    triples, handed to the broker in one call on commit.
+    """
+    now = timezone.now()
+    batch = [
+        (channel_for(project_id), {
+            'type': event_type,
+            'project': str(project_id),
+            'at': now,
+            'data': data,
+        })
+        for project_id, event_type, data in events
+    ]
+    if batch:
+        transaction.on_commit(lambda: get_broker().publish_many(batch))
+
+
+def task_event_data(task):
+    return {
+        'id': task.id,
+        'title': task.title,
+        'project': task.project_id,
+        'assignee': task.assignee_id,
+        'status': task.status,
+        'priority': task.priority,
+        'due_date': task.due_date,
+        'completed': task.completed,
+        'updated_at': task.updated_at,
+    }
+
+
+def comment_event_data(comment):
+    return {
+        'id': comment.id,
+        'task': comment.task_id,
+        'author': comment.author_id,
+        'content': comment.content,
+        'created_at': comment.created_at,
+    }
+
+
+def activity_event_data(activity):
+    return {
+        'id': activity.id,
+        'description': activity.description,
+        'performed_by': activity.performed_by_id,
+        'activity_date': activity.activity_date,
+    }
+
+
+def format_event(event):
+    data = json.dumps(event, cls=DjangoJSONEncoder)
+    return f"id: {event['id']}\nevent: {event['type']}\ndata: {data}\n\n"
+
+
+def authenticate_stream(request):
+    """
+    Resolve the user from the ``Authorization`` header or, since
+    ``EventSource`` cannot send headers, a ``?token=`` query parameter.
+    """
+    authentication = JWTAuthentication()
+    try:
+        result = authentication.authenticate(request)
+        if result is None and request.GET.get('token'):
+            result = authentication.authenticate_credentials(request.GET['token'])
+    except AuthenticationFailed:
+        return None
+    return result[0] if result else None
+
+
+def is_member(project_id, user):
+    return project_id in load_memberships(user.pk)
+
+
+async def stream_events(subscription):
+    keepalive = getattr(settings, 'EVENT_STREAM_KEEPALIVE', 15)
+    closes_at = time.monotonic() + getattr(settings, 'EVENT_STREAM_MAX_AGE', 300)
+    try:
+        yield "retry: 3000\n\n"
+        while time.monotonic() < closes_at:
+            if subscription.overflowed:
+                yield "event: resync\ndata: {}\n\n"
+                return
+
+            event = await subscription.get(timeout=min(keepalive, closes_at - time.monotonic()))
+            if event is None:
+                yield ": keepalive\n\n"
+            else:
+                yield format_event(event)
+    finally:
+        subscription.close()
+
+
+async def project_event_stream(request, project_id):
+    """
+    Server-sent events for a project's task, comment and activity changes.
+
+    Each event carries ``type`` (``task.created``, ``task.updated``,
+    ``task.deleted``, ``task.overdue``, ``comment.created``,
+    ``activity.created``, ``project.deleted``) and the changed fields, so
+    clients can patch their state instead of polling. Deleting a project
+    sends ``project.deleted`` alone, not an event per task.
+    Reconnecting clients send ``Last-Event-ID`` to replay what they missed.
+    Streams end after ``EVENT_STREAM_MAX_AGE`` seconds and ``EventSource``
+    reconnects on its own. Only served by the ASGI application.
+    """
+    if not isinstance(request, ASGIRequest):
+        return JsonResponse(
+            {"error": "The event stream is served by taskforge.asgi"}, status=501
+        )
+
+    user = await sync_to_async(authenticate_stream)(request)
+    if user is None:
+        return JsonResponse({"error": "Authentication required"}, status=401)
+    if not await sync_to_async(is_member)(project_id, user):
+        return JsonResponse({"error": "Not authorized"}, status=403)
+
+    last_event_id = request.headers.get('Last-Event-ID') or request.GET.get('last_event_id')
+    try:
+        last_event_id = int(last_event_id) if last_event_id else None
+    except ValueError:
+        last_event_id = None
+
+    subscription = get_broker().subscribe(channel_for(project_id), last_event_id)
+    response = StreamingHttpResponse(stream_events(subscription), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
@@ -0,0 +1,19 @@
+from taskforge.query_audit import register_hot_query, sample_value
+from .models import Project, ProjectMember, ProjectActivity
+
+
+@register_hot_query('projects.for_member')
+def projects_for_member():
+    user_id = sample_value(ProjectMember, 'user_id')
+    return Project.objects.filter(members=user_id)
+
+
+@register_hot_query('projects.keyset_page')
+def projects_keyset_page():
+    return Project.objects.order_by('-created', '-id')[:10]
+
+
+@register_hot_query('projects.activities')
+def project_activities():
+    project_id = sample_value(ProjectActivity, 'project_id')
+    return ProjectActivity.objects.filter(project_id=project_id).order_by('-activity_date')[:20]
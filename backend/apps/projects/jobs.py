@@ -0,0 +1,40 @@
+import uuid
+
+from django.db import transaction
+
+from apps.jobs.registry import register_job
+from taskforge.audit import audit_log
+from .deletion import delete_project
+from .models import Project, ProjectActivity
+from .stats import rebuild_project_stats
+
+
+@register_job('projects.archive')
+def archive_project(project_id, user_id):
+    with transaction.atomic():
+        project = Project.objects.select_for_update().filter(id=project_id).first()
+        if project is None:
+            return {"archived": False, "reason": "Project no longer exists"}
+        if project.is_archived:
+            return {"archived": True}
+        
+        project.archive()
+        audit_log.record(ProjectActivity(
+            project=project,
+            performed_by_id=user_id,
+            description="Project archived"
+        ))
+    return {"archived": True}
+
+
+@register_job('projects.rebuild_stats')
+def rebuild_stats(project_id):
+    # Job kwargs round-trip through JSON, so the id arrives as a string.
+    stats = rebuild_project_stats(uuid.UUID(str(project_id)))
+    return {"total_tasks": stats.total_tasks, "member_count": stats.member_count}
+
+
+@register_job('projects.delete', max_attempts=1)
+def delete_project_job(project_id):
+    deleted, by_model = delete_project(uuid.UUID(str(project_id)))
+    return {"deleted": deleted, "by_model": by_model}
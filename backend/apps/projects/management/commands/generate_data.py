@@ -0,0 +1,271 @@
+import datetime
+import random
+import time
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from apps.accounts.models import UserProfile
+from apps.projects.models import Project, ProjectMember, ProjectActivity
+from apps.tasks.models import Task, Comment, TaskHistory
+
+User = get_user_model()
+
+
+ROLES = ['ADMIN', 'MEMBER', 'MEMBER', 'MEMBER', 'VIEWER']
+
+TITLE_VERBS = ['Design', 'Implement', 'Review', 'Fix', 'Document', 'Test', 'Refactor', 'Deploy']
+TITLE_NOUNS = [
+    'homepage', 'login flow', 'API endpoint', 'dashboard', 'search', 'billing page',
+    'mobile layout', 'notification service', 'report export', 'onboarding',
+]
+COMMENT_TEXTS = [
+    "I've started working on this task.",
+    "Blocked on a dependency, will follow up.",
+    "Ready for review.",
+    "Left some feedback on the latest changes.",
+    "This is done on my side.",
+]
+
+
+def parse_weights(value):
+    """Parse ``KEY=WEIGHT,KEY=WEIGHT`` into a dict."""
+    weights = {}
+    for item in value.split(','):
+        key, _, weight = item.partition('=')
+        weights[key.strip()] = float(weight)
+    return weights
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a reproducible dataset of users, projects, memberships, tasks, "
+        "comments and task history using batched bulk inserts."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=3)
+        parser.add_argument('--projects', type=int, default=3)
+        parser.add_argument('--members-per-project', type=int, default=3,
+                            help="Members sampled into each project (capped at --users).")
+        parser.add_argument('--tasks', type=int, default=5, help="Total number of tasks.")
+        parser.add_argument('--comments-per-task', type=float, default=1.0,
+                            help="Mean number of comments per task.")
+        parser.add_argument('--history-per-task', type=float, default=1.0,
+                            help="Mean number of extra history rows per task.")
+        parser.add_argument('--status-weights', type=parse_weights,
+                            default='TODO=40,IN_PROGRESS=25,REVIEW=10,DONE=25')
+        parser.add_argument('--priority-weights', type=parse_weights,
+                            default='1=25,2=45,3=20,4=10')
+        parser.add_argument('--due-date-ratio', type=float, default=0.6,
+                            help="Fraction of tasks that get a due date.")
+        parser.add_argument('--unassigned-ratio', type=float, default=0.15)
+        parser.add_argument('--email-prefix', default='user',
+                            help="Generated users are <prefix><n>@example.com.")
+        parser.add_argument('--password', default='Password123!',
+                            help="Password for every generated user (hashed once).")
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--skip-stats', action='store_true',
+                            help="Do not rebuild ProjectStats afterwards.")
+        parser.add_argument('--skip-search-index', action='store_true',
+                            help="Do not rebuild the search index afterwards.")
+
+    def handle(self, *args, **options):
+        self.rng = random.Random(options['seed'])
+        self.batch_size = options['batch_size']
+        self.options = options
+        self.now = timezone.now()
+
+        if options['users'] < 1 or options['projects'] < 1:
+            raise CommandError("--users and --projects must be at least 1")
+
+        first_email = f"{options['email_prefix']}0@example.com"
+        if User.objects.filter(email=first_email).exists():
+            raise CommandError(
+                f"{first_email} already exists; pass a different --email-prefix"
+            )
+
+        started = time.monotonic()
+        user_ids = self.create_users()
+        members = self.create_projects(user_ids)
+        self.create_tasks(members)
+
+        if not options['skip_stats']:
+            call_command('rebuild_project_stats', stdout=self.stdout)
+        if not options['skip_search_index']:
+            call_command('rebuild_search_index', stdout=self.stdout)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Data generation complete in {time.monotonic() - started:.1f}s"
+        ))
+
+    def new_uuid(self):
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def choose(self, weights):
+        keys = list(weights)
+        return self.rng.choices(keys, weights=[weights[key] for key in keys])[0]
+
+    def count_around(self, mean):
+        """An integer with the given mean, spread uniformly over [0, 2*mean]."""
+        if mean <= 0:
+            return 0
+        upper = 2 * mean
+        value = int(upper)
+        return self.rng.randint(0, value) + (1 if self.rng.random() < upper - value else 0)
+
+    def flush(self, model, objects):
+        if objects:
+            model.objects.bulk_create(objects, batch_size=self.batch_size)
+            objects.clear()
+
+    def create_users(self):
+        count = self.options['users']
+        prefix = self.options['email_prefix']
+        password = make_password(self.options['password'])
+
+        user_ids = []
+        users = []
+        profiles = []
+        for n in range(count):
+            user = User(
+                id=self.new_uuid(),
+                email=f"{prefix}{n}@example.com",
+                first_name=f"User{n}",
+                last_name=self.rng.choice(['Smith', 'Doe', 'Garcia', 'Chen', 'Khan', 'Novak']),
+                password=password,
+                is_staff=n == 0,
+                is_superuser=n == 0,
+            )
+            users.append(user)
+            profiles.append(UserProfile(user=user))
+            user_ids.append(user.id)
+
+            if len(users) >= self.batch_size:
+                self.flush(User, users)
+                self.flush(UserProfile, profiles)
+
+        self.flush(User, users)
+        self.flush(UserProfile, profiles)
+        self.stdout.write(f"Created {count} users ({prefix}0@example.com is a superuser)")
+        return user_ids
+
+    def create_projects(self, user_ids):
+        count = self.options['projects']
+        per_project = min(self.options['members_per_project'], len(user_ids))
+
+        members = []
+        projects = []
+        memberships = []
+        activities = []
+        for n in range(count):
+            project = Project(
+                id=self.new_uuid(),
+                name=f"Project {n}",
+                description=f"Generated project {n}",
+                status=self.rng.choices([0, 1, 2, 3], weights=[70, 10, 15, 5])[0],
+            )
+            project_members = self.rng.sample(user_ids, per_project)
+            members.append((project.id, project_members))
+
+            projects.append(project)
+            for index, user_id in enumerate(project_members):
+                role = 'OWNER' if index == 0 else self.rng.choice(ROLES)
+                memberships.append(ProjectMember(project=project, user_id=user_id, role=role))
+            activities.append(ProjectActivity(
+                project=project,
+                performed_by_id=project_members[0],
+                description=f"Project created: {project.name}",
+            ))
+
+            if len(projects) >= self.batch_size:
+                self.flush(Project, projects)
+                self.flush(ProjectMember, memberships)
+                self.flush(ProjectActivity, activities)
+
+        self.flush(Project, projects)
+        self.flush(ProjectMember, memberships)
+        self.flush(ProjectActivity, activities)
+        self.stdout.write(f"Created {count} projects with {per_project} members each")
+        return members
+
+    def create_tasks(self, members):
+        options = self.options
+        total = options['tasks']
+
+        tasks = []
+        comments = []
+        history = []
+        created = 0
+        comment_count = 0
+        history_count = 0
+
+        for n in range(total):
+            project_id, project_members = self.rng.choice(members)
+            status = self.choose(options['status_weights'])
+
+            due_date = None
+            if self.rng.random() < options['due_date_ratio']:
+                due_date = self.now + datetime.timedelta(
+                    days=self.rng.randint(-30, 60), hours=self.rng.randint(0, 23)
+                )
+
+            assignee_id = None
+            if self.rng.random() >= options['unassigned_ratio']:
+                assignee_id = self.rng.choice(project_members)
+
+            creator_id = self.rng.choice(project_members)
+            task = Task(
+                id=self.new_uuid(),
+                title=f"{self.rng.choice(TITLE_VERBS)} {self.rng.choice(TITLE_NOUNS)} #{n}",
+                description="Generated task.",
+                project_id=project_id,
+                assignee_id=assignee_id,
+                creator_id=creator_id,
+                status=status,
+                priority=int(self.choose(options['priority_weights'])),
+                due_date=due_date,
+                completed=status == 'DONE',
+            )
+            task.overdue = task.compute_overdue(self.now)
+            tasks.append(task)
+
+            history.append(TaskHistory(task=task, user_id=creator_id, action=f"Created task: {task.title}"))
+            for _ in range(self.count_around(options['history_per_task'])):
+                history.append(TaskHistory(
+                    task=task,
+                    user_id=self.rng.choice(project_members),
+                    action=f"Updated task: status: TODO -> {status}",
+                ))
+
+            for _ in range(self.count_around(options['comments_per_task'])):
+                comments.append(Comment(
+                    id=self.new_uuid(),
+                    task=task,
+                    author_id=self.rng.choice(project_members),
+                    content=self.rng.choice(COMMENT_TEXTS),
+                ))
+
+            if len(tasks) >= self.batch_size:
+                created += len(tasks)
+                comment_count += len(comments)
+                history_count += len(history)
+                self.flush(Task, tasks)
+                self.flush(Comment, comments)
+                self.flush(TaskHistory, history)
+                self.stdout.write(f"  {created}/{total} tasks")
+
+        created += len(tasks)
+        comment_count += len(comments)
+        history_count += len(history)
+        self.flush(Task, tasks)
+        self.flush(Comment, comments)
+        self.flush(TaskHistory, history)
+        self.stdout.write(
+            f"Created {created} tasks, {comment_count} comments and {history_count} history rows"
+        )
@@ -0,0 +1,37 @@
+import datetime
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.projects.models import Tombstone
+
+
+class Command(BaseCommand):
+    help = "Delete sync tombstones older than SYNC_TOMBSTONE_RETENTION_DAYS, in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=5000,
+            help="Rows deleted per statement.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        retention = getattr(settings, 'SYNC_TOMBSTONE_RETENTION_DAYS', 30)
+        cutoff = timezone.now() - datetime.timedelta(days=retention)
+
+        total = 0
+        while True:
+            ids = list(
+                Tombstone.objects.filter(deleted_at__lt=cutoff)
+                .order_by().values_list('pk', flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+            deleted, _ = Tombstone.objects.filter(pk__in=ids).delete()
+            total += deleted
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Deleted {total} tombstones older than {retention} days"
+        ))
@@ -0,0 +1,73 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from apps.projects.models import Project, ProjectStats
+from apps.projects.stats import COUNTER_FIELDS, compute_project_stats
+
+
+class Command(BaseCommand):
+    help = "Recompute ProjectStats rows from the task and member tables and report drift."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check', action='store_true',
+            help="Only report drift; exit with an error if any row is stale.",
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=500,
+            help="Number of projects recomputed per query.",
+        )
+
+    def handle(self, *args, **options):
+        check_only = options['check']
+        batch_size = options['batch_size']
+
+        project_ids = list(Project.objects.order_by().values_list('id', flat=True))
+        drifted = 0
+        missing = 0
+
+        for start in range(0, len(project_ids), batch_size):
+            batch = project_ids[start:start + batch_size]
+            fresh = compute_project_stats(batch)
+            stored = ProjectStats.objects.in_bulk(batch)
+
+            to_create = []
+            to_update = []
+            for project_id in batch:
+                counters = fresh[project_id]
+                stats = stored.get(project_id)
+
+                if stats is None:
+                    missing += 1
+                    to_create.append(ProjectStats(project_id=project_id, **counters))
+                    continue
+
+                diff = {
+                    field: (getattr(stats, field), value)
+                    for field, value in counters.items()
+                    if getattr(stats, field) != value
+                }
+                if diff:
+                    drifted += 1
+                    details = ', '.join(
+                        f"{field} {old} -> {new}" for field, (old, new) in diff.items()
+                    )
+                    self.stdout.write(f"Drift in project {project_id}: {details}")
+                    for field, value in counters.items():
+                        setattr(stats, field, value)
+                    stats.updated_at = timezone.now()
+                    to_update.append(stats)
+
+            if not check_only:
+                with transaction.atomic():
+                    ProjectStats.objects.bulk_create(to_create)
+                    ProjectStats.objects.bulk_update(to_update, COUNTER_FIELDS + ['updated_at'])
+
+        summary = (
+            f"{len(project_ids)} projects checked, {drifted} drifted, {missing} missing"
+        )
+        if check_only and drifted:
+            raise CommandError(summary)
+
+        self.stdout.write(self.style.SUCCESS(summary))
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0003_project_stats'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='projectactivity',
+            index=models.Index(fields=['project', 'activity_date'], name='activity_project_date_idx'),
+        ),
+    ]
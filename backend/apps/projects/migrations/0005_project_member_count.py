@@ -0,0 +1,29 @@
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def fill_member_counts(apps, schema_editor):
+    ProjectStats = apps.get_model('projects', 'ProjectStats')
+    ProjectMember = apps.get_model('projects', 'ProjectMember')
+
+    counts = ProjectMember.objects.filter(project_id=OuterRef('project_id')).order_by().values(
+        'project_id'
+    ).annotate(count=Count('id')).values('count')
+    ProjectStats.objects.update(member_count=Coalesce(Subquery(counts), Value(0)))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0004_hot_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='projectstats',
+            name='member_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(fill_member_counts, migrations.RunPython.noop),
+    ]
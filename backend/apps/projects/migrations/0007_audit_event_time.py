@@ -0,0 +1,17 @@
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0006_tombstone'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='projectactivity',
+            name='activity_date',
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False),
+        ),
+    ]
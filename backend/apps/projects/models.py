@@ -1,5 +1,7 @@
 from django.db import models
 from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
 import uuid
 
 
@@ -53,6 +55,9 @@ class Project(models.Model):
     
     class Meta:
         ordering = ['-created']  
+        indexes = [
+            models.Index(fields=['created', 'id'], name='project_created_id_idx'),
+        ]
 
 
 
@@ -77,6 +82,9 @@ class ProjectMember(models.Model):
     
     class Meta:
         unique_together = ('project', 'user')
+        indexes = [
+            models.Index(fields=['joined_date', 'id'], name='member_joined_id_idx'),
+        ]
     
     def __str__(self):
         return f"{self.user.email} - {self.project.name} ({self.role})"
@@ -125,16 +133,48 @@ class ProjectActivity(models.Model):
     
     description = models.TextField()
     
-    activity_date = models.DateTimeField(auto_now_add=True)
+    # Set when the change happens, not when the audit writer inserts the row.
+    activity_date = models.DateTimeField(default=timezone.now, editable=False)
     
     class Meta:
         verbose_name_plural = 'Project activities'
+        indexes = [
+            models.Index(fields=['project', 'activity_date'], name='activity_project_date_idx'),
+        ]
     
     def __str__(self):
         return f"{self.project.name} - {self.description[:50]}"
 
 
 
+class Tombstone(models.Model):
+    """
+    Record of a deleted task, comment or membership, so sync clients can
+    drop their copy. ``project_id`` and ``user_id`` are plain columns
+    because the rows they point at may be gone too.
+    """
+    OBJECT_TYPES = [
+        ('task', 'Task'),
+        ('comment', 'Comment'),
+        ('member', 'Project member'),
+    ]
+    
+    object_type = models.CharField(max_length=20, choices=OBJECT_TYPES)
+    object_id = models.CharField(max_length=64)
+    project_id = models.UUIDField(db_index=True)
+    # Set for memberships, so a removed member learns they lost the project.
+    user_id = models.UUIDField(null=True, blank=True, db_index=True)
+    deleted_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['deleted_at', 'id'], name='tombstone_deleted_id_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.object_type} {self.object_id} deleted {self.deleted_at}"
+
+
 def get_projects_by_status(status_code):
     return Project.objects.filter(status=status_code)
 
@@ -142,14 +182,69 @@ def get_user_projects(user_id):
     return Project.objects.filter(members__id=user_id)
 
 def get_projects_with_overdue_tasks():
-    from django.utils import timezone
     from apps.tasks.models import Task
     
     
-    overdue_tasks = Task.objects.filter(
-        due_date__lt=timezone.now(),
-        status__in=['TODO', 'IN_PROGRESS']
+    project_ids = Task.objects.filter(overdue=True).values_list('project_id', flat=True).distinct()
+    return Project.objects.filter(id__in=project_ids)
+
+
+class ProjectStats(models.Model):
+    """
+    Rolled-up task and member counters for a project.
+
+    Rows are kept current by the ``Task`` and ``ProjectMember`` signal
+    handlers in ``apps.projects.signals`` and rebuilt by ``manage.py rebuild_project_stats``.
+    ``overdue_tasks`` counts ``Task.overdue`` flags, which the overdue sweep
+    (``manage.py sweep_overdue_tasks``) sets as due dates pass.
+    """
+    project = models.OneToOneField(
+        Project, on_delete=models.CASCADE, primary_key=True, related_name='stats'
     )
     
-    project_ids = overdue_tasks.values_list('project_id', flat=True).distinct()
-    return Project.objects.filter(id__in=project_ids)
\ No newline at end of file
+    total_tasks = models.IntegerField(default=0)
+    
+    todo_tasks = models.IntegerField(default=0)
+    in_progress_tasks = models.IntegerField(default=0)
+    review_tasks = models.IntegerField(default=0)
+    done_tasks = models.IntegerField(default=0)
+    
+    low_priority_tasks = models.IntegerField(default=0)
+    medium_priority_tasks = models.IntegerField(default=0)
+    high_priority_tasks = models.IntegerField(default=0)
+    urgent_priority_tasks = models.IntegerField(default=0)
+    
+    overdue_tasks = models.IntegerField(default=0)
+    
+    member_count = models.IntegerField(default=0)
+    
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        verbose_name_plural = 'Project stats'
+    
+    @property
+    def completion_rate(self):
+        return (self.done_tasks / self.total_tasks * 100) if self.total_tasks > 0 else 0
+    
+    def __str__(self):
+        return f"Stats for {self.project_id}"
+
+
+class FeedEvent(models.Model):
+    """
+    A project feed event, relayed between processes by
+    ``apps.projects.broker.DatabaseBroker``. The id is the event id clients
+    resume from; rows are deleted after ``EVENT_RETENTION`` seconds.
+    """
+    channel = models.CharField(max_length=100)
+    data = models.JSONField(encoder=DjangoJSONEncoder)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['channel', 'id'], name='feedevent_channel_id_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.channel} #{self.pk}"
@@ -0,0 +1,138 @@
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework import permissions
+from rest_framework.exceptions import NotFound
+
+from .cache import bump_versions_on_commit, current_version
+from .models import Project, ProjectMember
+
+
+MEMBERSHIP_VERSION_PREFIX = 'membership-version:'
+MEMBERSHIP_PREFIX = 'memberships:'
+
+ADMIN_ROLES = ('OWNER', 'ADMIN')
+
+
+def get_membership_cache():
+    """
+    The shared cache for role maps (``MEMBERSHIP_CACHE_BACKEND``), or
+    ``None``. Without one, every request reads its caller's memberships
+    from the database: a per-process cache would keep a removed member's
+    access alive in every process but the one that removed them.
+    """
+    backend = getattr(settings, 'MEMBERSHIP_CACHE_BACKEND', None)
+    return caches[backend] if backend else None
+
+
+def load_memberships(user_id):
+    """
+    ``{project_id: role}`` for every project the user belongs to.
+
+    With a membership cache configured, cached per user under a version
+    that ``invalidate_memberships`` bumps whenever one of the user's
+    memberships changes, so a role change or removal is seen by the next
+    request in every process.
+    """
+    cache = get_membership_cache()
+    if cache is None:
+        return fetch_memberships(user_id)
+
+    ttl = getattr(settings, 'MEMBERSHIP_CACHE_TTL', 300)
+    version = current_version(f'{MEMBERSHIP_VERSION_PREFIX}{user_id}', cache, ttl)
+    key = f'{MEMBERSHIP_PREFIX}{user_id}:{version!r}'
+    roles = cache.get(key)
+    if roles is None:
+        roles = fetch_memberships(user_id)
+        cache.set(key, roles, ttl)
+    return roles
+
+
+def fetch_memberships(user_id):
+    return dict(
+        ProjectMember.objects.filter(user_id=user_id).order_by()
+        .values_list('project_id', 'role')
+    )
+
+
+def invalidate_memberships(user_ids):
+    cache = get_membership_cache()
+    if cache is None:
+        return
+    bump_versions_on_commit(
+        {f'{MEMBERSHIP_VERSION_PREFIX}{user_id}' for user_id in user_ids if user_id},
+        cache,
+        getattr(settings, 'MEMBERSHIP_CACHE_TTL', 300),
+    )
+
+
+def project_roles(request):
+    """The caller's membership map, loaded at most once per request."""
+    request = getattr(request, '_request', request)
+    roles = getattr(request, '_project_roles', None)
+    if roles is None:
+        roles = load_memberships(request.user.pk)
+        request._project_roles = roles
+    return roles
+
+
+def member_project_ids(request):
+    return list(project_roles(request))
+
+
+def as_project_id(value):
+    if isinstance(value, uuid.UUID):
+        return value
+    try:
+        return uuid.UUID(str(value))
+    except ValueError:
+        return None
+
+
+def project_role(request, project_id):
+    """The caller's role in the project, or ``None`` if they are not a member."""
+    project_id = as_project_id(project_id)
+    return project_roles(request).get(project_id) if project_id else None
+
+
+class IsProjectMember(permissions.BasePermission):
+    """
+    Lets members of the project named in the URL (``project_id``, or ``pk``
+    on ``ProjectViewSet``) through, answering ``404`` when the project does
+    not exist and ``403`` when the caller is not a member. Subclasses set
+    ``write_roles`` to restrict unsafe methods to particular roles.
+    """
+    message = "You don't have permission to access this project"
+    write_roles = None
+
+    def has_permission(self, request, view):
+        project_id = view.kwargs.get('project_id')
+        if project_id is None and getattr(view, 'basename', None) == 'project':
+            project_id = view.kwargs.get('pk')
+        if project_id is None:
+            return True
+
+        role = project_role(request, project_id)
+        if role is None:
+            project_id = as_project_id(project_id)
+            if project_id is None or not Project.objects.filter(id=project_id).exists():
+                raise NotFound("Project not found")
+            return False
+
+        if self.write_roles and request.method not in permissions.SAFE_METHODS:
+            if role not in self.write_roles:
+                self.message = "Only project owners and admins can do this"
+                return False
+        return True
+
+    def has_object_permission(self, request, view, obj):
+        project_id = obj.pk if isinstance(obj, Project) else getattr(obj, 'project_id', None)
+        if project_id is None:
+            return True
+        return project_role(request, project_id) is not None
+
+
+class IsProjectAdmin(IsProjectMember):
+    """Members may read; only owners and admins may write."""
+    write_roles = ADMIN_ROLES
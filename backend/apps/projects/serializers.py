@@ -1,7 +1,14 @@
+from django.db import models
 from rest_framework import serializers
+from rest_framework.reverse import reverse
 from django.contrib.auth import get_user_model
-from .models import Project, ProjectMember, ProjectActivity, Milestone
+from .models import Project, ProjectMember, ProjectActivity, Milestone, ProjectStats
+from .stats import attach_project_stats, get_project_stats
 from apps.tasks.serializers import TaskSerializer
+from api.pagination import KeysetPagination, MemberKeysetPagination
+from api.fieldsets import SparseFieldsetMixin
+from api.prefetch import QueryPlanMixin
+from taskforge.instrumentation import TimedSerializerMixin
 
 User = get_user_model()
 
@@ -12,7 +19,7 @@ class UserMinimalSerializer(serializers.ModelSerializer):
         fields = ['id', 'email', 'first_name', 'last_name']
 
 
-class ProjectMemberSerializer(serializers.ModelSerializer):
+class ProjectMemberSerializer(TimedSerializerMixin, QueryPlanMixin, serializers.ModelSerializer):
     user = UserMinimalSerializer(read_only=True)
     user_id = serializers.UUIDField(write_only=True)
     
@@ -43,7 +50,7 @@ class ProjectMemberSerializer(serializers.ModelSerializer):
 
 
 
-class MilestoneSerializer(serializers.ModelSerializer):
+class MilestoneSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Milestone
         fields = ['id', 'title', 'description', 'due_date', 'completed_flag',
@@ -58,7 +65,17 @@ class MilestoneSerializer(serializers.ModelSerializer):
         return value
 
 
-class ProjectSerializer(serializers.ModelSerializer):
+class ProjectListSerializer(serializers.ListSerializer):
+    """Builds missing ``ProjectStats`` rows for the whole page at once."""
+    
+    def to_representation(self, data):
+        projects = list(data.all() if isinstance(data, models.Manager) else data)
+        if {'member_count', 'task_count'} & set(self.child.fields):
+            attach_project_stats(projects)
+        return super().to_representation(projects)
+
+
+class ProjectSerializer(TimedSerializerMixin, SparseFieldsetMixin, QueryPlanMixin, serializers.ModelSerializer):
     member_count = serializers.SerializerMethodField()
     task_count = serializers.SerializerMethodField()
     
@@ -67,12 +84,24 @@ class ProjectSerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'description', 'status', 'created', 'modified',
                  'is_archived', 'member_count', 'task_count']
         read_only_fields = ['id', 'created', 'modified']
+        list_serializer_class = ProjectListSerializer
+        method_field_sources = {
+            'member_count': ['stats.member_count'],
+            'task_count': ['stats.total_tasks'],
+        }
     
     def get_member_count(self, obj):
-        return obj.members.count()
+        return self.get_stats(obj).member_count
     
     def get_task_count(self, obj):
-        return obj.tasks.count()
+        return self.get_stats(obj).total_tasks
+    
+    def get_stats(self, obj):
+        try:
+            return obj.stats
+        except ProjectStats.DoesNotExist:
+            obj.stats = get_project_stats(obj.id)
+            return obj.stats
     
     def validate(self, data):
         if 'status' in data:
@@ -84,27 +113,87 @@ class ProjectSerializer(serializers.ModelSerializer):
         return data
 
 
-class ProjectDetailSerializer(serializers.ModelSerializer):
+class ProjectDetailSerializer(TimedSerializerMixin, QueryPlanMixin, serializers.ModelSerializer):
+    """
+    Project with its members, tasks and milestones.
+
+    Members and tasks are embedded in full unless the client opts in to
+    paging with ``?page_nested=true``: they then come back as
+    ``{"count", "results", "next"}`` holding the first ``nested_page_size``
+    items, and ``next`` continues through the ``/projects/{id}/members/``
+    and ``/projects/{id}/tasks/`` sub-resources. With paging on,
+    ``?expand=members,tasks`` still embeds the named collections in full.
+    """
     members = serializers.SerializerMethodField()
     tasks = serializers.SerializerMethodField()
     milestones = MilestoneSerializer(many=True, read_only=True)
     
+    nested_page_size = 20
+    expandable = ('members', 'tasks')
+    
     class Meta:
         model = Project
         fields = ['id', 'name', 'description', 'status', 'created', 'modified',
                  'is_archived', 'members', 'tasks', 'milestones']
         read_only_fields = ['id', 'created', 'modified']
     
+    @classmethod
+    def expanded_for(cls, request):
+        """The collections embedded in full for ``request``."""
+        if request is None or not wants_nested_pages(request):
+            return set(cls.expandable)
+        return parse_expand(request.query_params.get('expand', ''), cls.expandable)
+    
+    @property
+    def expand(self):
+        return self.expanded_for(self.context.get('request'))
+    
     def get_members(self, obj):
-        members = ProjectMember.objects.filter(project=obj)
-        return ProjectMemberSerializer(members, many=True).data
+        members = ProjectMemberSerializer.setup_queryset(
+            ProjectMember.objects.filter(project=obj)
+        )
+        if 'members' in self.expand:
+            return ProjectMemberSerializer(members, many=True).data
+        
+        return self.nested_page(
+            obj, members, ProjectMemberSerializer, MemberKeysetPagination,
+            'project-members', members.count(),
+        )
     
     def get_tasks(self, obj):
-        tasks = obj.tasks.all()
-        return TaskSerializer(tasks, many=True).data
+        tasks = TaskSerializer.setup_queryset(obj.tasks.all())
+        if 'tasks' in self.expand:
+            return TaskSerializer(tasks, many=True).data
+        
+        return self.nested_page(
+            obj, tasks, TaskSerializer, KeysetPagination,
+            'project-tasks', get_project_stats(obj.id).total_tasks,
+        )
+    
+    def nested_page(self, obj, queryset, serializer_class, pagination_class, url_name, count):
+        request = self.context.get('request')
+        base_url = reverse(url_name, kwargs={'project_id': obj.id}, request=request)
+        
+        results, next_link = pagination_class().paginate_nested(
+            queryset, base_url, self.nested_page_size
+        )
+        return {
+            'count': count,
+            'results': serializer_class(results, many=True).data,
+            'next': next_link,
+        }
 
 
-class ProjectActivitySerializer(serializers.ModelSerializer):
+def wants_nested_pages(request):
+    return request.query_params.get('page_nested', '').lower() in ('1', 'true', 'yes')
+
+
+def parse_expand(value, allowed):
+    """The recognised names in a comma-separated ``?expand=`` value."""
+    return {name.strip() for name in value.split(',')} & set(allowed)
+
+
+class ProjectActivitySerializer(TimedSerializerMixin, serializers.ModelSerializer):
     user_email = serializers.EmailField(source='performed_by.email', read_only=True)
     
     class Meta:
@@ -128,16 +217,12 @@ def get_project_with_stats(project_id):
         "is_archived": project.is_archived,
     }
     
-    from apps.tasks.models import Task
-    
-    tasks = Task.objects.filter(project=project)
-    total_tasks = tasks.count()
-    completed_tasks = tasks.filter(status='DONE').count()
+    stats = get_project_stats(project.id)
     
     project_data["task_stats"] = {
-        "total": total_tasks,
-        "completed": completed_tasks,
-        "completion_rate": (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
+        "total": stats.total_tasks,
+        "completed": stats.done_tasks,
+        "completion_rate": stats.completion_rate
     }
     
     return project_data
\ No newline at end of file
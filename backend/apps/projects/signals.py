@@ -0,0 +1,137 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from apps.tasks.models import Comment, Task
+from taskforge.audit import audit_flushed
+from .cache import get_cache, invalidate_projects
+from .deletion import deleting_project
+from .feed import activity_event_data, comment_event_data, publish_project_event, task_event_data
+from .models import Milestone, Project, ProjectActivity, ProjectMember, Tombstone
+from .permissions import invalidate_memberships
+from .stats import record_member_change, record_task_change, task_state
+from .sync import tombstone_moved_tasks
+
+User = get_user_model()
+
+
+@receiver(pre_save, sender=Task)
+def remember_task_state(sender, instance, raw=False, **kwargs):
+    instance._stats_previous_state = None
+    if raw or instance._state.adding:
+        return
+    
+    instance._stats_previous_state = Task.objects.filter(pk=instance.pk).values(
+        'project_id', 'status', 'priority', 'overdue'
+    ).first()
+
+
+@receiver(post_save, sender=Task)
+def update_stats_on_task_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    previous = getattr(instance, '_stats_previous_state', None)
+    record_task_change(previous, task_state(instance))
+    invalidate_projects([instance.project_id, previous and previous['project_id']])
+    
+    data = task_event_data(instance)
+    publish_project_event(instance.project_id, 'task.updated' if previous else 'task.created', data)
+    if previous and previous['project_id'] != instance.project_id:
+        publish_project_event(previous['project_id'], 'task.deleted', {'id': instance.pk})
+        tombstone_moved_tasks({instance.pk: previous['project_id']})
+
+
+@receiver(post_delete, sender=Task)
+def update_stats_on_task_delete(sender, instance, **kwargs):
+    if deleting_project():
+        return
+    record_task_change(task_state(instance), None)
+    invalidate_projects([instance.project_id])
+    publish_project_event(instance.project_id, 'task.deleted', {'id': instance.pk})
+    Tombstone.objects.create(
+        object_type='task', object_id=str(instance.pk), project_id=instance.project_id
+    )
+
+
+@receiver(post_save, sender=Comment)
+def publish_comment(sender, instance, created=False, raw=False, **kwargs):
+    if created and not raw:
+        publish_project_event(instance.task.project_id, 'comment.created', comment_event_data(instance))
+
+
+@receiver(post_delete, sender=Comment)
+def record_deleted_comment(sender, instance, **kwargs):
+    if deleting_project():
+        return
+    project_id = Task.objects.filter(pk=instance.task_id).values_list('project_id', flat=True).first()
+    if project_id is not None:
+        Tombstone.objects.create(
+            object_type='comment', object_id=str(instance.pk), project_id=project_id
+        )
+
+
+@receiver(post_save, sender=ProjectActivity)
+def publish_activity(sender, instance, created=False, raw=False, **kwargs):
+    if created and not raw:
+        publish_project_event(instance.project_id, 'activity.created', activity_event_data(instance))
+
+
+@receiver(audit_flushed, sender=ProjectActivity)
+def publish_flushed_activities(sender, instances, **kwargs):
+    for instance in instances:
+        publish_project_event(instance.project_id, 'activity.created', activity_event_data(instance))
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+def invalidate_project(sender, instance, raw=False, **kwargs):
+    if not raw:
+        invalidate_projects([instance.pk])
+
+
+@receiver(post_save, sender=ProjectMember)
+def count_added_member(sender, instance, created=False, raw=False, **kwargs):
+    if created and not raw:
+        record_member_change(instance.project_id, 1)
+
+
+@receiver(post_delete, sender=ProjectMember)
+def count_removed_member(sender, instance, **kwargs):
+    # The member tombstone is still needed: it tells sync clients the project is gone.
+    if not deleting_project():
+        record_member_change(instance.project_id, -1)
+    Tombstone.objects.create(
+        object_type='member', object_id=str(instance.pk),
+        project_id=instance.project_id, user_id=instance.user_id,
+    )
+
+
+@receiver(post_save, sender=ProjectMember)
+@receiver(post_delete, sender=ProjectMember)
+def invalidate_member_roles(sender, instance, raw=False, **kwargs):
+    if not raw:
+        invalidate_memberships([instance.user_id])
+
+
+@receiver(post_save, sender=ProjectMember)
+@receiver(post_delete, sender=ProjectMember)
+@receiver(post_save, sender=Milestone)
+@receiver(post_delete, sender=Milestone)
+def invalidate_project_of(sender, instance, raw=False, **kwargs):
+    if not raw:
+        invalidate_projects([instance.project_id])
+
+
+@receiver(post_save, sender=User)
+def invalidate_projects_of_user(sender, instance, created=False, raw=False, update_fields=None,
+                                **kwargs):
+    """Project responses embed member and assignee names and emails."""
+    if raw or created or update_fields == frozenset(['last_login']) or get_cache() is None:
+        return
+    project_ids = set(
+        ProjectMember.objects.filter(user=instance).values_list('project_id', flat=True)
+    )
+    project_ids |= set(
+        Task.objects.filter(assignee=instance).values_list('project_id', flat=True).distinct()
+    )
+    invalidate_projects(project_ids)
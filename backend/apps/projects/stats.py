@@ -0,0 +1,165 @@
+from collections import Counter, defaultdict
+
+from django.db.models import Count, F, Q
+from django.utils import timezone
+
+from .models import ProjectMember, ProjectStats
+
+
+STATUS_FIELDS = {
+    'TODO': 'todo_tasks',
+    'IN_PROGRESS': 'in_progress_tasks',
+    'REVIEW': 'review_tasks',
+    'DONE': 'done_tasks',
+}
+
+PRIORITY_FIELDS = {
+    1: 'low_priority_tasks',
+    2: 'medium_priority_tasks',
+    3: 'high_priority_tasks',
+    4: 'urgent_priority_tasks',
+}
+
+COUNTER_FIELDS = [
+    'total_tasks',
+    *STATUS_FIELDS.values(),
+    *PRIORITY_FIELDS.values(),
+    'overdue_tasks',
+    'member_count',
+]
+
+
+def task_state(task):
+    """The subset of a task that feeds the project counters."""
+    return {
+        'project_id': task.project_id,
+        'status': task.status,
+        'priority': task.priority,
+        'overdue': task.overdue,
+    }
+
+
+def _counters_for(state):
+    fields = ['total_tasks']
+    if state['status'] in STATUS_FIELDS:
+        fields.append(STATUS_FIELDS[state['status']])
+    if state['priority'] in PRIORITY_FIELDS:
+        fields.append(PRIORITY_FIELDS[state['priority']])
+    if state['overdue']:
+        fields.append('overdue_tasks')
+    return fields
+
+
+def record_task_change(old_state, new_state):
+    """
+    Move a task's contribution from ``old_state`` to ``new_state``.
+
+    Either side may be ``None`` for creates and deletes. Counters are
+    adjusted in place with ``F()`` expressions; projects without a stats
+    row are skipped and get built on first read instead.
+    """
+    record_task_changes([(old_state, new_state)])
+
+
+def record_task_changes(changes):
+    """
+    Apply many ``(old_state, new_state)`` pairs with one ``UPDATE`` per
+    affected project. Used by bulk writes, which bypass model signals.
+    """
+    now = timezone.now()
+    deltas = defaultdict(Counter)
+    
+    for old_state, new_state in changes:
+        if old_state is not None:
+            for field in _counters_for(old_state):
+                deltas[old_state['project_id']][field] -= 1
+        if new_state is not None:
+            for field in _counters_for(new_state):
+                deltas[new_state['project_id']][field] += 1
+    
+    for project_id, delta in deltas.items():
+        updates = {field: F(field) + value for field, value in delta.items() if value}
+        if updates:
+            ProjectStats.objects.filter(project_id=project_id).update(updated_at=now, **updates)
+
+
+def record_member_change(project_id, delta):
+    """Adjust a project's ``member_count`` by ``delta`` in place."""
+    ProjectStats.objects.filter(project_id=project_id).update(
+        member_count=F('member_count') + delta, updated_at=timezone.now()
+    )
+
+
+def compute_project_stats(project_ids=None):
+    """
+    Count every project's tasks and members from scratch with one grouped
+    query each.
+
+    Returns ``{project_id: {counter_field: value}}``.
+    """
+    from apps.tasks.models import Task
+    
+    tasks = Task.objects.order_by()
+    if project_ids is not None:
+        tasks = tasks.filter(project_id__in=project_ids)
+    
+    rows = tasks.values('project_id', 'status', 'priority').annotate(
+        count=Count('id'),
+        overdue=Count('id', filter=Q(overdue=True)),
+    )
+    
+    results = defaultdict(lambda: dict.fromkeys(COUNTER_FIELDS, 0))
+    for row in rows.iterator():
+        counters = results[row['project_id']]
+        counters['total_tasks'] += row['count']
+        counters['overdue_tasks'] += row['overdue']
+        if row['status'] in STATUS_FIELDS:
+            counters[STATUS_FIELDS[row['status']]] += row['count']
+        if row['priority'] in PRIORITY_FIELDS:
+            counters[PRIORITY_FIELDS[row['priority']]] += row['count']
+    
+    members = ProjectMember.objects.order_by()
+    if project_ids is not None:
+        members = members.filter(project_id__in=project_ids)
+    for row in members.values('project_id').annotate(count=Count('id')).iterator():
+        results[row['project_id']]['member_count'] = row['count']
+    
+    if project_ids is not None:
+        for project_id in project_ids:
+            results[project_id]
+    return dict(results)
+
+
+def rebuild_project_stats(project_id):
+    counters = compute_project_stats([project_id])[project_id]
+    stats, _ = ProjectStats.objects.update_or_create(project_id=project_id, defaults=counters)
+    return stats
+
+
+def attach_project_stats(projects):
+    """
+    Give every project in ``projects`` a ``stats`` row, building the missing
+    ones with one grouped count and one insert instead of one rebuild each.
+    """
+    missing = []
+    for project in projects:
+        try:
+            project.stats
+        except ProjectStats.DoesNotExist:
+            missing.append(project)
+    if not missing:
+        return
+    
+    counters = compute_project_stats([project.id for project in missing])
+    rows = [ProjectStats(project_id=project.id, **counters[project.id]) for project in missing]
+    ProjectStats.objects.bulk_create(rows, ignore_conflicts=True)
+    for project, stats in zip(missing, rows):
+        project.stats = stats
+
+
+def get_project_stats(project_id):
+    """Primary-key lookup of a project's counters, building the row if missing."""
+    try:
+        return ProjectStats.objects.get(project_id=project_id)
+    except ProjectStats.DoesNotExist:
+        return rebuild_project_stats(project_id)
@@ -0,0 +1,218 @@
+import base64
+import datetime
+import json
+import uuid
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework import status
+from rest_framework.decorators import api_view
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from apps.tasks.models import Comment, Task
+from .models import ProjectMember, Tombstone
+from .permissions import member_project_ids
+
+
+TASK_FIELDS = [
+    'id', 'project_id', 'title', 'description', 'assignee_id', 'creator_id',
+    'status', 'priority', 'due_date', 'completed', 'created_at', 'updated_at',
+]
+COMMENT_FIELDS = ['id', 'task_id', 'author_id', 'content', 'created_at', 'updated_at']
+MEMBER_FIELDS = ['id', 'project_id', 'user_id', 'role', 'joined_date']
+TOMBSTONE_FIELDS = ['id', 'object_type', 'object_id', 'project_id', 'deleted_at']
+
+
+class SyncCursor:
+    """
+    Where a client left off, per collection: ``(timestamp, pk)`` of the last
+    row it received, or ``(timestamp, None)`` meaning "everything from
+    ``timestamp`` on". Encoded as URL-safe base64 JSON.
+    """
+    collections = ('tasks', 'comments', 'members', 'deleted')
+
+    def __init__(self, positions=None):
+        epoch = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+        self.positions = positions or {name: (epoch, None) for name in self.collections}
+
+    @classmethod
+    def decode(cls, token):
+        try:
+            raw = json.loads(base64.urlsafe_b64decode(token.encode('ascii')))
+            positions = {}
+            for name in cls.collections:
+                timestamp, pk = raw[name]
+                timestamp = parse_datetime(timestamp)
+                if timestamp is None:
+                    raise ValueError(timestamp)
+                positions[name] = (timestamp, pk)
+        except (TypeError, ValueError, KeyError, UnicodeError):
+            raise ValidationError({"since": "Invalid sync token"})
+        return cls(positions)
+
+    def encode(self):
+        raw = {
+            name: [timestamp.isoformat(), pk if pk is None else str(pk)]
+            for name, (timestamp, pk) in self.positions.items()
+        }
+        data = json.dumps(raw, separators=(',', ':')).encode('utf-8')
+        return base64.urlsafe_b64encode(data).decode('ascii')
+
+    def tombstones_expired(self, cutoff):
+        """
+        Whether deletions the client has not seen yet may already have been
+        pruned. Only a caught-up ``deleted`` position counts: other
+        collections, and a tombstone stream that is still paging, carry the
+        timestamp of the last row sent, which can be arbitrarily old.
+        """
+        timestamp, pk = self.positions['deleted']
+        return pk is None and timestamp < cutoff
+
+
+def tombstone_moved_tasks(moves):
+    """
+    Record the tasks in ``moves`` (``{task_id: old_project_id}``), and their
+    comments, as deleted from their old project, so clients that can only
+    see that project drop them.
+    """
+    if not moves:
+        return
+    tombstones = [
+        Tombstone(object_type='task', object_id=str(task_id), project_id=project_id)
+        for task_id, project_id in moves.items()
+    ]
+    comments = Comment.objects.filter(task_id__in=list(moves)).values_list('pk', 'task_id')
+    tombstones += [
+        Tombstone(object_type='comment', object_id=str(pk), project_id=moves[task_id])
+        for pk, task_id in comments
+    ]
+    Tombstone.objects.bulk_create(tombstones, batch_size=500)
+
+
+def drop_moved(tombstones, project_ids):
+    """
+    ``tombstones`` without those for tasks and comments that still exist
+    in one of ``project_ids``: they moved between two projects the client
+    can see, and the upsert from the new project must not be undone.
+    """
+    task_ids = [row['object_id'] for row in tombstones if row['object_type'] == 'task']
+    comment_ids = [row['object_id'] for row in tombstones if row['object_type'] == 'comment']
+    visible = set()
+    if task_ids:
+        visible |= {
+            ('task', str(pk)) for pk in
+            Task.objects.filter(pk__in=task_ids, project_id__in=project_ids).values_list('pk', flat=True)
+        }
+    if comment_ids:
+        visible |= {
+            ('comment', str(pk)) for pk in
+            Comment.objects.filter(pk__in=comment_ids, task__project_id__in=project_ids)
+            .values_list('pk', flat=True)
+        }
+    if not visible:
+        return tombstones
+    return [row for row in tombstones if (row['object_type'], row['object_id']) not in visible]
+
+
+def changed_rows(queryset, timestamp_field, position, limit, fields, restart_at):
+    """
+    Rows of ``queryset`` after ``position`` in ``(timestamp_field, pk)``
+    order. Returns ``(rows, next_position, has_more)``.
+
+    When the collection is exhausted the next position restarts at
+    ``restart_at`` rather than at the last row, so rows whose transaction
+    committed after a later-stamped row are still picked up next time.
+    """
+    timestamp, pk = position
+    if pk is None:
+        queryset = queryset.filter(**{f'{timestamp_field}__gte': timestamp})
+    else:
+        queryset = queryset.filter(
+            Q(**{f'{timestamp_field}__gt': timestamp})
+            | Q(**{timestamp_field: timestamp, 'pk__gt': pk})
+        )
+
+    rows = list(queryset.order_by(timestamp_field, 'pk').values(*fields)[:limit + 1])
+    if len(rows) > limit:
+        rows = rows[:limit]
+        return rows, (rows[-1][timestamp_field], rows[-1]['id']), True
+    return rows, (restart_at, None), False
+
+
+@api_view(['GET'])
+def sync_changes(request):
+    """
+    Tasks, comments and memberships changed since ``?since=`` (the token
+    returned by the previous call), plus tombstones for deleted rows, across
+    every project the caller belongs to. Omit ``since`` for a full download;
+    pass ``?project=<id>`` to limit it to one project, e.g. after a
+    membership for the caller shows up.
+
+    Keep calling with the returned ``since`` while ``has_more`` is true.
+    Rows can be delivered more than once and should be applied as upserts.
+    A task moved out of a project shows up as deleted from it, unless the
+    caller can also see the project it moved to.
+    A token older than the tombstone retention gets ``410 Gone`` and the
+    client has to start over without ``since``.
+    """
+    started = timezone.now()
+    limit = getattr(settings, 'SYNC_PAGE_SIZE', 500)
+    try:
+        limit = max(1, min(int(request.query_params.get('limit', limit)), limit))
+    except ValueError:
+        pass
+
+    token = request.query_params.get('since')
+    cursor = SyncCursor.decode(token) if token else SyncCursor()
+
+    retention = datetime.timedelta(days=getattr(settings, 'SYNC_TOMBSTONE_RETENTION_DAYS', 30))
+    if token and cursor.tombstones_expired(started - retention):
+        return Response(
+            {"error": "Sync token expired, start a full sync"}, status=status.HTTP_410_GONE
+        )
+
+    project_ids = member_project_ids(request)
+    project_id = request.query_params.get('project')
+    if project_id:
+        try:
+            project_id = uuid.UUID(project_id)
+        except ValueError:
+            raise ValidationError({"project": "Invalid project id"})
+        project_ids = [project_id] if project_id in project_ids else []
+
+    restart_at = started - datetime.timedelta(seconds=getattr(settings, 'SYNC_OVERLAP_SECONDS', 5))
+    sources = {
+        'tasks': (Task.objects.filter(project_id__in=project_ids), 'updated_at', TASK_FIELDS),
+        'comments': (
+            Comment.objects.filter(task__project_id__in=project_ids), 'updated_at', COMMENT_FIELDS
+        ),
+        'members': (
+            ProjectMember.objects.filter(project_id__in=project_ids), 'joined_date', MEMBER_FIELDS
+        ),
+        'deleted': (
+            Tombstone.objects.filter(
+                Q(project_id__in=project_ids)
+                | Q(object_type='member', user_id=request.user.id)
+            ),
+            'deleted_at',
+            TOMBSTONE_FIELDS,
+        ),
+    }
+
+    data = {}
+    positions = {}
+    has_more = False
+    for name, (queryset, timestamp_field, fields) in sources.items():
+        rows, positions[name], more = changed_rows(
+            queryset, timestamp_field, cursor.positions[name], limit, fields, restart_at
+        )
+        data[name] = rows
+        has_more = has_more or more
+    data['deleted'] = drop_moved(data['deleted'], project_ids)
+
+    data['since'] = SyncCursor(positions).encode()
+    data['has_more'] = has_more
+    return Response(data)
@@ -0,0 +1,51 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from rest_framework.test import APITestCase
+
+from api.testing import assert_constant_query_count
+from apps.tasks.models import Task
+from .models import Project, ProjectMember
+
+User = get_user_model()
+
+
+class ProjectQueryCountTests(APITestCase):
+    """Listing projects and members costs the same number of queries at any size."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email='owner@example.com')
+        cls.members = [
+            User.objects.create_user(email=f'member{i}@example.com')
+            for i in range(50)
+        ]
+        for i in range(50):
+            project = Project.objects.create(name=f'Project {i}')
+            ProjectMember.objects.create(project=project, user=cls.user, role='OWNER')
+            Task.objects.create(title=f'Task {i}', project=project, creator=cls.user)
+
+        cls.project = Project.objects.create(name='Crowded')
+        ProjectMember.objects.create(project=cls.project, user=cls.user, role='OWNER')
+        ProjectMember.objects.bulk_create(
+            ProjectMember(project=cls.project, user=member, role='MEMBER') for member in cls.members
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_authenticate(self.user)
+
+    def test_project_list(self):
+        def list_projects(page_size):
+            response = self.client.get(f'/api/projects/?page_size={page_size}')
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(len(response.data['results']), page_size)
+
+        assert_constant_query_count(list_projects)
+
+    def test_project_members(self):
+        def list_members(page_size):
+            response = self.client.get(f'/api/projects/{self.project.id}/members/?page_size={page_size}')
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(len(response.data['results']), page_size)
+
+        assert_constant_query_count(list_members)
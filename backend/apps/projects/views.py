@@ -1,15 +1,30 @@
+from django.conf import settings
 from django.shortcuts import get_object_or_404
 from django.http import JsonResponse
 from django.db import transaction
-from rest_framework import viewsets, status, permissions
-from rest_framework.decorators import api_view, action
+from django.db.models import Count
+from django.db.models.functions import TruncWeek
+from rest_framework import generics, viewsets, status, permissions
+from rest_framework.decorators import api_view, action, permission_classes
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rest_framework.exceptions import PermissionDenied
+from rest_framework.exceptions import NotFound
 
 from .models import Project, ProjectMember, ProjectActivity
-from .serializers import ProjectSerializer, ProjectDetailSerializer, ProjectMemberSerializer
+from .serializers import (
+    ProjectSerializer, ProjectDetailSerializer, ProjectMemberSerializer,
+)
+from .cache import cached_project_response
+from .deletion import delete_project
+from .permissions import IsProjectAdmin, IsProjectMember, project_role, project_roles
+from .stats import STATUS_FIELDS, PRIORITY_FIELDS, get_project_stats
 from apps.tasks.models import Task
+from apps.tasks.serializers import TaskSerializer
+from api.pagination import KeysetPagination, MemberKeysetPagination, ProjectKeysetPagination
+from apps.jobs.registry import enqueue
+from apps.jobs.views import job_accepted
+from apps.search.views import search_projects
+from taskforge.audit import audit_log
 
 
 
@@ -17,14 +32,17 @@ class ProjectViewSet(viewsets.ModelViewSet):
     """API endpoint for projects."""
     queryset = Project.objects.all()
     serializer_class = ProjectSerializer
+    pagination_class = ProjectKeysetPagination
     
     def get_queryset(self):
         """
         Restrict projects to those the user is a member of.
         """
-        user = self.request.user
+        project_ids = list(project_roles(self.request))
         
-        return Project.objects.filter(members=user)
+        return self.get_serializer_class().setup_queryset(
+            Project.objects.filter(id__in=project_ids), self.get_serializer_context()
+        )
     
     def get_serializer_class(self):
         """
@@ -34,6 +52,23 @@ class ProjectViewSet(viewsets.ModelViewSet):
             return ProjectDetailSerializer
         return ProjectSerializer
     
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Project detail, served from the per-project response cache and
+        answering conditional GETs with 304. See ``ProjectDetailSerializer``
+        for ``?page_nested=`` and ``?expand=``.
+        """
+        project_id = kwargs[self.lookup_field]
+        role = project_role(request, project_id)
+        if role is None:
+            raise NotFound()
+        
+        expand = ProjectDetailSerializer.expanded_for(request)
+        return cached_project_response(
+            request, f"detail:{','.join(sorted(expand))}", project_id, role,
+            lambda: self.get_serializer(self.get_object()).data,
+        )
+    
     def perform_create(self, serializer):
         """Create a new project and add current user as owner."""
         with transaction.atomic():
@@ -48,104 +83,156 @@ class ProjectViewSet(viewsets.ModelViewSet):
             )
             
             
-            ProjectActivity.objects.create(
+            audit_log.record(ProjectActivity(
                 project=project,
                 performed_by=self.request.user,
                 description=f"Project created: {project.name}"
-            )
+            ))
+    
+    
+    def destroy(self, request, *args, **kwargs):
+        """
+        Delete a project. Projects with more than
+        ``JOB_INLINE_DELETE_MAX_TASKS`` tasks are deleted by a background
+        job and the response is ``202`` with the job.
+        """
+        project = self.get_object()
+        if get_project_stats(project.id).total_tasks > getattr(settings, 'JOB_INLINE_DELETE_MAX_TASKS', 500):
+            return job_accepted(request, enqueue('projects.delete', user=request.user, project_id=project.id))
+        
+        self.perform_destroy(project)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+    
+    def perform_destroy(self, instance):
+        delete_project(instance.pk)
+    
+    
+    @action(detail=False, methods=['get'])
+    def search(self, request):
+        """Ranked search over project names and descriptions (``?q=``)."""
+        return search_projects(request)
     
     
     @action(detail=True, methods=['post'])
     def archive(self, request, pk=None):
-        """Archive a project."""
+        """Archive a project in the background; responds ``202`` with the job."""
         project = self.get_object()
-        project.is_archived = True
-        project.save()
-        
-        
-        ProjectActivity.objects.create(
-            project=project,
-            performed_by=request.user,
-            description="Project archived"
-        )
-        
-        return Response({"status": "Project archived"})
+        job = enqueue('projects.archive', user=request.user, project_id=project.id, user_id=request.user.id)
+        return job_accepted(request, job)
 
 
 
 @api_view(['GET'])
+@permission_classes([permissions.IsAuthenticated, IsProjectMember])
 def project_stats(request, project_id):
-    """Get project statistics."""
-    project = get_object_or_404(Project, id=project_id)
-    
-    
-    if not project.members.filter(id=request.user.id).exists():
-        return Response({"error": "You don't have permission to view this project"},
-                       status=status.HTTP_403_FORBIDDEN)
-    
-    
-    tasks = Task.objects.filter(project=project)
-    total_tasks = tasks.count()
-    completed_tasks = tasks.filter(status='DONE').count()
+    """
+    Get project statistics.
+
+    Counters come from the project's ``ProjectStats`` row; the per-assignee
+    and due-week figures are grouped aggregates in the database. Pass
+    ``?breakdown=priority,due_week`` for the optional extra distributions.
+    """
+    stats = get_project_stats(project_id)
+    tasks = Task.objects.filter(project_id=project_id).order_by()
     
     
     status_counts = {}
-    for task in tasks:
-        if task.status in status_counts:
-            status_counts[task.status] += 1
-        else:
-            status_counts[task.status] = 1
+    for task_status, field in STATUS_FIELDS.items():
+        count = getattr(stats, field)
+        if count:
+            status_counts[task_status] = count
     
     
+    assignee_rows = tasks.filter(assignee__isnull=False).values(
+        'assignee__first_name', 'assignee__last_name', 'assignee__email'
+    ).annotate(count=Count('id'))
     user_task_counts = {}
-    for task in tasks:
-        if task.assignee:
-            assignee_name = f"{task.assignee.first_name} {task.assignee.last_name}".strip() or task.assignee.email
-            if assignee_name in user_task_counts:
-                user_task_counts[assignee_name] += 1
-            else:
-                user_task_counts[assignee_name] = 1
+    for row in assignee_rows:
+        assignee_name = (
+            f"{row['assignee__first_name']} {row['assignee__last_name']}".strip()
+            or row['assignee__email']
+        )
+        user_task_counts[assignee_name] = user_task_counts.get(assignee_name, 0) + row['count']
     
-    return Response({
-        "total_tasks": total_tasks,
-        "completed_tasks": completed_tasks,
-        "completion_rate": (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0,
+    data = {
+        "total_tasks": stats.total_tasks,
+        "completed_tasks": stats.done_tasks,
+        "completion_rate": stats.completion_rate,
+        "overdue_tasks": stats.overdue_tasks,
         "status_distribution": status_counts,
         "user_task_counts": user_task_counts
-    })
+    }
+    
+    
+    breakdowns = request.query_params.get('breakdown', '')
+    breakdowns = {name.strip() for name in breakdowns.split(',') if name.strip()}
+    
+    if 'priority' in breakdowns:
+        data["priority_distribution"] = {
+            priority: getattr(stats, field)
+            for priority, field in PRIORITY_FIELDS.items()
+            if getattr(stats, field)
+        }
+    
+    if 'due_week' in breakdowns:
+        week_rows = tasks.filter(due_date__isnull=False).annotate(
+            week=TruncWeek('due_date')
+        ).values('week').annotate(count=Count('id')).order_by('week')
+        data["due_week_distribution"] = {
+            row['week'].date().isoformat(): row['count'] for row in week_rows
+        }
+    
+    return Response(data)
+
+
+
+@api_view(['POST'])
+@permission_classes([permissions.IsAuthenticated, IsProjectAdmin])
+def rebuild_project_stats(request, project_id):
+    """
+    Recount the project's ``ProjectStats`` row from its tasks and members
+    in a background job; responds ``202`` with the job.
+    """
+    job = enqueue('projects.rebuild_stats', user=request.user, project_id=project_id)
+    return job_accepted(request, job)
 
 
 
 class ProjectMemberAPIView(APIView):
     """API for managing project members."""
-    permission_classes = [permissions.IsAuthenticated]
+    permission_classes = [permissions.IsAuthenticated, IsProjectAdmin]
     
     def get(self, request, project_id):
-        """Get all members of a project."""
-        project = get_object_or_404(Project, id=project_id)
-        
-        
-        if not project.members.filter(id=request.user.id).exists():
-            raise PermissionDenied("You don't have permission to view this project")
+        """
+        Get all members of a project. Paginated (``{results, next, ...}``)
+        when the request carries ``cursor`` or ``page_size``, as the ``next``
+        links of a paged project detail do; otherwise a plain list.
+        """
+        role = project_role(request, project_id)
+        paginator = MemberKeysetPagination()
+        paged = any(
+            name in request.query_params
+            for name in (paginator.cursor_query_param, paginator.page_size_query_param)
+        )
         
+        def render():
+            members = ProjectMemberSerializer.setup_queryset(
+                ProjectMember.objects.filter(project_id=project_id)
+            )
+            if not paged:
+                return ProjectMemberSerializer(members, many=True).data
+            page = paginator.paginate_queryset(members, request, view=self)
+            serializer = ProjectMemberSerializer(page, many=True)
+            return paginator.get_paginated_response(serializer.data).data
         
-        members = ProjectMember.objects.filter(project=project)
-        serializer = ProjectMemberSerializer(members, many=True)
-        return Response(serializer.data)
+        return cached_project_response(
+            request, f'members?{request.GET.urlencode()}', project_id, role, render
+        )
     
     def post(self, request, project_id):
         """Add a member to a project."""
         project = get_object_or_404(Project, id=project_id)
         
-        
-        user_membership = ProjectMember.objects.filter(
-            project=project, 
-            user=request.user
-        ).first()
-        
-        if not user_membership or user_membership.role not in ['OWNER', 'ADMIN']:
-            raise PermissionDenied("You don't have permission to add members to this project")
-        
         serializer = ProjectMemberSerializer(data=request.data)
         if serializer.is_valid():
             
@@ -153,11 +240,11 @@ class ProjectMemberAPIView(APIView):
                 member = serializer.save(project=project)
                 
                 
-                ProjectActivity.objects.create(
+                audit_log.record(ProjectActivity(
                     project=project,
                     performed_by=request.user,
                     description=f"Added {member.user.email} as {member.role}"
-                )
+                ))
                 
                 return Response(serializer.data, status=status.HTTP_201_CREATED)
             except Exception as e:
@@ -167,63 +254,65 @@ class ProjectMemberAPIView(APIView):
 
 
 
+class ProjectTaskListAPIView(generics.ListAPIView):
+    """
+    Paginated tasks of one project, optionally filtered by ``status``,
+    ``assignee`` and ``overdue=true``.
+    """
+    serializer_class = TaskSerializer
+    pagination_class = KeysetPagination
+    permission_classes = [permissions.IsAuthenticated, IsProjectMember]
+    
+    def get_queryset(self):
+        project_id = self.kwargs['project_id']
+        tasks = Task.objects.filter(project_id=project_id)
+        
+        task_status = self.request.query_params.get('status')
+        if task_status:
+            tasks = tasks.filter(status=task_status)
+        
+        assignee = self.request.query_params.get('assignee')
+        if assignee:
+            tasks = tasks.filter(assignee_id=assignee)
+        
+        if self.request.query_params.get('overdue') in ('1', 'true', 'yes'):
+            tasks = tasks.filter(overdue=True)
+        
+        return TaskSerializer.setup_queryset(tasks, self.get_serializer_context())
+
+
+
 @api_view(['GET'])
+@permission_classes([permissions.IsAuthenticated, IsProjectMember])
 def project_activities(request, project_id):
     """Get project activity feed."""
-    try:
-        project = Project.objects.get(id=project_id)
-    except Project.DoesNotExist:
-        return Response({"error": "Project not found"}, status=status.HTTP_404_NOT_FOUND)
-    
-    
-    if not ProjectMember.objects.filter(project=project, user=request.user).exists():
-        return Response({"error": "Not authorized"}, status=status.HTTP_403_FORBIDDEN)
-    
-    
-    from django.db import connection
-    with connection.cursor() as cursor:
-        cursor.execute("""
-            SELECT pa.id, pa.description, pa.activity_date, auth_user.email
-            FROM apps_projects_projectactivity pa
-            JOIN auth_user ON pa.performed_by_id = auth_user.id
-            WHERE pa.project_id = %s
-            ORDER BY pa.activity_date DESC
-            LIMIT 20
-        """, [project_id])
-        
-        activities = []
-        for row in cursor.fetchall():
-            activities.append({
-                "id": row[0],
-                "description": row[1],
-                "date": row[2],
-                "user": row[3]
-            })
+    recent = ProjectActivity.objects.filter(project_id=project_id).select_related(
+        'performed_by'
+    ).only(
+        'id', 'description', 'activity_date', 'performed_by__email'
+    ).order_by('-activity_date')[:20]
+    
+    activities = []
+    for activity in recent:
+        activities.append({
+            "id": activity.id,
+            "description": activity.description,
+            "date": activity.activity_date,
+            "user": activity.performed_by.email
+        })
     
     return JsonResponse({"activities": activities})
 
 
 
 @api_view(['POST'])
+@permission_classes([permissions.IsAuthenticated, IsProjectAdmin])
 def add_project_member(request, project_id):
     """
     Legacy endpoint for adding a project member.
     Duplicates functionality in ProjectMemberAPIView.
     """
-    try:
-        project = Project.objects.get(id=project_id)
-    except Project.DoesNotExist:
-        return Response({"error": "Project not found"}, status=status.HTTP_404_NOT_FOUND)
-    
-    
-    is_admin = ProjectMember.objects.filter(
-        project=project, 
-        user=request.user, 
-        role__in=['OWNER', 'ADMIN']
-    ).exists()
-    
-    if not is_admin:
-        return Response({"error": "Permission denied"}, status=status.HTTP_403_FORBIDDEN)
+    project = get_object_or_404(Project, id=project_id)
     
     
     user_email = request.data.get('email')
@@ -253,11 +342,11 @@ def add_project_member(request, project_id):
     )
     
     
-    ProjectActivity.objects.create(
+    audit_log.record(ProjectActivity(
         project=project,
         performed_by=request.user,
         description=f"Added {user.email} as {role}"
-    )
+    ))
     
     return Response({
         "status": "success",
@@ -0,0 +1,153 @@
+import re
+import unicodedata
+from collections import Counter
+
+from .models import Posting
+
+
+MAX_TERM_LENGTH = 64
+
+STOPWORDS = frozenset("""
+a an and are as at be but by for from has have i if in into is it its me my
+no not of on or our so that the their then there this to was we were will
+with you your
+""".split())
+
+# Multiplier applied to a term's frequency per field.
+TASK_FIELD_WEIGHTS = {'title': 3, 'description': 1}
+PROJECT_FIELD_WEIGHTS = {'name': 3, 'description': 1}
+COMMENT_WEIGHT = 1
+
+_word = re.compile(r'\w+')
+
+
+def tokenize(text):
+    """
+    Split ``text`` into index terms: case-folded, accents stripped, runs of
+    word characters, stopwords and one-character words dropped. No stemming,
+    so queries match whole words only.
+    """
+    if not text:
+        return []
+    text = unicodedata.normalize('NFKD', text.casefold())
+    text = ''.join(char for char in text if not unicodedata.combining(char))
+    return [
+        word[:MAX_TERM_LENGTH]
+        for word in _word.findall(text)
+        if len(word) > 1 and word not in STOPWORDS
+    ]
+
+
+def term_weights(fields):
+    """``{term: weight}`` for ``[(text, multiplier), ...]``."""
+    weights = Counter()
+    for text, multiplier in fields:
+        for term in tokenize(text):
+            weights[term] += multiplier
+    return weights
+
+
+def task_document(task):
+    return term_weights(
+        (getattr(task, field), multiplier) for field, multiplier in TASK_FIELD_WEIGHTS.items()
+    )
+
+
+def project_document(project):
+    return term_weights(
+        (getattr(project, field), multiplier) for field, multiplier in PROJECT_FIELD_WEIGHTS.items()
+    )
+
+
+def comment_document(comment):
+    return term_weights([(comment.content, COMMENT_WEIGHT)])
+
+
+def index_sources(source_type, documents):
+    """
+    Bring the postings of many sources of one type up to date.
+
+    ``documents`` maps ``source_id`` to ``(project_id, task_id, weights)``.
+    The current postings are read with one query and only the difference is
+    written, so saves that leave the text alone cost a single ``SELECT``.
+    """
+    if not documents:
+        return
+    
+    documents = {str(source_id): document for source_id, document in documents.items()}
+    existing = {}
+    for pk, source_id, term, weight, project_id in Posting.objects.filter(
+        source_type=source_type, source_id__in=list(documents)
+    ).values_list('pk', 'source_id', 'term', 'weight', 'project_id'):
+        existing.setdefault(source_id, {})[term] = (pk, weight, project_id)
+    
+    stale = []
+    fresh = []
+    for source_id, (project_id, task_id, weights) in documents.items():
+        current = existing.get(source_id, {})
+        for term, (pk, weight, indexed_project_id) in current.items():
+            if weights.get(term) != weight or indexed_project_id != project_id:
+                stale.append(pk)
+        for term, weight in weights.items():
+            entry = current.get(term)
+            if entry is None or entry[1] != weight or entry[2] != project_id:
+                fresh.append(Posting(
+                    term=term, source_type=source_type, source_id=source_id,
+                    project_id=project_id, task_id=task_id, weight=weight,
+                ))
+    
+    if stale:
+        Posting.objects.filter(pk__in=stale).delete()
+    if fresh:
+        Posting.objects.bulk_create(fresh, batch_size=1000)
+
+
+def index_tasks(tasks):
+    """
+    Reindex tasks after their text or project changed. A task that moved to
+    another project takes its comments' postings along.
+    """
+    tasks = list(tasks)
+    moved = dict(
+        Posting.objects.filter(source_type='task', source_id__in=[str(task.pk) for task in tasks])
+        .values_list('task_id', 'project_id').distinct()
+    )
+    index_sources('task', {
+        task.pk: (task.project_id, task.pk, task_document(task)) for task in tasks
+    })
+    for task in tasks:
+        if task.pk in moved and moved[task.pk] != task.project_id:
+            Posting.objects.filter(task_id=task.pk, source_type='comment').update(
+                project_id=task.project_id
+            )
+
+
+def index_comments(comments, project_ids=None):
+    """
+    Reindex comments. ``project_ids`` maps task id to project id; when not
+    given it is read from the tasks.
+    """
+    comments = list(comments)
+    if project_ids is None:
+        from apps.tasks.models import Task
+        project_ids = dict(
+            Task.objects.filter(pk__in={comment.task_id for comment in comments})
+            .values_list('pk', 'project_id')
+        )
+    index_sources('comment', {
+        comment.pk: (project_ids[comment.task_id], comment.task_id, comment_document(comment))
+        for comment in comments
+        if comment.task_id in project_ids
+    })
+
+
+def index_projects(projects):
+    index_sources('project', {
+        project.pk: (project.pk, None, project_document(project)) for project in projects
+    })
+
+
+def remove_sources(source_type, source_ids):
+    Posting.objects.filter(
+        source_type=source_type, source_id__in=[str(source_id) for source_id in source_ids]
+    ).delete()
@@ -0,0 +1,27 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Posting',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=64)),
+                ('source_type', models.CharField(choices=[('project', 'Project'), ('task', 'Task'), ('comment', 'Comment')], max_length=10)),
+                ('source_id', models.CharField(max_length=64)),
+                ('project_id', models.UUIDField()),
+                ('task_id', models.UUIDField(blank=True, null=True)),
+                ('weight', models.PositiveIntegerField(default=1)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['term', 'project_id', 'source_type', 'task_id', 'weight'], name='posting_term_scope_idx'), models.Index(fields=['source_type', 'source_id'], name='posting_source_idx'), models.Index(fields=['task_id'], name='posting_task_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,37 @@
+from django.db import models
+
+
+class Posting(models.Model):
+    """
+    One entry of the inverted index: ``term`` occurs in a project, task or
+    comment (``source_type`` / ``source_id``) with the given field-weighted
+    frequency. ``project_id`` and ``task_id`` are denormalised plain columns
+    so queries can be scoped to the caller's projects and grouped by task
+    without joins.
+    """
+    SOURCE_TYPES = [
+        ('project', 'Project'),
+        ('task', 'Task'),
+        ('comment', 'Comment'),
+    ]
+    
+    term = models.CharField(max_length=64)
+    source_type = models.CharField(max_length=10, choices=SOURCE_TYPES)
+    source_id = models.CharField(max_length=64)
+    project_id = models.UUIDField()
+    task_id = models.UUIDField(null=True, blank=True)
+    weight = models.PositiveIntegerField(default=1)
+    
+    class Meta:
+        indexes = [
+            # Covers ranking: term lookup, project scope, grouping and score.
+            models.Index(
+                fields=['term', 'project_id', 'source_type', 'task_id', 'weight'],
+                name='posting_term_scope_idx',
+            ),
+            models.Index(fields=['source_type', 'source_id'], name='posting_source_idx'),
+            models.Index(fields=['task_id'], name='posting_task_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.term} in {self.source_type} {self.source_id}"
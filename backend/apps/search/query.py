@@ -0,0 +1,72 @@
+import math
+
+from django.conf import settings
+from django.db.models import Case, Count, F, FloatField, Sum, Value, When
+from django.db.models.functions import Cast
+
+from .index import tokenize
+from .models import Posting
+
+
+# BM25 term-frequency saturation: repeated occurrences add less and less.
+K1 = 1.2
+
+
+def parse_terms(query):
+    """Distinct query terms in order, capped at ``SEARCH_MAX_TERMS``."""
+    terms = list(dict.fromkeys(tokenize(query)))
+    return terms[:getattr(settings, 'SEARCH_MAX_TERMS', 8)]
+
+
+def idf(total, document_frequency):
+    """BM25 inverse document frequency, never negative."""
+    return math.log(1 + (total - document_frequency + 0.5) / (document_frequency + 0.5))
+
+
+def rank(terms, project_ids, source_types, group_by, total, limit, offset=0):
+    """
+    Rank documents for ``terms`` within ``project_ids``.
+
+    A document is whatever ``group_by`` names: ``task_id`` folds a task's
+    comments into the task, ``project_id`` ranks projects. Documents are
+    ordered by how many distinct terms they contain, then by their summed
+    BM25 score, so full matches come first but partial matches still show.
+
+    Two grouped queries: document frequencies per term, then the scored
+    page. Both read only the ``posting_term_scope_idx`` index. Returns
+    ``[(document_id, score), ...]``.
+    """
+    if not terms or not project_ids:
+        return []
+    
+    postings = Posting.objects.filter(
+        term__in=terms, project_id__in=project_ids, source_type__in=source_types
+    ).order_by()
+    
+    frequencies = dict(
+        postings.values('term').annotate(df=Count(group_by, distinct=True)).values_list('term', 'df')
+    )
+    if not frequencies:
+        return []
+    total = max(total, max(frequencies.values()))
+    
+    weight = Cast(F('weight'), FloatField())
+    saturated = weight * Value(K1 + 1) / (weight + Value(K1))
+    score = Sum(
+        Case(
+            *[
+                When(term=term, then=saturated * Value(idf(total, df)))
+                for term, df in frequencies.items()
+            ],
+            default=Value(0.0),
+            output_field=FloatField(),
+        )
+    )
+    rows = (
+        postings.filter(term__in=list(frequencies))
+        .values(group_by)
+        .annotate(matched=Count('term', distinct=True), score=score)
+        .order_by('-matched', '-score', group_by)
+        .values_list(group_by, 'score')[offset:offset + limit]
+    )
+    return list(rows)
@@ -0,0 +1,54 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.projects.deletion import deleting_project
+from apps.projects.models import Project
+from apps.tasks.models import Comment, Task
+from .index import index_comments, index_projects, index_tasks, remove_sources
+from .models import Posting
+
+
+TASK_INDEXED_FIELDS = {'title', 'description', 'project', 'project_id'}
+PROJECT_INDEXED_FIELDS = {'name', 'description'}
+
+
+def touches(update_fields, indexed_fields):
+    return update_fields is None or bool(indexed_fields & set(update_fields))
+
+
+@receiver(post_save, sender=Task)
+def index_saved_task(sender, instance, raw=False, update_fields=None, **kwargs):
+    if not raw and touches(update_fields, TASK_INDEXED_FIELDS):
+        index_tasks([instance])
+
+
+@receiver(post_delete, sender=Task)
+def unindex_task(sender, instance, **kwargs):
+    if deleting_project():
+        return
+    # Also drops the postings of the task's comments.
+    Posting.objects.filter(task_id=instance.pk).delete()
+
+
+@receiver(post_save, sender=Comment)
+def index_saved_comment(sender, instance, raw=False, update_fields=None, **kwargs):
+    if not raw and touches(update_fields, {'content'}):
+        index_comments([instance])
+
+
+@receiver(post_delete, sender=Comment)
+def unindex_comment(sender, instance, **kwargs):
+    if deleting_project():
+        return
+    remove_sources('comment', [instance.pk])
+
+
+@receiver(post_save, sender=Project)
+def index_saved_project(sender, instance, raw=False, update_fields=None, **kwargs):
+    if not raw and touches(update_fields, PROJECT_INDEXED_FIELDS):
+        index_projects([instance])
+
+
+@receiver(post_delete, sender=Project)
+def unindex_project(sender, instance, **kwargs):
+    remove_sources('project', [instance.pk])
@@ -0,0 +1,95 @@
+import uuid
+
+from django.conf import settings
+from django.db.models import Sum
+from rest_framework.decorators import api_view
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from apps.projects.models import Project, ProjectStats
+from apps.projects.permissions import member_project_ids
+from apps.projects.serializers import ProjectSerializer
+from apps.tasks.models import Task
+from apps.tasks.serializers import TaskSerializer
+from .query import parse_terms, rank
+
+
+def parse_page(request):
+    max_limit = getattr(settings, 'SEARCH_MAX_RESULTS', 50)
+    try:
+        limit = max(1, min(int(request.query_params.get('limit', 20)), max_limit))
+        offset = max(0, int(request.query_params.get('offset', 0)))
+    except ValueError:
+        raise ValidationError({"limit": "limit and offset must be integers"})
+    # Ranked results are for finding things, not for paging through everything.
+    if offset >= getattr(settings, 'SEARCH_MAX_OFFSET', 200):
+        raise ValidationError({"offset": "Refine the query instead of paging this far"})
+    return limit, offset
+
+
+def scoped_project_ids(request):
+    project_ids = member_project_ids(request)
+    project_id = request.query_params.get('project')
+    if project_id:
+        try:
+            project_id = uuid.UUID(project_id)
+        except ValueError:
+            raise ValidationError({"project": "Invalid project id"})
+        project_ids = [project_id] if project_id in project_ids else []
+    return project_ids
+
+
+def ranked_response(request, ranked, objects, serializer_class, limit, offset):
+    """Serialize ``objects`` in rank order with their scores and a ``next`` link."""
+    context = {'request': request}
+    by_id = {
+        obj.pk: obj
+        for obj in serializer_class.setup_queryset(objects, context)
+    }
+    hits = [(by_id[object_id], score) for object_id, score in ranked[:limit] if object_id in by_id]
+    results = serializer_class([obj for obj, _ in hits], many=True, context=context).data
+    for data, (_, score) in zip(results, hits):
+        data['score'] = round(score, 4)
+    
+    next_url = None
+    if len(ranked) > limit:
+        next_url = replace_query_param(request.build_absolute_uri(), 'offset', offset + limit)
+    return Response({"results": results, "next": next_url})
+
+
+@api_view(['GET'])
+def search_tasks(request):
+    """
+    Ranked full-text search over task titles, descriptions and comments in
+    the caller's projects (``?project=`` narrows it to one). ``?q=`` is
+    split into words; tasks matching more of them rank first, then by
+    relevance. Comments count towards their task. Page with ``?limit=`` and
+    ``?offset=``.
+    """
+    terms = parse_terms(request.query_params.get('q', ''))
+    if not terms:
+        return Response({"results": [], "next": None})
+    
+    limit, offset = parse_page(request)
+    project_ids = scoped_project_ids(request)
+    total = ProjectStats.objects.filter(project_id__in=project_ids).aggregate(
+        total=Sum('total_tasks')
+    )['total'] or 0
+    
+    ranked = rank(terms, project_ids, ('task', 'comment'), 'task_id', total, limit + 1, offset)
+    tasks = Task.objects.filter(id__in=[task_id for task_id, _ in ranked[:limit]])
+    return ranked_response(request, ranked, tasks, TaskSerializer, limit, offset)
+
+
+def search_projects(request):
+    """Ranked search over the names and descriptions of the caller's projects."""
+    terms = parse_terms(request.query_params.get('q', ''))
+    if not terms:
+        return Response({"results": [], "next": None})
+    
+    limit, offset = parse_page(request)
+    project_ids = scoped_project_ids(request)
+    ranked = rank(terms, project_ids, ('project',), 'project_id', len(project_ids), limit + 1, offset)
+    projects = Project.objects.filter(id__in=[project_id for project_id, _ in ranked[:limit]])
+    return ranked_response(request, ranked, projects, ProjectSerializer, limit, offset)
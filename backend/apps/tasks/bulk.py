@@ -0,0 +1,198 @@
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.utils import timezone
+
+from apps.projects.cache import invalidate_projects
+from apps.projects.feed import publish_project_events, task_event_data
+from apps.projects.models import Project, ProjectMember
+from apps.projects.stats import record_task_changes, task_state
+from apps.projects.sync import tombstone_moved_tasks
+from apps.search.index import index_tasks
+from .models import Task, TaskHistory
+
+User = get_user_model()
+
+
+# Request keys that map onto Task columns, with the attribute they set.
+TASK_FIELDS = {
+    'title': 'title',
+    'description': 'description',
+    'project': 'project_id',
+    'assignee': 'assignee_id',
+    'status': 'status',
+    'priority': 'priority',
+    'due_date': 'due_date',
+    'completed': 'completed',
+}
+
+
+def apply_bulk_operations(user, operations):
+    """
+    Validate and apply a list of bulk task operations.
+
+    Every referenced task, project, assignee and membership is loaded with
+    one query each. If any operation is invalid nothing is written and the
+    per-item errors are returned. Otherwise all task inserts, task updates
+    and history rows go out as ``bulk_create``/``bulk_update`` calls inside
+    one transaction. The referenced tasks are locked (``select_for_update``)
+    before they are validated, so the previous values used for history,
+    stats and the update itself cannot go stale under a concurrent edit.
+
+    Returns ``(results, applied)`` where ``results`` has one entry per
+    operation, in request order.
+    """
+    with transaction.atomic():
+        return _validate_and_apply(user, operations)
+
+
+def _validate_and_apply(user, operations):
+    task_ids = {operation['id'] for operation in operations if 'id' in operation}
+    tasks = {
+        task.id: task
+        for task in Task.objects.select_for_update().filter(id__in=task_ids).order_by('id')
+    }
+
+    project_ids = {operation['project'] for operation in operations if 'project' in operation}
+    project_ids |= {task.project_id for task in tasks.values()}
+    existing_projects = set(
+        Project.objects.filter(id__in=project_ids).values_list('id', flat=True)
+    )
+    member_of = set(
+        ProjectMember.objects.filter(user=user, project_id__in=project_ids)
+        .values_list('project_id', flat=True)
+    )
+
+    assignee_ids = {operation['assignee'] for operation in operations if operation.get('assignee')}
+    existing_users = set(User.objects.filter(id__in=assignee_ids).values_list('id', flat=True))
+
+    results = []
+    for index, operation in enumerate(operations):
+        errors = {}
+        task = tasks.get(operation.get('id'))
+
+        if 'id' in operation and task is None:
+            errors['id'] = "Task does not exist"
+
+        targets = set()
+        if task is not None:
+            targets.add(task.project_id)
+        if 'project' in operation:
+            if operation['project'] not in existing_projects:
+                errors['project'] = "Project does not exist"
+            else:
+                targets.add(operation['project'])
+        if any(project_id not in member_of for project_id in targets):
+            errors.setdefault('project', "You are not a member of this project")
+
+        if operation.get('assignee') and operation['assignee'] not in existing_users:
+            errors['assignee'] = "User does not exist"
+
+        result = {'index': index, 'op': operation['op'], 'id': operation.get('id')}
+        if errors:
+            result['status'] = 'error'
+            result['errors'] = errors
+        else:
+            result['status'] = 'ok'
+        results.append(result)
+
+    if any(result['status'] == 'error' for result in results):
+        return results, False
+
+    _apply(user, operations, tasks, results)
+    return results, True
+
+
+def _apply(user, operations, tasks, results):
+    now = timezone.now()
+    previous_states = {task_id: task_state(task) for task_id, task in tasks.items()}
+
+    created = []
+    changed = {}
+    changed_fields = {}
+    history = []
+
+    for operation, result in zip(operations, results):
+        op = operation['op']
+
+        if op == 'create':
+            task = Task(creator=user)
+            for key, attname in TASK_FIELDS.items():
+                if key in operation:
+                    setattr(task, attname, operation[key])
+            created.append(task)
+            result['id'] = task.id
+            history.append(TaskHistory(task=task, user=user, action=f"Created task: {task.title}"[:255]))
+            continue
+
+        task = tasks[operation['id']]
+
+        if op == 'complete':
+            updates = {'status': 'DONE', 'completed': True}
+            action = "Marked task as complete"
+        elif op == 'reassign':
+            updates = {'assignee': operation['assignee']}
+            action = f"Assigned task to user {operation['assignee']}"
+        else:
+            updates = {key: operation[key] for key in TASK_FIELDS if key in operation}
+            action = None
+
+        changes = []
+        for key, value in updates.items():
+            attname = TASK_FIELDS[key]
+            old_value = getattr(task, attname)
+            if old_value != value:
+                changes.append(f"{key}: {old_value} -> {value}")
+                setattr(task, attname, value)
+                changed_fields.setdefault(task.id, set()).add(attname)
+
+        if changes:
+            changed[task.id] = task
+
+        if action is None and changes:
+            action = f"Updated task: {', '.join(changes)}"
+        if action is not None:
+            history.append(TaskHistory(task=task, user=user, action=action[:255]))
+
+    for task in created:
+        task.overdue = task.compute_overdue(now)
+    Task.objects.bulk_create(created, batch_size=500)
+
+    # Each task only writes the columns its own operations changed, so
+    # retitling one task never rewrites another's status or assignee.
+    by_fields = {}
+    for task_id, task in changed.items():
+        task.updated_at = now
+        task.overdue = task.compute_overdue(now)
+        by_fields.setdefault(frozenset(changed_fields[task_id]), []).append(task)
+    for fields, group in by_fields.items():
+        Task.objects.bulk_update(group, sorted(fields) + ['updated_at', 'overdue'], batch_size=500)
+
+    TaskHistory.objects.bulk_create(history, batch_size=500)
+
+    record_task_changes(
+        [(None, task_state(task)) for task in created]
+        + [(previous_states[task_id], task_state(task)) for task_id, task in changed.items()]
+    )
+    reindexed = list(created) + [
+        task for task_id, task in changed.items()
+        if changed_fields[task_id] & {'title', 'description', 'project_id'}
+    ]
+    index_tasks(reindexed)
+    tombstone_moved_tasks({
+        task_id: previous_states[task_id]['project_id']
+        for task_id, task in changed.items()
+        if previous_states[task_id]['project_id'] != task.project_id
+    })
+    invalidate_projects(
+        [task.project_id for task in created]
+        + [task.project_id for task in changed.values()]
+        + [previous_states[task_id]['project_id'] for task_id in changed]
+    )
+
+    events = [(task.project_id, 'task.created', task_event_data(task)) for task in created]
+    for task_id, task in changed.items():
+        events.append((task.project_id, 'task.updated', task_event_data(task)))
+        old_project_id = previous_states[task_id]['project_id']
+        if old_project_id != task.project_id:
+            events.append((old_project_id, 'task.deleted', {'id': task_id}))
+    publish_project_events(events)
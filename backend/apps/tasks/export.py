@@ -0,0 +1,75 @@
+import csv
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+
+EXPORT_FIELDS = [
+    'id', 'title', 'status', 'priority', 'project_id', 'assignee_id',
+    'creator_id', 'due_date', 'completed', 'created_at', 'updated_at',
+]
+
+
+def filter_tasks(queryset, params):
+    """Apply the list endpoint's ``project``/``status``/``assignee``/``overdue`` filters."""
+    if params.get('project'):
+        queryset = queryset.filter(project_id=params['project'])
+    if params.get('status'):
+        queryset = queryset.filter(status=params['status'])
+    if params.get('assignee'):
+        queryset = queryset.filter(assignee_id=params['assignee'])
+    if params.get('overdue') in ('1', 'true', 'yes'):
+        queryset = queryset.filter(overdue=True)
+    return queryset
+
+
+def iter_task_rows(queryset, chunk_size=2000):
+    """
+    Yield ``EXPORT_FIELDS`` tuples for every task in ``queryset``.
+
+    Rows are read in primary-key order, one ``LIMIT`` query per chunk
+    continuing after the last key seen, so memory stays flat and no
+    transaction or server-side cursor is held open between chunks.
+    """
+    queryset = queryset.order_by('pk').values_list(*EXPORT_FIELDS)
+    last_pk = None
+    
+    while True:
+        chunk = queryset
+        if last_pk is not None:
+            chunk = chunk.filter(pk__gt=last_pk)
+        rows = list(chunk[:chunk_size])
+        if not rows:
+            return
+        yield from rows
+        if len(rows) < chunk_size:
+            return
+        last_pk = rows[-1][0]
+
+
+def iter_ndjson(rows):
+    encoder = DjangoJSONEncoder(separators=(',', ':'))
+    for row in rows:
+        yield encoder.encode(dict(zip(EXPORT_FIELDS, row))) + '\n'
+
+
+class _Echo:
+    """File-like object whose ``write`` just hands the line back."""
+
+    def write(self, value):
+        return value
+
+
+def iter_csv(rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(EXPORT_FIELDS)
+    for row in rows:
+        yield writer.writerow(
+            value.isoformat() if hasattr(value, 'isoformat') else value
+            for value in row
+        )
+
+
+EXPORT_FORMATS = {
+    'ndjson': (iter_ndjson, 'application/x-ndjson'),
+    'csv': (iter_csv, 'text/csv'),
+}
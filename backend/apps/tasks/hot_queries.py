@@ -0,0 +1,55 @@
+from django.utils import timezone
+from django.contrib.auth import get_user_model
+
+from taskforge.query_audit import register_hot_query, sample_value
+from .models import OPEN_STATUSES, Task, Comment, TaskHistory
+
+
+@register_hot_query('tasks.by_project_status')
+def tasks_by_project_status():
+    project_id = sample_value(Task, 'project_id')
+    return Task.objects.filter(project_id=project_id, status='TODO')
+
+
+@register_hot_query('tasks.by_assignee_status')
+def tasks_by_assignee_status():
+    return Task.objects.filter(assignee_id=sample_value(get_user_model(), 'id'), status='TODO')
+
+
+@register_hot_query('tasks.by_status')
+def tasks_by_status():
+    return Task.objects.filter(status='REVIEW')
+
+
+@register_hot_query('tasks.by_priority')
+def tasks_by_priority():
+    return Task.objects.filter(priority__gte=4)
+
+
+@register_hot_query('tasks.overdue_projects')
+def overdue_projects():
+    return Task.objects.filter(overdue=True).values_list('project_id', flat=True).distinct()
+
+
+@register_hot_query('tasks.overdue_sweep')
+def overdue_sweep():
+    return Task.objects.filter(
+        overdue=False, status__in=OPEN_STATUSES, due_date__lt=timezone.now()
+    ).order_by('due_date')[:500]
+
+
+@register_hot_query('tasks.keyset_page')
+def tasks_keyset_page():
+    return Task.objects.order_by('-created_at', '-id')[:10]
+
+
+@register_hot_query('comments.for_task')
+def comments_for_task():
+    task_id = sample_value(Comment, 'task_id')
+    return Comment.objects.filter(task_id=task_id).order_by('-created_at')
+
+
+@register_hot_query('history.for_task')
+def history_for_task():
+    task_id = sample_value(TaskHistory, 'task_id')
+    return TaskHistory.objects.filter(task_id=task_id).order_by('-timestamp')
@@ -0,0 +1,58 @@
+import datetime
+import tempfile
+import uuid
+
+from django.conf import settings
+from django.core.files import File
+from django.urls import reverse
+
+from apps.jobs.registry import register_job
+from apps.projects.permissions import load_memberships
+from .export import EXPORT_FORMATS, filter_tasks, iter_task_rows
+from .models import Task
+from .storage import private_storage
+
+
+def export_name(export_id, output):
+    return f'exports/{export_id}.{output}'
+
+
+def export_retention():
+    return datetime.timedelta(hours=getattr(settings, 'EXPORT_RETENTION_HOURS', 24))
+
+
+@register_job('tasks.export')
+def export_tasks(user_id, output='ndjson', filters=None, export_id=None):
+    """
+    Write the user's tasks to ``exports/`` in the private storage. The
+    result's ``file`` is the authenticated download URL; the file is kept
+    for ``EXPORT_RETENTION_HOURS`` (see ``manage.py prune_exports``).
+    """
+    export_id = str(export_id or uuid.uuid4())
+    project_ids = list(load_memberships(user_id))
+    queryset = filter_tasks(Task.objects.filter(project_id__in=project_ids), filters or {})
+    encode, _ = EXPORT_FORMATS[output]
+    
+    rows = 0
+    
+    def counted(iterable):
+        nonlocal rows
+        for row in iterable:
+            rows += 1
+            yield row
+    
+    name = export_name(export_id, output)
+    with tempfile.TemporaryFile() as handle:
+        for chunk in encode(counted(iter_task_rows(queryset))):
+            handle.write(chunk.encode('utf-8'))
+        handle.seek(0)
+        # A retried attempt replaces the file rather than saving beside it.
+        private_storage.delete(name)
+        private_storage.save(name, File(handle))
+    
+    return {
+        "file": reverse('task-export-download', kwargs={'export_id': export_id}),
+        "export_id": export_id,
+        "rows": rows,
+        "output": output,
+    }
@@ -0,0 +1,47 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from taskforge.query_audit import explain, find_full_scans, load_hot_queries
+
+
+class Command(BaseCommand):
+    help = "EXPLAIN every registered hot query and fail if any plan uses a full table scan."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'names', nargs='*',
+            help="Only audit these hot queries (default: all registered).",
+        )
+        parser.add_argument(
+            '--show-plans', action='store_true',
+            help="Print the raw plan rows for each query.",
+        )
+
+    def handle(self, *args, **options):
+        queries = load_hot_queries()
+        names = options['names'] or sorted(queries)
+
+        unknown = [name for name in names if name not in queries]
+        if unknown:
+            raise CommandError(f"Unknown hot queries: {', '.join(unknown)}")
+
+        failures = []
+        for name in names:
+            columns, rows = explain(queries[name]())
+            scans = find_full_scans(columns, rows)
+
+            if scans:
+                failures.append(name)
+                self.stdout.write(self.style.ERROR(
+                    f"FULL SCAN  {name}: {', '.join(scans)}"
+                ))
+            else:
+                self.stdout.write(f"ok         {name}")
+
+            if options['show_plans']:
+                for row in rows:
+                    self.stdout.write(f"    {row}")
+
+        if failures:
+            raise CommandError(f"{len(failures)} hot queries fall back to a full scan")
+
+        self.stdout.write(self.style.SUCCESS(f"{len(names)} hot queries use indexes"))
@@ -0,0 +1,37 @@
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.tasks.jobs import export_retention
+from apps.tasks.storage import private_storage
+
+
+class Command(BaseCommand):
+    help = "Delete background export files older than EXPORT_RETENTION_HOURS."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run', action='store_true',
+            help="Only report what would be removed.",
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - export_retention()
+        removed = 0
+        # Exports used to be written to the default (public) storage; clear
+        # those out on the same schedule.
+        for storage in (private_storage, default_storage):
+            try:
+                _, names = storage.listdir('exports')
+            except FileNotFoundError:
+                continue
+            for name in names:
+                path = f'exports/{name}'
+                if storage.get_modified_time(path) > cutoff:
+                    continue
+                removed += 1
+                if not options['dry_run']:
+                    storage.delete(path)
+
+        verb = "Would remove" if options['dry_run'] else "Removed"
+        self.stdout.write(self.style.SUCCESS(f"{verb} {removed} expired export files"))
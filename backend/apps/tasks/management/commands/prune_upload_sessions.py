@@ -0,0 +1,47 @@
+import os
+import shutil
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.tasks.models import UploadSession
+from apps.tasks.uploads import discard_session, upload_dir
+
+
+class Command(BaseCommand):
+    help = "Delete expired chunked upload sessions and any parts left on disk without a session."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run', action='store_true',
+            help="Only report what would be removed.",
+        )
+
+    def handle(self, *args, **options):
+        expired = UploadSession.objects.filter(expires_at__lte=timezone.now())
+        sessions = 0
+        for session in expired.iterator():
+            sessions += 1
+            if not options['dry_run']:
+                discard_session(session)
+
+        orphans = 0
+        root = upload_dir()
+        names = os.listdir(root) if os.path.isdir(root) else []
+        known = set(UploadSession.objects.values_list('id', flat=True))
+        for name in names:
+            try:
+                session_id = uuid.UUID(name)
+            except ValueError:
+                continue
+            if session_id in known:
+                continue
+            orphans += 1
+            if not options['dry_run']:
+                shutil.rmtree(os.path.join(root, name), ignore_errors=True)
+
+        verb = "Would remove" if options['dry_run'] else "Removed"
+        self.stdout.write(self.style.SUCCESS(
+            f"{verb} {sessions} expired upload sessions and {orphans} orphaned part directories"
+        ))
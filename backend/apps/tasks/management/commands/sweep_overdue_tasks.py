@@ -0,0 +1,45 @@
+import signal
+import threading
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from apps.tasks.overdue import sweep_overdue
+
+
+class Command(BaseCommand):
+    help = "Flag tasks that have run past their due date, once or every --interval seconds."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--loop', action='store_true',
+            help="Keep sweeping until stopped with SIGTERM or Ctrl+C.",
+        )
+        parser.add_argument(
+            '--interval', type=float, default=getattr(settings, 'OVERDUE_SWEEP_INTERVAL', 60),
+            help="Seconds between sweeps with --loop.",
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=getattr(settings, 'OVERDUE_SWEEP_BATCH_SIZE', 500),
+            help="Tasks flagged per transaction.",
+        )
+
+    def handle(self, *args, **options):
+        if not options['loop']:
+            flagged = sweep_overdue(batch_size=options['batch_size'])
+            self.stdout.write(self.style.SUCCESS(f"Flagged {flagged} overdue tasks"))
+            return
+
+        stopping = threading.Event()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, lambda *args: stopping.set())
+
+        while not stopping.is_set():
+            close_old_connections()
+            flagged = sweep_overdue(batch_size=options['batch_size'])
+            if flagged:
+                self.stdout.write(f"Flagged {flagged} overdue tasks")
+            stopping.wait(options['interval'])
+
+        self.stdout.write(self.style.SUCCESS("Overdue sweep stopped"))
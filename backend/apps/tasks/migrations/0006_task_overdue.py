@@ -0,0 +1,43 @@
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+
+def flag_overdue_tasks(apps, schema_editor):
+    Task = apps.get_model('tasks', 'Task')
+    ProjectStats = apps.get_model('projects', 'ProjectStats')
+
+    Task.objects.filter(
+        due_date__lt=timezone.now(), status__in=['TODO', 'IN_PROGRESS', 'REVIEW']
+    ).update(overdue=True)
+
+    counts = Task.objects.filter(project_id=OuterRef('project_id'), overdue=True).order_by().values(
+        'project_id'
+    ).annotate(count=Count('id')).values('count')
+    ProjectStats.objects.update(overdue_tasks=Coalesce(Subquery(counts), Value(0)))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0005_audit_event_time'),
+        ('projects', '0007_audit_event_time'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='overdue',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['overdue', 'status', 'due_date'], name='task_overdue_sweep_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['overdue', 'project', 'due_date'], name='task_overdue_project_idx'),
+        ),
+        migrations.RunPython(flag_overdue_tasks, migrations.RunPython.noop),
+    ]
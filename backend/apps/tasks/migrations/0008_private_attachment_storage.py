@@ -0,0 +1,42 @@
+import apps.tasks.storage
+from apps.tasks.storage import private_storage
+from django.core.files.storage import default_storage
+from django.db import migrations, models
+
+
+def move_files(source, target, names):
+    for name in names:
+        if not source.exists(name) or target.exists(name):
+            continue
+        with source.open(name, 'rb') as handle:
+            target.save(name, handle)
+        source.delete(name)
+
+
+def attachment_names(apps):
+    Attachment = apps.get_model('tasks', 'Attachment')
+    return Attachment.objects.exclude(file='').values_list('file', flat=True).distinct().iterator()
+
+
+def to_private(apps, schema_editor):
+    move_files(default_storage, private_storage, attachment_names(apps))
+
+
+def to_media(apps, schema_editor):
+    move_files(private_storage, default_storage, attachment_names(apps))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0007_chunked_uploads'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='attachment',
+            name='file',
+            field=models.FileField(storage=apps.tasks.storage.get_private_storage, upload_to='attachments/'),
+        ),
+        migrations.RunPython(to_private, to_media),
+    ]
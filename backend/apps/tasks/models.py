@@ -1,6 +1,8 @@
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
 from apps.projects.models import Project
+from .storage import get_private_storage
 import uuid
 
 TASK_STATUS_CHOICES = [
@@ -10,6 +12,9 @@ TASK_STATUS_CHOICES = [
     ('DONE', 'Done'),
 ]
 
+# Statuses a task can be overdue in.
+OPEN_STATUSES = ['TODO', 'IN_PROGRESS', 'REVIEW']
+
 PRIORITY_CHOICES = [
     (1, 'Low'),
     (2, 'Medium'),
@@ -44,6 +49,36 @@ class Task(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     due_date = models.DateTimeField(null=True, blank=True)
     completed = models.BooleanField(default=False)
+    # Set on save and by the overdue sweep (``apps.tasks.overdue``) once
+    # ``due_date`` passes, so overdue lookups never compare against now().
+    overdue = models.BooleanField(default=False, editable=False)
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='task_created_id_idx'),
+            models.Index(fields=['project', 'status'], name='task_project_status_idx'),
+            models.Index(fields=['assignee', 'status'], name='task_assignee_status_idx'),
+            models.Index(fields=['status', 'priority'], name='task_status_priority_idx'),
+            models.Index(fields=['priority'], name='task_priority_idx'),
+            models.Index(fields=['status', 'due_date'], name='task_status_due_idx'),
+            models.Index(fields=['updated_at', 'id'], name='task_updated_id_idx'),
+            models.Index(fields=['overdue', 'status', 'due_date'], name='task_overdue_sweep_idx'),
+            models.Index(fields=['overdue', 'project', 'due_date'], name='task_overdue_project_idx'),
+        ]
+    
+    def save(self, *args, **kwargs):
+        self.overdue = self.compute_overdue()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'status', 'due_date'} & set(update_fields):
+            kwargs['update_fields'] = {*update_fields, 'overdue'}
+        super().save(*args, **kwargs)
+    
+    def compute_overdue(self, now=None):
+        return bool(
+            self.due_date
+            and self.due_date < (now or timezone.now())
+            and self.status in OPEN_STATUSES
+        )
     
     def get_comments(self):
         return Comment.objects.filter(task=self).order_by('-created_at')
@@ -57,10 +92,7 @@ class Task(models.Model):
         self.save()
     
     def is_overdue(self):
-        from django.utils import timezone
-        if self.due_date and timezone.now() > self.due_date and self.status != 'DONE':
-            return True
-        return False
+        return self.overdue
     
     @classmethod
     def get_tasks_by_status(cls, status):
@@ -82,6 +114,12 @@ class Comment(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    class Meta:
+        indexes = [
+            models.Index(fields=['task', 'created_at'], name='comment_task_created_idx'),
+            models.Index(fields=['updated_at', 'id'], name='comment_updated_id_idx'),
+        ]
+    
     def __str__(self):
         return f"Comment by {self.author.email} on {self.task.title}"
 
@@ -106,24 +144,73 @@ class TaskHistory(models.Model):
         on_delete=models.CASCADE,
     )
     action = models.CharField(max_length=255)
-    timestamp = models.DateTimeField(auto_now_add=True)
+    # Set when the change happens, not when the audit writer inserts the row.
+    timestamp = models.DateTimeField(default=timezone.now, editable=False)
     
     class Meta:
         verbose_name_plural = 'Task histories'  
+        indexes = [
+            models.Index(fields=['task', 'timestamp'], name='taskhistory_task_ts_idx'),
+        ]
 
 
 class Attachment(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     task = models.ForeignKey(Task, on_delete=models.CASCADE, related_name='attachments')
     uploader = models.CharField(max_length=255)
-    file = models.FileField(upload_to='attachments/')
+    # Chunked uploads store content once per SHA-256, so identical files
+    # attached to several tasks share one stored file. Files live outside
+    # MEDIA_ROOT and are only served by the download view.
+    file = models.FileField(upload_to='attachments/', storage=get_private_storage)
     filename = models.CharField(max_length=255)
+    content_type = models.CharField(max_length=255, blank=True)
+    size = models.BigIntegerField(null=True, blank=True)
+    sha256 = models.CharField(max_length=64, blank=True, db_index=True)
     created_at = models.DateTimeField(auto_now_add=True)
     
     def __str__(self):
         return self.filename
 
 
+class UploadSession(models.Model):
+    """
+    A chunked attachment upload in progress. Parts are kept on local disk
+    under ``ATTACHMENT_UPLOAD_DIR`` until the upload is completed, aborted
+    or expires (``manage.py prune_upload_sessions``).
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    task = models.ForeignKey(Task, on_delete=models.CASCADE, related_name='upload_sessions')
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='upload_sessions'
+    )
+    filename = models.CharField(max_length=255)
+    content_type = models.CharField(max_length=255, blank=True)
+    size = models.BigIntegerField()
+    chunk_size = models.PositiveIntegerField()
+    # Optional digest announced by the client, checked on completion.
+    sha256 = models.CharField(max_length=64, blank=True)
+    attachment = models.ForeignKey(
+        Attachment, on_delete=models.SET_NULL, null=True, blank=True, related_name='+'
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField()
+    
+    @property
+    def part_count(self):
+        return max(1, -(-self.size // self.chunk_size))
+    
+    def part_size(self, index):
+        """Expected size of part ``index`` (0-based); only the last may be short."""
+        if index == self.part_count - 1:
+            return self.size - self.chunk_size * index
+        return self.chunk_size
+    
+    def __str__(self):
+        return f"Upload of {self.filename} to {self.task_id}"
+
+
 def calculate_task_metrics():
     """
     Calculate task completion metrics.
@@ -0,0 +1,69 @@
+from django.conf import settings
+from django.db import transaction
+from django.dispatch import Signal
+from django.utils import timezone
+
+from apps.projects.cache import invalidate_projects
+from apps.projects.feed import publish_project_events, task_event_data
+from apps.projects.stats import record_task_changes, task_state
+from .models import OPEN_STATUSES, Task
+
+
+# Sent with ``tasks`` after a sweep batch flags them overdue. Tasks that
+# turn overdue through a save (a due date set in the past) are not included.
+task_became_overdue = Signal()
+
+
+def overdue_candidates(now):
+    """
+    Open tasks whose due date has passed but that are not flagged yet.
+
+    Served by ``task_overdue_sweep_idx`` (overdue, status, due_date). A
+    flagged task leaves the range, so the scan only ever touches tasks that
+    are about to change, however many past-due tasks are closed.
+    """
+    return Task.objects.filter(overdue=False, status__in=OPEN_STATUSES, due_date__lt=now)
+
+
+def sweep_overdue(now=None, batch_size=None):
+    """
+    Flag every task that has run past its due date since the last sweep.
+
+    Works in batches of ``OVERDUE_SWEEP_BATCH_SIZE``, each in its own
+    transaction: rows are locked, flagged, counted into ``ProjectStats``,
+    and announced as ``task.overdue`` events once the batch commits.
+    Returns the number of tasks flagged.
+    """
+    now = now or timezone.now()
+    batch_size = batch_size or getattr(settings, 'OVERDUE_SWEEP_BATCH_SIZE', 500)
+    flagged = 0
+    
+    while True:
+        with transaction.atomic():
+            tasks = list(
+                overdue_candidates(now).select_for_update()
+                .order_by('due_date', 'id')[:batch_size]
+            )
+            if not tasks:
+                return flagged
+            
+            Task.objects.filter(id__in=[task.id for task in tasks]).update(overdue=True)
+            
+            changes = []
+            for task in tasks:
+                previous = task_state(task)
+                task.overdue = True
+                changes.append((previous, task_state(task)))
+            record_task_changes(changes)
+            invalidate_projects({task.project_id for task in tasks})
+            
+            publish_project_events(
+                [(task.project_id, 'task.overdue', task_event_data(task)) for task in tasks]
+            )
+            transaction.on_commit(
+                lambda tasks=tasks: task_became_overdue.send(sender=Task, tasks=tasks)
+            )
+        
+        flagged += len(tasks)
+        if len(tasks) < batch_size:
+            return flagged
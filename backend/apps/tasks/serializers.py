@@ -1,13 +1,18 @@
 from rest_framework import serializers
+from rest_framework.reverse import reverse
 from django.utils import timezone
-from .models import Task, Comment, TaskHistory, Attachment
+from .models import Task, Comment, TaskHistory, Attachment, TASK_STATUS_CHOICES, PRIORITY_CHOICES
 from apps.projects.models import Project
 from django.contrib.auth import get_user_model
+from api.fieldsets import SparseFieldsetMixin
+from api.prefetch import QueryPlanMixin
+from taskforge.audit import audit_log
+from taskforge.instrumentation import TimedSerializerMixin
 
 User = get_user_model()
 
 
-class CommentSerializer(serializers.ModelSerializer):
+class CommentSerializer(TimedSerializerMixin, SparseFieldsetMixin, QueryPlanMixin, serializers.ModelSerializer):
     author_email = serializers.EmailField(source='author.email', read_only=True)
     
     class Meta:
@@ -21,14 +26,25 @@ class CommentSerializer(serializers.ModelSerializer):
         return value
 
 
-class AttachmentSerializer(serializers.ModelSerializer):
+class AttachmentSerializer(TimedSerializerMixin, serializers.ModelSerializer):
+    """Attachments are created through chunked uploads (``apps.tasks.uploads``)."""
+    download_url = serializers.SerializerMethodField()
+    
     class Meta:
         model = Attachment
-        fields = ['id', 'task', 'uploader', 'file', 'filename', 'created_at']
-        read_only_fields = ['id', 'created_at']
+        fields = [
+            'id', 'task', 'uploader', 'filename', 'content_type', 'size', 'sha256',
+            'download_url', 'created_at',
+        ]
+        read_only_fields = fields
+    
+    def get_download_url(self, obj):
+        return reverse(
+            'attachment-download', kwargs={'attachment_id': obj.id}, request=self.context.get('request')
+        )
 
 
-class TaskHistorySerializer(serializers.ModelSerializer):
+class TaskHistorySerializer(TimedSerializerMixin, serializers.ModelSerializer):
     user = serializers.PrimaryKeyRelatedField(read_only=True)
     
     class Meta:
@@ -37,11 +53,11 @@ class TaskHistorySerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'task', 'user', 'timestamp']
 
 
-class TaskDetailSerializer(serializers.ModelSerializer):
+class TaskDetailSerializer(TimedSerializerMixin, QueryPlanMixin, serializers.ModelSerializer):
     comments = CommentSerializer(many=True, read_only=True)
     history = TaskHistorySerializer(many=True, read_only=True)
     attachments = AttachmentSerializer(many=True, read_only=True)
-    is_overdue = serializers.SerializerMethodField()
+    is_overdue = serializers.BooleanField(source='overdue', read_only=True)
     days_until_due = serializers.SerializerMethodField()
     
     class Meta:
@@ -53,11 +69,9 @@ class TaskDetailSerializer(serializers.ModelSerializer):
             'is_overdue', 'days_until_due'
         ]
         read_only_fields = ['id', 'creator', 'created_at', 'updated_at']
-    
-    def get_is_overdue(self, obj):
-        if obj.due_date and timezone.now() > obj.due_date and obj.status != 'DONE':
-            return True
-        return False
+        method_field_sources = {
+            'days_until_due': ['due_date'],
+        }
     
     def get_days_until_due(self, obj):
         if not obj.due_date:
@@ -70,7 +84,7 @@ class TaskDetailSerializer(serializers.ModelSerializer):
         return (obj.due_date.date() - now.date()).days
 
 
-class TaskSerializer(serializers.ModelSerializer):
+class TaskSerializer(TimedSerializerMixin, SparseFieldsetMixin, QueryPlanMixin, serializers.ModelSerializer):
     creator_email = serializers.EmailField(source='creator.email', read_only=True)
     project_name = serializers.CharField(source='project.name', read_only=True)
     assignee_name = serializers.SerializerMethodField()
@@ -84,6 +98,9 @@ class TaskSerializer(serializers.ModelSerializer):
             'completed'
         ]
         read_only_fields = ['id', 'creator', 'created_at', 'updated_at']
+        method_field_sources = {
+            'assignee_name': ['assignee.first_name', 'assignee.last_name', 'assignee.email'],
+        }
     
     def get_assignee_name(self, obj):
         if obj.assignee:
@@ -104,7 +121,7 @@ class TaskSerializer(serializers.ModelSerializer):
                 raise serializers.ValidationError({"assignee": "User does not exist"})
         
         if 'status' in data:
-            valid_statuses = [choice[0] for choice in Task.STATUS_CHOICES]
+            valid_statuses = [choice[0] for choice in TASK_STATUS_CHOICES]
             if data['status'] not in valid_statuses:
                 raise serializers.ValidationError({"status": f"Status must be one of: {', '.join(valid_statuses)}"})
         
@@ -118,11 +135,11 @@ class TaskSerializer(serializers.ModelSerializer):
         user = self.context['request'].user
         task = Task.objects.create(creator=user, **validated_data)
 
-        TaskHistory.objects.create(
+        audit_log.record(TaskHistory(
             task=task,
             user=user,
             action=f"Created task: {task.title}"
-        )
+        ))
         
         return task
     
@@ -141,11 +158,11 @@ class TaskSerializer(serializers.ModelSerializer):
         instance.save()
         
         if changes:
-            TaskHistory.objects.create(
+            audit_log.record(TaskHistory(
                 task=instance,
                 user=user,
                 action=f"Updated task: {', '.join(changes)}"
-            )
+            ))
         
         return instance
 
@@ -166,10 +183,50 @@ class CreateCommentSerializer(serializers.ModelSerializer):
             content=validated_data['content']
         )
         
-        TaskHistory.objects.create(
+        audit_log.record(TaskHistory(
             task=task,
             user=user,
             action=f"Added comment: {comment.content[:50]}..."
-        )
+        ))
         
-        return comment
\ No newline at end of file
+        return comment
+
+BULK_TASK_OPERATIONS = ['create', 'update', 'complete', 'reassign']
+
+
+class BulkTaskItemSerializer(serializers.Serializer):
+    """
+    One operation in a bulk request. Related objects are plain ids here so
+    the whole batch can be resolved with a handful of queries.
+    """
+    op = serializers.ChoiceField(choices=BULK_TASK_OPERATIONS)
+    id = serializers.UUIDField(required=False)
+    title = serializers.CharField(max_length=255, required=False)
+    description = serializers.CharField(allow_blank=True, required=False)
+    project = serializers.UUIDField(required=False)
+    assignee = serializers.UUIDField(required=False, allow_null=True)
+    status = serializers.ChoiceField(choices=TASK_STATUS_CHOICES, required=False)
+    priority = serializers.ChoiceField(choices=PRIORITY_CHOICES, required=False)
+    due_date = serializers.DateTimeField(required=False, allow_null=True)
+    completed = serializers.BooleanField(required=False)
+    
+    def validate(self, data):
+        op = data['op']
+        
+        if op == 'create':
+            missing = [field for field in ('title', 'project') if field not in data]
+            if missing:
+                raise serializers.ValidationError({field: "This field is required." for field in missing})
+            if 'id' in data:
+                raise serializers.ValidationError({"id": "Cannot be set when creating a task"})
+        elif 'id' not in data:
+            raise serializers.ValidationError({"id": "This field is required."})
+        
+        if op == 'reassign' and 'assignee' not in data:
+            raise serializers.ValidationError({"assignee": "This field is required."})
+        
+        return data
+
+
+class BulkTaskSerializer(serializers.Serializer):
+    operations = BulkTaskItemSerializer(many=True, allow_empty=False, max_length=500)
@@ -0,0 +1,29 @@
+import os
+
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+from django.utils.functional import LazyObject
+
+
+class PrivateFileSystemStorage(FileSystemStorage):
+    """
+    Files kept outside ``MEDIA_ROOT``. They have no public URL: views that
+    check access stream them (or hand them to the front-end server).
+    """
+
+    def url(self, name):
+        raise ValueError("Private files have no public URL")
+
+
+class PrivateStorage(LazyObject):
+    def _setup(self):
+        location = getattr(settings, 'PRIVATE_MEDIA_ROOT', None) or os.path.join(settings.BASE_DIR, 'private')
+        self._wrapped = PrivateFileSystemStorage(location=location)
+
+
+private_storage = PrivateStorage()
+
+
+def get_private_storage():
+    """``storage`` callable for file fields, so migrations don't record the path."""
+    return private_storage
@@ -0,0 +1,56 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from rest_framework.test import APITestCase
+
+from api.testing import assert_constant_query_count
+from apps.projects.models import Project, ProjectMember
+from .models import Comment, Task
+
+User = get_user_model()
+
+
+class TaskQueryCountTests(APITestCase):
+    """Listing tasks and comments costs the same number of queries at any size."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email='owner@example.com')
+        cls.project = Project.objects.create(name='Queries')
+        ProjectMember.objects.create(project=cls.project, user=cls.user, role='OWNER')
+
+        cls.assignees = [
+            User.objects.create_user(email=f'assignee{i}@example.com')
+            for i in range(50)
+        ]
+        for i, assignee in enumerate(cls.assignees):
+            Task.objects.create(
+                title=f'Task {i}', project=cls.project, creator=cls.user, assignee=assignee
+            )
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_authenticate(self.user)
+
+    def test_task_list(self):
+        def list_tasks(page_size):
+            response = self.client.get(f'/api/tasks/?page_size={page_size}')
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(len(response.data['results']), page_size)
+
+        assert_constant_query_count(list_tasks)
+
+    def test_task_comments(self):
+        tasks = {}
+        for size in (1, 10, 50):
+            task = Task.objects.create(title=f'{size} comments', project=self.project, creator=self.user)
+            Comment.objects.bulk_create(
+                Comment(task=task, author=self.assignees[i], content=f'Comment {i}') for i in range(size)
+            )
+            tasks[size] = task
+
+        def list_comments(size):
+            response = self.client.get(f'/api/tasks/{tasks[size].id}/comments/')
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(len(response.data), size)
+
+        assert_constant_query_count(list_comments)
@@ -0,0 +1,387 @@
+import datetime
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+
+from django.conf import settings
+from django.core.files import File
+from django.db import transaction
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.utils.http import content_disposition_header, parse_etags, quote_etag
+from rest_framework import serializers, status
+from rest_framework.decorators import api_view
+from rest_framework.exceptions import PermissionDenied, ValidationError
+from rest_framework.response import Response
+from rest_framework.reverse import reverse
+
+from apps.projects.permissions import member_project_ids, project_role
+from .models import Attachment, Task, UploadSession
+from .serializers import AttachmentSerializer
+from .storage import private_storage
+
+
+COPY_BLOCK_SIZE = 64 * 1024
+
+_range = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def upload_dir():
+    return getattr(settings, 'ATTACHMENT_UPLOAD_DIR', os.path.join(tempfile.gettempdir(), 'taskforge-uploads'))
+
+
+def session_dir(session):
+    return os.path.join(upload_dir(), str(session.id))
+
+
+def part_path(session, index):
+    return os.path.join(session_dir(session), f'{index:06d}.part')
+
+
+def received_parts(session):
+    """Indexes of the parts already on disk."""
+    try:
+        names = os.listdir(session_dir(session))
+    except FileNotFoundError:
+        return []
+    return sorted(int(name[:-5]) for name in names if name.endswith('.part'))
+
+
+def write_part(session, index, stream):
+    """
+    Copy a part from ``stream`` to disk in ``COPY_BLOCK_SIZE`` blocks.
+
+    The part is written to a temporary name and renamed into place, so a
+    dropped connection never leaves a truncated part behind and re-sending
+    a part simply replaces it.
+    """
+    expected = session.part_size(index)
+    directory = session_dir(session)
+    os.makedirs(directory, exist_ok=True)
+    fd, temporary = tempfile.mkstemp(dir=directory, prefix=f'.{index:06d}-')
+    try:
+        size = 0
+        with os.fdopen(fd, 'wb') as handle:
+            while True:
+                block = stream.read(COPY_BLOCK_SIZE) if stream is not None else b''
+                if not block:
+                    break
+                size += len(block)
+                if size > expected:
+                    raise ValidationError({"part": f"Part {index} must be {expected} bytes"})
+                handle.write(block)
+        if size != expected:
+            raise ValidationError({"part": f"Part {index} must be {expected} bytes, got {size}"})
+        os.replace(temporary, part_path(session, index))
+    except BaseException:
+        if os.path.exists(temporary):
+            os.unlink(temporary)
+        raise
+    return size
+
+
+def assemble(session, handle):
+    """Concatenate the parts into ``handle``; returns the SHA-256 hex digest."""
+    digest = hashlib.sha256()
+    for index in range(session.part_count):
+        with open(part_path(session, index), 'rb') as part:
+            while True:
+                block = part.read(COPY_BLOCK_SIZE)
+                if not block:
+                    break
+                digest.update(block)
+                handle.write(block)
+    handle.flush()
+    handle.seek(0)
+    return digest.hexdigest()
+
+
+def blob_name(sha256):
+    return f'attachments/{sha256[:2]}/{sha256}'
+
+
+def existing_blob(sha256, size, project_ids=None):
+    """
+    The stored name of identical content, if any is still in storage.
+
+    Only pass a digest computed from bytes the server received itself,
+    unless ``project_ids`` limits the match to attachments of projects the
+    caller can already read: a client-declared digest proves nothing about
+    holding the content.
+    """
+    attachments = Attachment.objects.filter(sha256=sha256, size=size).exclude(file='')
+    if project_ids is not None:
+        attachments = attachments.filter(task__project_id__in=project_ids)
+    name = attachments.values_list('file', flat=True).first()
+    if name and private_storage.exists(name):
+        return name
+    if project_ids is not None:
+        return None
+    name = blob_name(sha256)
+    return name if private_storage.exists(name) else None
+
+
+def discard_session(session):
+    shutil.rmtree(session_dir(session), ignore_errors=True)
+    session.delete()
+
+
+def attach(session, name, sha256, user):
+    return Attachment.objects.create(
+        task=session.task,
+        uploader=user.email,
+        file=name,
+        filename=session.filename,
+        content_type=session.content_type,
+        size=session.size,
+        sha256=sha256,
+    )
+
+
+def check_task_access(request, task):
+    if project_role(request, task.project_id) is None:
+        raise PermissionDenied("You are not a member of this project")
+
+
+class UploadInitSerializer(serializers.Serializer):
+    filename = serializers.CharField(max_length=255)
+    size = serializers.IntegerField(min_value=0)
+    content_type = serializers.CharField(max_length=255, required=False, allow_blank=True)
+    sha256 = serializers.RegexField(r'^[0-9a-fA-F]{64}$', required=False)
+
+    def validate_size(self, value):
+        limit = getattr(settings, 'ATTACHMENT_MAX_SIZE', 5 * 1024 ** 3)
+        if value > limit:
+            raise serializers.ValidationError(f"Attachments are limited to {limit} bytes")
+        return value
+
+
+def session_data(request, session):
+    received = received_parts(session)
+    return {
+        'id': session.id,
+        'filename': session.filename,
+        'size': session.size,
+        'chunk_size': session.chunk_size,
+        'parts': session.part_count,
+        'received': received,
+        'expires_at': session.expires_at,
+        'url': reverse('upload-session', kwargs={'session_id': session.id}, request=request),
+    }
+
+
+@api_view(['POST'])
+def start_upload(request, task_id):
+    """
+    Start a chunked upload of an attachment to the task.
+
+    Send ``filename``, ``size`` and optionally ``content_type`` and the
+    file's ``sha256``. When the digest matches an attachment in one of the
+    caller's own projects, the attachment is created straight away
+    (``201`` with the attachment). Otherwise the response is the new upload session: PUT
+    each part as the raw request body to ``<url>parts/<index>/`` (0-based,
+    ``chunk_size`` bytes except the last), then POST ``<url>complete/``.
+    GET the session to see which parts arrived after an interruption.
+    """
+    task = get_object_or_404(Task, id=task_id)
+    check_task_access(request, task)
+
+    serializer = UploadInitSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    data = serializer.validated_data
+    sha256 = data.get('sha256', '').lower()
+
+    if sha256:
+        name = existing_blob(sha256, data['size'], project_ids=member_project_ids(request))
+        if name:
+            attachment = Attachment.objects.create(
+                task=task, uploader=request.user.email, file=name, filename=data['filename'],
+                content_type=data.get('content_type', ''), size=data['size'], sha256=sha256,
+            )
+            context = {'request': request}
+            return Response(
+                {'attachment': AttachmentSerializer(attachment, context=context).data, 'deduplicated': True},
+                status=status.HTTP_201_CREATED,
+            )
+
+    expiry = datetime.timedelta(hours=getattr(settings, 'ATTACHMENT_UPLOAD_EXPIRY_HOURS', 24))
+    session = UploadSession.objects.create(
+        task=task,
+        user=request.user,
+        filename=data['filename'],
+        content_type=data.get('content_type', ''),
+        size=data['size'],
+        chunk_size=getattr(settings, 'ATTACHMENT_CHUNK_SIZE', 8 * 1024 * 1024),
+        sha256=sha256,
+        expires_at=timezone.now() + expiry,
+    )
+    return Response(session_data(request, session), status=status.HTTP_201_CREATED)
+
+
+def get_session(request, session_id):
+    session = get_object_or_404(
+        UploadSession.objects.select_related('task'), id=session_id, user=request.user
+    )
+    if session.attachment_id is None and session.expires_at <= timezone.now():
+        discard_session(session)
+        raise ValidationError({"upload": "Upload session expired"})
+    return session
+
+
+@api_view(['GET', 'DELETE'])
+def upload_session(request, session_id):
+    """Upload progress (``received`` part indexes), or ``DELETE`` to abort."""
+    session = get_session(request, session_id)
+    if request.method == 'DELETE':
+        discard_session(session)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+    return Response(session_data(request, session))
+
+
+@api_view(['PUT'])
+def upload_part(request, session_id, index):
+    """Store one part, streamed to disk from the raw request body."""
+    session = get_session(request, session_id)
+    if session.attachment_id is not None:
+        raise ValidationError({"upload": "Upload already completed"})
+    if index >= session.part_count:
+        raise ValidationError({"part": f"Part index must be below {session.part_count}"})
+
+    size = write_part(session, index, request.stream)
+    return Response({'index': index, 'size': size})
+
+
+@api_view(['POST'])
+def complete_upload(request, session_id):
+    """
+    Assemble the parts into the attachment. Content that is already stored
+    (by digest of the uploaded bytes) is not stored again; the new
+    attachment points at the existing file.
+    """
+    session = get_session(request, session_id)
+    if session.attachment_id is not None:
+        context = {'request': request}
+        return Response(AttachmentSerializer(session.attachment, context=context).data)
+    check_task_access(request, session.task)
+
+    missing = sorted(set(range(session.part_count)) - set(received_parts(session)))
+    if missing:
+        raise ValidationError({"parts": f"Missing parts: {missing[:20]}"})
+
+    with tempfile.TemporaryFile(dir=session_dir(session)) as handle:
+        sha256 = assemble(session, handle)
+        if session.sha256 and session.sha256 != sha256:
+            discard_session(session)
+            raise ValidationError({"sha256": "Uploaded content does not match the announced digest"})
+
+        name = existing_blob(sha256, session.size)
+        if name is None:
+            name = private_storage.save(blob_name(sha256), File(handle))
+
+    with transaction.atomic():
+        attachment = attach(session, name, sha256, request.user)
+        session.attachment = attachment
+        session.save(update_fields=['attachment'])
+    shutil.rmtree(session_dir(session), ignore_errors=True)
+
+    context = {'request': request}
+    return Response(AttachmentSerializer(attachment, context=context).data, status=status.HTTP_201_CREATED)
+
+
+def parse_range(header, size):
+    """
+    ``(start, end)`` (inclusive) for a single ``bytes=`` range, ``None`` to
+    serve the whole file, or ``False`` if the range cannot be satisfied.
+    Multi-range requests get the whole file.
+    """
+    match = _range.match(header.strip()) if header else None
+    if match is None:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        start, end = max(size - int(last), 0), size - 1
+    else:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        return False
+    return start, end
+
+
+def iter_range(handle, start, length):
+    try:
+        handle.seek(start)
+        while length > 0:
+            block = handle.read(min(COPY_BLOCK_SIZE, length))
+            if not block:
+                return
+            length -= len(block)
+            yield block
+    finally:
+        handle.close()
+
+
+@api_view(['GET'])
+def download_attachment(request, attachment_id):
+    """
+    Download an attachment. Supports ``Range`` requests (resuming, seeking
+    in media) and ``If-None-Match``. With ``ATTACHMENT_SENDFILE`` set, the
+    body is handed to the front-end server (``X-Accel-Redirect`` or
+    ``X-Sendfile``) instead of passing through the worker; otherwise whole
+    files go out through ``FileResponse``, which uses the server's
+    ``wsgi.file_wrapper`` (``sendfile``) where available.
+    """
+    attachment = get_object_or_404(Attachment.objects.select_related('task'), id=attachment_id)
+    check_task_access(request, attachment.task)
+
+    name = attachment.file.name
+    etag = quote_etag(attachment.sha256) if attachment.sha256 else None
+    if etag and etag in parse_etags(request.META.get('HTTP_IF_NONE_MATCH', '')):
+        response = HttpResponse(status=status.HTTP_304_NOT_MODIFIED)
+        response['ETag'] = etag
+        return response
+
+    content_type = attachment.content_type or 'application/octet-stream'
+    sendfile = getattr(settings, 'ATTACHMENT_SENDFILE', None)
+    if sendfile == 'x-accel-redirect':
+        response = HttpResponse(content_type=content_type)
+        response['X-Accel-Redirect'] = getattr(settings, 'ATTACHMENT_SENDFILE_PREFIX', '/protected/') + name
+    elif sendfile == 'x-sendfile':
+        response = HttpResponse(content_type=content_type)
+        response['X-Sendfile'] = private_storage.path(name)
+    else:
+        size = attachment.size if attachment.size is not None else private_storage.size(name)
+        byte_range = None
+        if_range = request.META.get('HTTP_IF_RANGE')
+        if not if_range or if_range == etag:
+            byte_range = parse_range(request.META.get('HTTP_RANGE'), size)
+
+        if byte_range is False:
+            response = HttpResponse(status=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE)
+            response['Content-Range'] = f'bytes */{size}'
+            return response
+
+        if byte_range:
+            start, end = byte_range
+            response = StreamingHttpResponse(
+                iter_range(private_storage.open(name, 'rb'), start, end - start + 1),
+                status=status.HTTP_206_PARTIAL_CONTENT,
+                content_type=content_type,
+            )
+            response['Content-Range'] = f'bytes {start}-{end}/{size}'
+            response['Content-Length'] = str(end - start + 1)
+        else:
+            response = FileResponse(private_storage.open(name, 'rb'), content_type=content_type)
+            response['Content-Length'] = str(size)
+
+    response['Accept-Ranges'] = 'bytes'
+    response['Content-Disposition'] = content_disposition_header(True, attachment.filename)
+    if etag:
+        response['ETag'] = etag
+    response['Cache-Control'] = 'private'
+    return response
@@ -1,15 +1,29 @@
+import uuid
+
 from django.shortcuts import get_object_or_404
-from django.http import JsonResponse
+from django.http import FileResponse, JsonResponse, StreamingHttpResponse
+from django.utils import timezone
 from django.db import connection
 from rest_framework import viewsets, status
 from rest_framework.decorators import api_view, action
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.exceptions import PermissionDenied
 
 from .models import Task, Comment, TaskHistory
-from .serializers import TaskSerializer, CommentSerializer
+from .serializers import TaskSerializer, CommentSerializer, BulkTaskSerializer
+from .bulk import apply_bulk_operations
+from .export import EXPORT_FORMATS, filter_tasks, iter_task_rows
+from .jobs import export_name, export_retention
+from .storage import private_storage
+from apps.jobs.models import Job
+from apps.jobs.registry import enqueue
+from apps.jobs.views import job_accepted
 from apps.projects.models import Project
+from apps.projects.permissions import member_project_ids, project_role
+from api.pagination import KeysetPagination
+from taskforge.audit import audit_log
 
 
 class TaskViewSet(viewsets.ModelViewSet):
@@ -19,43 +33,95 @@ class TaskViewSet(viewsets.ModelViewSet):
     queryset = Task.objects.all()
     serializer_class = TaskSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = KeysetPagination
     
     def get_queryset(self):
         """
         Optionally restricts the returned tasks by filtering against
         query parameters in the URL.
         """
-        queryset = Task.objects.all()
-        
-        project_id = self.request.query_params.get('project')
-        if project_id:
-            queryset = queryset.filter(project_id=project_id)
-            
-        status = self.request.query_params.get('status')
-        if status:
-            queryset = queryset.filter(status=status)
-            
-        assignee = self.request.query_params.get('assignee')
-        if assignee:
-            queryset = queryset.filter(assignee_id=assignee)
+        queryset = self.filter_by_params(Task.objects.all())
             
-        return queryset
+        return self.get_serializer_class().setup_queryset(
+            queryset, self.get_serializer_context()
+        )
+    
+    def filter_by_params(self, queryset):
+        return filter_tasks(queryset, self.request.query_params)
     
     def perform_create(self, serializer):
         project_id = self.request.data.get('project')
-        project = get_object_or_404(Project, id=project_id)
-        
-        if not project.members.filter(id=self.request.user.id).exists():
+        if project_role(self.request, project_id) is None:
+            get_object_or_404(Project, id=project_id)
             raise PermissionDenied("You are not a member of this project")
         
-        serializer.save(creator=self.request.user)
+        # TaskSerializer.create sets the creator and writes the history row.
+        serializer.save()
+    
+    @action(detail=False, methods=['get'])
+    def export(self, request):
+        """
+        Stream the caller's tasks as NDJSON (default) or CSV.
+        
+        Accepts the same ``project``/``status``/``assignee`` filters as the
+        list endpoint, plus ``?output=csv``. With ``?background=true`` the
+        file is written by a background job instead and the response is
+        ``202`` with the job, whose ``result["file"]`` is the URL to download
+        it from (``download_export``).
+        """
+        output = request.query_params.get('output', 'ndjson')
+        if output not in EXPORT_FORMATS:
+            return Response({"error": f"output must be one of: {', '.join(EXPORT_FORMATS)}"},
+                            status=status.HTTP_400_BAD_REQUEST)
+        
+        if request.query_params.get('background', '').lower() in ('1', 'true', 'yes'):
+            filters = {
+                name: request.query_params[name]
+                for name in ('project', 'status', 'assignee', 'overdue')
+                if request.query_params.get(name)
+            }
+            job = enqueue(
+                'tasks.export', user=request.user,
+                user_id=request.user.id, output=output, filters=filters, export_id=str(uuid.uuid4()),
+            )
+            return job_accepted(request, job)
+        
+        queryset = self.filter_by_params(Task.objects.filter(project_id__in=member_project_ids(request)))
+        
+        encode, content_type = EXPORT_FORMATS[output]
+        response = StreamingHttpResponse(encode(iter_task_rows(queryset)), content_type=content_type)
+        response['Content-Disposition'] = f'attachment; filename="tasks.{output}"'
+        return response
+    
+    @action(detail=False, methods=['post'])
+    def bulk(self, request):
+        """
+        Create, update, complete or reassign many tasks at once.
+        
+        Expects ``{"operations": [{"op": "complete", "id": ...}, ...]}``.
+        Either every operation is applied in one transaction, or none is and
+        the per-item errors are returned.
+        """
+        serializer = BulkTaskSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
         
-        task = serializer.instance
-        TaskHistory.objects.create(
-            task=task,
-            user=self.request.user,
-            action=f"Created task: {task.title}"
+        results, applied = apply_bulk_operations(
+            request.user, serializer.validated_data['operations']
         )
+        if not applied:
+            return Response({"results": results}, status=status.HTTP_400_BAD_REQUEST)
+        
+        task_ids = [result['id'] for result in results]
+        tasks = TaskSerializer.setup_queryset(Task.objects.filter(id__in=task_ids))
+        task_data = {
+            task['id']: task
+            for task in TaskSerializer(tasks, many=True, context=self.get_serializer_context()).data
+        }
+        for result in results:
+            result['task'] = task_data.get(str(result['id']))
+        
+        return Response({"results": results})
 
 
 @api_view(['GET'])
@@ -73,7 +139,7 @@ def task_list(request):
             'id': str(task.id),
             'title': task.title,
             'status': task.status,
-            'assignee': str(task.assignee.id) if task.assignee else None,
+            'assignee': str(task.assignee_id) if task.assignee_id else None,
             'due_date': task.due_date,
         })
     
@@ -90,8 +156,9 @@ class CommentListAPIView(APIView):
         except Task.DoesNotExist:
             return Response({"error": "Task not found"}, status=status.HTTP_404_NOT_FOUND)
         
-        comments = Comment.objects.filter(task=task)
-        serializer = CommentSerializer(comments, many=True)
+        context = {'request': request}
+        comments = CommentSerializer.setup_queryset(Comment.objects.filter(task=task), context)
+        serializer = CommentSerializer(comments, many=True, context=context)
         return Response(serializer.data)
     
     def post(self, request, task_id):
@@ -133,11 +200,11 @@ def mark_task_complete(request, task_id):
     task.completed = True
     task.save()
     
-    TaskHistory.objects.create(
+    audit_log.record(TaskHistory(
         task=task,
         user=request.user,
         action="Marked task as complete"
-    )
+    ))
     
     return Response({"status": "success"})
 
@@ -150,10 +217,33 @@ def assign(self, request, pk=None):
     task.assignee_id = user_id
     task.save()
     
-    TaskHistory.objects.create(
+    audit_log.record(TaskHistory(
         task=task,
         user=request.user,
         action=f"Assigned task to user {user_id}"
-    )
+    ))
     
     return Response({"status": "success"})
+
+
+@api_view(['GET'])
+def download_export(request, export_id):
+    """
+    Download the file written by a background export. Only the user who
+    started the export can fetch it; after ``EXPORT_RETENTION_HOURS`` the
+    file is gone and the answer is ``410``.
+    """
+    job = get_object_or_404(
+        Job, name='tasks.export', status='SUCCEEDED', created_by=request.user,
+        result__export_id=str(export_id),
+    )
+    output = job.result['output']
+    name = export_name(export_id, output)
+    if job.finished_at + export_retention() <= timezone.now() or not private_storage.exists(name):
+        return Response({"error": "Export has expired"}, status=status.HTTP_410_GONE)
+    
+    _, content_type = EXPORT_FORMATS[output]
+    return FileResponse(
+        private_storage.open(name, 'rb'), as_attachment=True,
+        filename=f'tasks.{output}', content_type=content_type,
+    )
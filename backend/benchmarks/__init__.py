@@ -0,0 +1,5 @@
+"""
+HTTP benchmarks for the API hot paths.
+
+Run ``python -m benchmarks run --help`` from the backend directory.
+"""
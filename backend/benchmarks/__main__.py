@@ -0,0 +1,48 @@
+import argparse
+import os
+import sys
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run = subparsers.add_parser('run', help="Seed a dataset and benchmark the API.")
+    run.add_argument('--settings', default='benchmarks.settings_sqlite',
+                     help="Django settings module (use taskforge.settings for MySQL).")
+    run.add_argument('--users', type=int, default=200)
+    run.add_argument('--projects', type=int, default=50)
+    run.add_argument('--tasks', type=int, default=20000)
+    run.add_argument('--seed', type=int, default=0)
+    run.add_argument('--iterations', type=int, default=50)
+    run.add_argument('--warmup', type=int, default=3)
+    run.add_argument('--scenario', action='append', dest='scenarios',
+                     help="Only run this scenario (repeatable).")
+    run.add_argument('--keepdb', action='store_true',
+                     help="Reuse the benchmark database and its data between runs.")
+    run.add_argument('--output', default='benchmark-results.json')
+
+    compare = subparsers.add_parser('compare', help="Flag regressions between two result files.")
+    compare.add_argument('baseline')
+    compare.add_argument('current')
+    compare.add_argument('--threshold', type=float, default=0.10,
+                         help="Allowed relative p95 slowdown before flagging (default 0.10).")
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'compare':
+        from .compare import compare_files
+        return compare_files(args.baseline, args.current, args.threshold)
+
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    os.environ['DJANGO_SETTINGS_MODULE'] = args.settings
+
+    import django
+    django.setup()
+
+    from .runner import run_benchmarks
+    return run_benchmarks(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
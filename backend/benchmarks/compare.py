@@ -0,0 +1,56 @@
+import json
+
+
+def compare_results(baseline, current, threshold):
+    """
+    Return ``(rows, regressions)`` comparing two benchmark reports.
+
+    A scenario regresses when its p95 latency grows by more than
+    ``threshold`` (a fraction) or it issues more queries per request.
+    """
+    rows = []
+    regressions = []
+    for name, before in baseline['results'].items():
+        after = current['results'].get(name)
+        if after is None:
+            rows.append((name, 'missing from current run'))
+            continue
+
+        reasons = []
+        if before['p95_ms'] > 0:
+            change = after['p95_ms'] / before['p95_ms'] - 1
+        else:
+            change = 0.0
+        if change > threshold:
+            reasons.append(f"p95 +{change:.0%}")
+        if after['queries_per_request'] > before['queries_per_request']:
+            reasons.append(
+                f"queries {before['queries_per_request']} -> {after['queries_per_request']}"
+            )
+
+        line = (
+            f"p95 {before['p95_ms']:.2f} -> {after['p95_ms']:.2f}ms ({change:+.0%}), "
+            f"queries {before['queries_per_request']} -> {after['queries_per_request']}"
+        )
+        if reasons:
+            regressions.append((name, reasons))
+            line += f"  REGRESSION: {', '.join(reasons)}"
+        rows.append((name, line))
+    return rows, regressions
+
+
+def compare_files(baseline_path, current_path, threshold):
+    with open(baseline_path) as handle:
+        baseline = json.load(handle)
+    with open(current_path) as handle:
+        current = json.load(handle)
+
+    rows, regressions = compare_results(baseline, current, threshold)
+    for name, line in rows:
+        print(f"{name:<20} {line}")
+
+    if regressions:
+        print(f"{len(regressions)} scenario(s) regressed")
+        return 1
+    print("No regressions")
+    return 0
@@ -0,0 +1,274 @@
+import datetime
+import json
+import platform
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.management import call_command
+from django.db import connection
+from django.db.backends.utils import CursorWrapper
+from django.db.models import Count
+from django.test import Client
+
+from apps.accounts.authentication import generate_jwt_token
+from apps.projects.models import Project, ProjectMember
+from apps.tasks.models import Task, Comment
+
+
+PASSWORD = 'Password123!'
+
+# p95 latency budgets in milliseconds. `run` exits non-zero when a scenario
+# misses its target, so the search targets are checked on every run against
+# the generate_data dataset (scale it with --tasks for the large case).
+LATENCY_TARGETS = {
+    'search_tasks': 100,
+    'search_comments': 100,
+    'search_projects': 50,
+}
+
+
+class CountingCursor(CursorWrapper):
+    """Cursor wrapper that tallies statements executed and rows fetched."""
+
+    def __init__(self, cursor, db, counters):
+        super().__init__(cursor, db)
+        self.counters = counters
+
+    def execute(self, sql, params=None):
+        self.counters['queries'] += 1
+        return super().execute(sql, params)
+
+    def executemany(self, sql, param_list):
+        self.counters['queries'] += 1
+        return super().executemany(sql, param_list)
+
+    def fetchone(self):
+        with self.db.wrap_database_errors:
+            row = self.cursor.fetchone()
+        if row is not None:
+            self.counters['rows'] += 1
+        return row
+
+    def fetchmany(self, size=None):
+        with self.db.wrap_database_errors:
+            rows = self.cursor.fetchmany() if size is None else self.cursor.fetchmany(size)
+        self.counters['rows'] += len(rows)
+        return rows
+
+    def fetchall(self):
+        with self.db.wrap_database_errors:
+            rows = self.cursor.fetchall()
+        self.counters['rows'] += len(rows)
+        return rows
+
+    def __iter__(self):
+        for row in super().__iter__():
+            self.counters['rows'] += 1
+            yield row
+
+
+@contextmanager
+def count_queries(counters):
+    def make_cursor(cursor):
+        return CountingCursor(cursor, connection, counters)
+
+    connection.make_cursor = make_cursor
+    connection.make_debug_cursor = make_cursor
+    try:
+        yield counters
+    finally:
+        del connection.make_cursor
+        del connection.make_debug_cursor
+
+
+class Fixture:
+    """Ids and clients the scenarios draw from."""
+
+    def __init__(self):
+        owner = ProjectMember.objects.filter(role='OWNER').select_related('user').order_by('id').first()
+        if owner is None:
+            raise RuntimeError("The benchmark database has no projects")
+
+        self.user = owner.user
+        project_ids = list(
+            ProjectMember.objects.filter(user=self.user).values_list('project_id', flat=True)
+        )
+        busiest = Task.objects.filter(project_id__in=project_ids).values('project_id').annotate(
+            count=Count('id')
+        ).order_by('-count').first()
+        self.project_id = busiest['project_id'] if busiest else project_ids[0]
+
+        self.task_ids = list(
+            Task.objects.filter(project_id=self.project_id).values_list('id', flat=True)[:200]
+        )
+        self.commented_task_ids = list(
+            Comment.objects.filter(task__project_id=self.project_id)
+            .values_list('task_id', flat=True).distinct()[:200]
+        ) or self.task_ids
+        self.search_queries = [
+            ' '.join(title.split()[:2])
+            for title in Task.objects.filter(project_id=self.project_id).values_list('title', flat=True)[:50]
+        ] or ['task']
+        self.comment_queries = [
+            ' '.join(content.split()[:2])
+            for content in Comment.objects.filter(task__project_id=self.project_id)
+            .values_list('content', flat=True)[:50]
+        ] or self.search_queries
+        self.project_queries = [
+            name.split()[0]
+            for name in Project.objects.filter(id__in=project_ids).values_list('name', flat=True)[:50]
+            if name.split()
+        ] or ['project']
+
+        token = generate_jwt_token(self.user)
+        self.client = Client(SERVER_NAME='localhost', HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.anonymous = Client(SERVER_NAME='localhost')
+
+
+def _pick(ids, iteration):
+    return ids[iteration % len(ids)]
+
+
+SCENARIOS = {
+    'login': lambda f, i: f.anonymous.post(
+        '/api/auth/login/', {'email': f.user.email, 'password': PASSWORD},
+        content_type='application/json',
+    ),
+    'tasks_list': lambda f, i: f.client.get(
+        '/api/tasks/', {'project': f.project_id, 'page_size': 50}
+    ),
+    'task_retrieve': lambda f, i: f.client.get(f'/api/tasks/{_pick(f.task_ids, i)}/'),
+    'task_create': lambda f, i: f.client.post(
+        '/api/tasks/', {'title': f'Benchmark task {i}', 'project': str(f.project_id)},
+        content_type='application/json',
+    ),
+    'projects_list': lambda f, i: f.client.get('/api/projects/'),
+    'project_retrieve': lambda f, i: f.client.get(f'/api/projects/{f.project_id}/'),
+    'project_stats': lambda f, i: f.client.get(f'/api/projects/{f.project_id}/stats/'),
+    'project_activities': lambda f, i: f.client.get(f'/api/projects/{f.project_id}/activities/'),
+    'task_comments': lambda f, i: f.client.get(
+        f'/api/tasks/{_pick(f.commented_task_ids, i)}/comments/'
+    ),
+    'search_tasks': lambda f, i: f.client.get('/api/search/', {'q': _pick(f.search_queries, i)}),
+    'search_comments': lambda f, i: f.client.get('/api/search/', {'q': _pick(f.comment_queries, i)}),
+    'search_projects': lambda f, i: f.client.get(
+        '/api/projects/search/', {'q': _pick(f.project_queries, i)}
+    ),
+}
+
+
+def missed_targets(results, targets=LATENCY_TARGETS):
+    """``(name, p95_ms, target_ms)`` for every scenario over its p95 target."""
+    return [
+        (name, results[name]['p95_ms'], target)
+        for name, target in targets.items()
+        if name in results and results[name]['p95_ms'] > target
+    ]
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    index = max(int(round(fraction * len(ordered) + 0.5)) - 1, 0)
+    return ordered[min(index, len(ordered) - 1)]
+
+
+def run_scenario(fixture, scenario, iterations, warmup):
+    for iteration in range(warmup):
+        scenario(fixture, iteration)
+
+    durations = []
+    queries = []
+    rows = []
+    statuses = {}
+    for iteration in range(iterations):
+        counters = {'queries': 0, 'rows': 0}
+        with count_queries(counters):
+            started = time.perf_counter()
+            response = scenario(fixture, warmup + iteration)
+            if response.streaming:
+                for _ in response.streaming_content:
+                    pass
+            durations.append((time.perf_counter() - started) * 1000)
+
+        queries.append(counters['queries'])
+        rows.append(counters['rows'])
+        statuses[str(response.status_code)] = statuses.get(str(response.status_code), 0) + 1
+
+    return {
+        'iterations': iterations,
+        'p50_ms': round(percentile(durations, 0.50), 3),
+        'p95_ms': round(percentile(durations, 0.95), 3),
+        'p99_ms': round(percentile(durations, 0.99), 3),
+        'mean_ms': round(statistics.fmean(durations), 3),
+        'queries_per_request': statistics.median(queries),
+        'max_queries': max(queries),
+        'rows_per_request': statistics.median(rows),
+        'status_codes': statuses,
+    }
+
+
+def seed(args):
+    if Task.objects.exists():
+        print("Reusing existing benchmark data", file=sys.stderr)
+        return
+    call_command(
+        'generate_data',
+        users=args.users, projects=args.projects, tasks=args.tasks, seed=args.seed,
+        email_prefix='bench', password=PASSWORD, stdout=sys.stderr,
+    )
+
+
+def run_benchmarks(args):
+    names = args.scenarios or list(SCENARIOS)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        print(f"Unknown scenarios: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    old_name = connection.creation.create_test_db(
+        verbosity=0, autoclobber=True, keepdb=args.keepdb
+    )
+    try:
+        seed(args)
+        fixture = Fixture()
+
+        results = {}
+        for name in names:
+            results[name] = run_scenario(fixture, SCENARIOS[name], args.iterations, args.warmup)
+            summary = results[name]
+            print(
+                f"{name:<20} p50 {summary['p50_ms']:>9.2f}ms  p95 {summary['p95_ms']:>9.2f}ms  "
+                f"p99 {summary['p99_ms']:>9.2f}ms  queries {summary['queries_per_request']:>5}  "
+                f"rows {summary['rows_per_request']:>7}"
+            )
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=args.keepdb)
+
+    report = {
+        'meta': {
+            'created_at': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            'database': connection.vendor,
+            'settings': settings.SETTINGS_MODULE,
+            'python': platform.python_version(),
+            'dataset': {
+                'users': args.users, 'projects': args.projects,
+                'tasks': args.tasks, 'seed': args.seed,
+            },
+            'iterations': args.iterations,
+            'warmup': args.warmup,
+        },
+        'targets': {name: target for name, target in LATENCY_TARGETS.items() if name in results},
+        'results': results,
+    }
+    with open(args.output, 'w') as handle:
+        json.dump(report, handle, indent=2)
+    print(f"Wrote {args.output}")
+
+    missed = missed_targets(results)
+    for name, p95, target in missed:
+        print(f"{name}: p95 {p95:.2f}ms exceeds the {target}ms target", file=sys.stderr)
+    return 1 if missed else 0
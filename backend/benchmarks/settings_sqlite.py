@@ -0,0 +1,15 @@
+from taskforge.settings import *  # noqa: F401,F403
+
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / 'benchmark.sqlite3',
+        'TEST': {'NAME': BASE_DIR / 'test_benchmark.sqlite3'},
+    }
+}
+
+ALLOWED_HOSTS = ['localhost', '127.0.0.1', 'testserver']
+
+# The runner counts queries itself; keep per-request log lines out of the output.
+REQUEST_METRICS_SAMPLE_RATE = 0
@@ -0,0 +1,16 @@
+"""
+ASGI config for taskforge project.
+
+Serves the same application as ``wsgi.py`` and, in addition, the long-lived
+server-sent event streams (``/api/projects/<id>/events/``), e.g.::
+
+    uvicorn taskforge.asgi:application
+"""
+
+import os
+
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'taskforge.settings')
+
+application = get_asgi_application()
@@ -0,0 +1,215 @@
+import atexit
+import contextvars
+import logging
+import queue
+import threading
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.dispatch import Signal
+
+
+logger = logging.getLogger('taskforge.audit')
+
+# Sent with ``instances`` after a batch of audit rows is inserted with
+# ``bulk_create``, which does not send ``post_save``.
+audit_flushed = Signal()
+
+_request_batch = contextvars.ContextVar('audit_request_batch', default=None)
+
+
+def write_batch(instances, drop_failures=False):
+    """
+    Insert audit rows with one ``bulk_create`` per model.
+
+    If a batch fails, its rows are saved one at a time so one bad row does
+    not take the rest with it. Rows that still fail are re-raised, unless
+    ``drop_failures`` is set (the ``commit`` and ``background`` modes, where
+    the change they describe has already committed); then they are logged
+    with their field values and their number returned.
+    """
+    by_model = defaultdict(list)
+    for instance in instances:
+        by_model[type(instance)].append(instance)
+
+    dropped = 0
+    failure = None
+    for model, rows in by_model.items():
+        try:
+            with transaction.atomic():
+                model.objects.bulk_create(rows, batch_size=getattr(settings, 'AUDIT_BATCH_SIZE', 500))
+        except Exception:
+            logger.warning("Batch of %d %s audit rows failed, saving them one by one",
+                           len(rows), model.__name__, exc_info=True)
+        else:
+            audit_flushed.send(sender=model, instances=rows)
+            continue
+
+        # Saved rows send post_save themselves.
+        for row in rows:
+            row.pk = None
+            row._state.adding = True
+            try:
+                with transaction.atomic():
+                    row.save()
+            except Exception as exc:
+                if not drop_failures:
+                    failure = failure or exc
+                    logger.exception("Could not write %s audit row", model.__name__)
+                    continue
+                dropped += 1
+                logger.exception("Dropped %s audit row: %r", model.__name__, row_values(row))
+
+    if failure is not None:
+        raise failure
+    return dropped
+
+
+def row_values(row):
+    """The row's column values, so a dropped row can be recovered from the log."""
+    return {field.attname: getattr(row, field.attname) for field in row._meta.concrete_fields}
+
+
+class AuditLog:
+    """
+    Write-behind sink for ``TaskHistory`` / ``ProjectActivity`` rows.
+
+    ``AUDIT_MODE`` picks the durability trade-off:
+
+    ``sync``
+        ``save()`` inside the caller's transaction, as before.
+    ``commit``
+        Queued when the caller's transaction commits and written with one
+        ``bulk_create`` at the end of the request (``AuditFlushMiddleware``),
+        or straight away outside a request. Rolled-back work leaves no rows.
+        The change has committed by then, so a row the database refuses is
+        logged and counted in ``stats()`` rather than failing the request
+        (the client would otherwise retry an applied change).
+    ``background``
+        Queued on commit to a bounded in-process queue that a worker thread
+        flushes every ``AUDIT_FLUSH_INTERVAL`` seconds or ``AUDIT_BATCH_SIZE``
+        rows, so at most one interval of rows is lost if the process dies.
+        A full queue (``AUDIT_QUEUE_SIZE``) makes the caller flush it
+        itself, slowing writers down instead of dropping rows. The queue is
+        drained at interpreter exit. Rows the database refuses are logged
+        and counted in ``stats()``, as in ``commit`` mode.
+    """
+
+    def __init__(self, mode='commit', batch_size=500, flush_interval=1.0, max_pending=10000):
+        self.mode = mode
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._queue = None
+        self._worker = None
+        self._flush_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._stats_lock = threading.Lock()
+        self.written = 0
+        self.dropped = 0
+
+    def stats(self):
+        """Counters for ``/api/admin/request-metrics/``."""
+        return {
+            'mode': self.mode,
+            'written': self.written,
+            'dropped': self.dropped,
+            'pending': self._queue.qsize() if self._queue is not None else 0,
+        }
+
+    def _write(self, instances):
+        # Both queued modes write after the caller's transaction committed.
+        dropped = write_batch(instances, drop_failures=True)
+        with self._stats_lock:
+            self.written += len(instances) - dropped
+            self.dropped += dropped
+
+    def record(self, instance):
+        if self.mode == 'sync':
+            instance.save()
+            return instance
+
+        transaction.on_commit(lambda: self._accept(instance))
+        return instance
+
+    def _accept(self, instance):
+        if self.mode == 'background':
+            self._enqueue(instance)
+            return
+
+        batch = _request_batch.get()
+        if batch is None:
+            self._write([instance])
+        else:
+            batch.append(instance)
+
+    def begin_request(self):
+        return _request_batch.set([])
+
+    def end_request(self, token):
+        batch = _request_batch.get()
+        _request_batch.reset(token)
+        if batch:
+            self._write(batch)
+
+    def _enqueue(self, instance):
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait(instance)
+        except queue.Full:
+            # Backpressure: the writer pays for a flush before carrying on.
+            self.flush()
+            self._queue.put(instance)
+
+    def _ensure_worker(self):
+        if self._worker is not None:
+            return
+        with self._start_lock:
+            if self._worker is not None:
+                return
+            self._queue = queue.Queue(maxsize=self.max_pending)
+            self._worker = threading.Thread(target=self._run, name='audit-writer', daemon=True)
+            self._worker.start()
+            atexit.register(self.drain)
+
+    def _run(self):
+        while not self._stopping.is_set():
+            self._stopping.wait(self.flush_interval)
+            close_old_connections()
+            self.flush()
+
+    def flush(self):
+        """Write everything queued so far; returns the number of rows taken."""
+        if self._queue is None:
+            return 0
+
+        taken = 0
+        with self._flush_lock:
+            while True:
+                batch = []
+                while len(batch) < self.batch_size:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                if not batch:
+                    return taken
+                self._write(batch)
+                taken += len(batch)
+
+    def drain(self):
+        """Stop the worker and flush what is left, e.g. on shutdown."""
+        self._stopping.set()
+        if self._worker is not None:
+            self._worker.join(timeout=self.flush_interval + 5)
+        return self.flush()
+
+
+audit_log = AuditLog(
+    mode=getattr(settings, 'AUDIT_MODE', 'commit'),
+    batch_size=getattr(settings, 'AUDIT_BATCH_SIZE', 500),
+    flush_interval=getattr(settings, 'AUDIT_FLUSH_INTERVAL', 1.0),
+    max_pending=getattr(settings, 'AUDIT_QUEUE_SIZE', 10000),
+)
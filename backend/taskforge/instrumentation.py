@@ -0,0 +1,220 @@
+import bisect
+import contextvars
+import threading
+import time
+
+from rest_framework import renderers
+
+
+# Upper bounds, in milliseconds, of the latency histogram buckets.
+LATENCY_BUCKETS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, float('inf'))
+
+_current = contextvars.ContextVar('request_metrics', default=None)
+
+
+class RequestMetrics:
+    """Measurements for one sampled request."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.duration = 0.0
+        self.queries = 0
+        self.db_time = 0.0
+        self.duplicates = 0
+        self.serializer_time = 0.0
+        self.render_time = 0.0
+        self.serializing = False
+        self._seen_sql = set()
+
+    def query_wrapper(self, execute, sql, params, many, context):
+        """``connection.execute_wrapper`` hook timing every statement."""
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - started
+            self.queries += 1
+            # The same parametrised SQL issued again is the N+1 signature.
+            if sql in self._seen_sql:
+                self.duplicates += 1
+            else:
+                self._seen_sql.add(sql)
+
+    def finish(self):
+        self.duration = time.perf_counter() - self.started
+
+    def server_timing(self):
+        return ', '.join([
+            f'app;dur={self.duration * 1000:.1f}',
+            f'db;dur={self.db_time * 1000:.1f};desc="{self.queries} queries"',
+            f'dup;desc="{self.duplicates} duplicate queries"',
+            f'serialize;dur={self.serializer_time * 1000:.1f}',
+            f'render;dur={self.render_time * 1000:.1f}',
+        ])
+
+    def as_dict(self):
+        return {
+            'duration_ms': round(self.duration * 1000, 2),
+            'queries': self.queries,
+            'db_ms': round(self.db_time * 1000, 2),
+            'duplicate_queries': self.duplicates,
+            'serializer_ms': round(self.serializer_time * 1000, 2),
+            'render_ms': round(self.render_time * 1000, 2),
+        }
+
+
+def activate(metrics):
+    return _current.set(metrics)
+
+
+def deactivate(token):
+    _current.reset(token)
+
+
+class TimedSerializerMixin:
+    """
+    Serializer mixin charging ``to_representation`` (what ``.data`` runs,
+    including any queries it triggers) to the current sampled request.
+    Only the outermost call is timed, so nested serializers are not counted
+    twice; for ``many=True`` that is each item of the list.
+    """
+
+    def to_representation(self, instance):
+        metrics = _current.get()
+        if metrics is None or metrics.serializing:
+            return super().to_representation(instance)
+
+        metrics.serializing = True
+        started = time.perf_counter()
+        try:
+            return super().to_representation(instance)
+        finally:
+            metrics.serializer_time += time.perf_counter() - started
+            metrics.serializing = False
+
+
+class TimedRendererMixin:
+    """
+    Renderer mixin charging the time spent encoding a DRF response to the
+    current sampled request. Configured through
+    ``REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES']``, so nothing outside a
+    sampled request pays for it.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        metrics = _current.get()
+        if metrics is None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        started = time.perf_counter()
+        try:
+            return super().render(data, accepted_media_type, renderer_context)
+        finally:
+            metrics.render_time += time.perf_counter() - started
+
+
+class TimedJSONRenderer(TimedRendererMixin, renderers.JSONRenderer):
+    pass
+
+
+class TimedBrowsableAPIRenderer(TimedRendererMixin, renderers.BrowsableAPIRenderer):
+    pass
+
+
+class Histogram:
+    """Per-endpoint aggregates kept in process memory."""
+
+    def __init__(self):
+        self.requests = 0
+        self.sampled = 0
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.queries = 0
+        self.max_queries = 0
+        self.db_ms = 0.0
+        self.duplicates = 0
+        self.serializer_ms = 0.0
+        self.render_ms = 0.0
+        self.statuses = {}
+
+    def add(self, duration_ms, status_code, metrics=None):
+        self.requests += 1
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS, duration_ms)] += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        self.statuses[status_code] = self.statuses.get(status_code, 0) + 1
+
+        if metrics is not None:
+            self.sampled += 1
+            self.queries += metrics.queries
+            self.max_queries = max(self.max_queries, metrics.queries)
+            self.db_ms += metrics.db_time * 1000
+            self.duplicates += metrics.duplicates
+            self.serializer_ms += metrics.serializer_time * 1000
+            self.render_ms += metrics.render_time * 1000
+
+    def percentile(self, fraction):
+        """Upper bound of the bucket holding the given fraction of requests."""
+        target = fraction * self.requests
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.buckets):
+            seen += count
+            if count and seen >= target:
+                return round(min(bound, self.max_ms), 2)
+        return 0
+
+    def as_dict(self):
+        sampled = self.sampled or 1
+        return {
+            'requests': self.requests,
+            'sampled': self.sampled,
+            'mean_ms': round(self.total_ms / self.requests, 2) if self.requests else 0,
+            'p50_ms': self.percentile(0.50),
+            'p95_ms': self.percentile(0.95),
+            'p99_ms': self.percentile(0.99),
+            'max_ms': round(self.max_ms, 2),
+            'buckets': {
+                'le_inf' if bound == float('inf') else f'le_{bound}': count
+                for bound, count in zip(LATENCY_BUCKETS, self.buckets)
+            },
+            'mean_queries': round(self.queries / sampled, 2),
+            'max_queries': self.max_queries,
+            'mean_db_ms': round(self.db_ms / sampled, 2),
+            'mean_duplicate_queries': round(self.duplicates / sampled, 2),
+            'mean_serializer_ms': round(self.serializer_ms / sampled, 2),
+            'mean_render_ms': round(self.render_ms / sampled, 2),
+            'status_codes': {str(code): count for code, count in sorted(self.statuses.items())},
+        }
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._histograms = {}
+        self._lock = threading.Lock()
+        self.since = time.time()
+
+    def record(self, name, duration_ms, status_code, metrics=None):
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram()
+            histogram.add(duration_ms, status_code, metrics)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'since': self.since,
+                'endpoints': {
+                    name: histogram.as_dict()
+                    for name, histogram in sorted(self._histograms.items())
+                },
+            }
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self.since = time.time()
+
+
+registry = MetricsRegistry()
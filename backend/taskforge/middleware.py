@@ -1,3 +1,19 @@
+import json
+import logging
+import random
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+
+from . import instrumentation
+from .audit import audit_log
+
+
+logger = logging.getLogger('taskforge.requests')
+
+
 class VersionHeaderMiddleware:
     def __init__(self, get_response):
         self.get_response = get_response
@@ -5,4 +21,78 @@ class VersionHeaderMiddleware:
     def __call__(self, request):
         response = self.get_response(request)
         response['X-TaskForge-Version'] = '1.0.0'
-        return response 
\ No newline at end of file
+        return response
+
+
+class RequestMetricsMiddleware:
+    """
+    Record wall time for every request in the per-endpoint histograms and,
+    for a ``REQUEST_METRICS_SAMPLE_RATE`` fraction of requests, also count DB
+    queries, DB time, repeated SQL (N+1), serializer time (serializers using
+    ``TimedSerializerMixin``) and, separately, response rendering time
+    (the ``TimedRendererMixin`` renderers).
+
+    Sampled requests get a ``Server-Timing`` header and a JSON log line on
+    the ``taskforge.requests`` logger. Unsampled requests only pay for two
+    clock reads and a histogram update.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate = getattr(settings, 'REQUEST_METRICS_SAMPLE_RATE', 1.0)
+        self.server_timing = getattr(settings, 'REQUEST_METRICS_SERVER_TIMING', True)
+
+    def __call__(self, request):
+        if self.sample_rate <= 0 or random.random() >= self.sample_rate:
+            started = time.perf_counter()
+            response = self.get_response(request)
+            self.record(request, response, (time.perf_counter() - started) * 1000)
+            return response
+
+        metrics = instrumentation.RequestMetrics()
+        token = instrumentation.activate(metrics)
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(metrics.query_wrapper))
+                response = self.get_response(request)
+        finally:
+            instrumentation.deactivate(token)
+            metrics.finish()
+
+        name = self.record(request, response, metrics.duration * 1000, metrics)
+        if self.server_timing:
+            response['Server-Timing'] = metrics.server_timing()
+
+        logger.info(json.dumps({
+            'event': 'request',
+            'method': request.method,
+            'path': request.path,
+            'endpoint': name,
+            'status': response.status_code,
+            **metrics.as_dict(),
+        }))
+        return response
+
+    def record(self, request, response, duration_ms, metrics=None):
+        match = getattr(request, 'resolver_match', None)
+        name = match.view_name if match is not None else '<unresolved>'
+        instrumentation.registry.record(name, duration_ms, response.status_code, metrics)
+        return name
+
+
+class AuditFlushMiddleware:
+    """
+    Collect the audit rows a request records (``AUDIT_MODE = 'commit'``)
+    and write them with one ``bulk_create`` once the view has returned.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token = audit_log.begin_request()
+        try:
+            return self.get_response(request)
+        finally:
+            audit_log.end_request(token)
@@ -0,0 +1,113 @@
+import asyncio
+import itertools
+import threading
+from collections import defaultdict, deque
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+
+class Subscription:
+    """One consumer's queue of events on a channel."""
+
+    def __init__(self, broker, channel, loop, max_pending):
+        self.broker = broker
+        self.channel = channel
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize=max_pending)
+        self.overflowed = False
+
+    def deliver(self, event):
+        """Hand an event over from any thread."""
+        self.loop.call_soon_threadsafe(self._put, event)
+
+    def _put(self, event):
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # A consumer this far behind has to resynchronise anyway.
+            self.overflowed = True
+
+    async def get(self, timeout):
+        """The next event, or ``None`` if nothing arrives within ``timeout`` seconds."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self):
+        self.broker.unsubscribe(self)
+
+
+class InProcessBroker:
+    """
+    Fans events out to subscribers in the current process.
+
+    The last ``history`` events of each channel are kept so a reconnecting
+    client can resume after the id it last saw. Publishers and subscribers
+    must share a process, so this only suits single-process setups (and
+    tests); ``EVENT_BROKER`` selects a broker that relays between processes,
+    such as ``apps.projects.broker.DatabaseBroker``, implementing the same
+    ``publish`` / ``publish_many`` / ``subscribe`` / ``unsubscribe`` methods.
+    """
+
+    def __init__(self, history=500, max_pending=1000):
+        self.max_pending = max_pending
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._subscribers = defaultdict(set)
+        self._history = defaultdict(lambda: deque(maxlen=history))
+
+    def publish(self, channel, event):
+        with self._lock:
+            event = {'id': next(self._ids), **event}
+            self._history[channel].append(event)
+            subscribers = list(self._subscribers.get(channel, ()))
+
+        for subscription in subscribers:
+            subscription.deliver(event)
+        return event
+
+    def publish_many(self, events):
+        """Publish ``(channel, event)`` pairs, in order."""
+        return [self.publish(channel, event) for channel, event in events]
+
+    def subscribe(self, channel, last_event_id=None):
+        """
+        Subscribe the running event loop to ``channel``. Events newer than
+        ``last_event_id`` that are still in the history are queued first.
+        """
+        subscription = Subscription(self, channel, asyncio.get_running_loop(), self.max_pending)
+        with self._lock:
+            self._subscribers[channel].add(subscription)
+            backlog = []
+            if last_event_id is not None:
+                backlog = [event for event in self._history[channel] if event['id'] > last_event_id]
+
+        for event in backlog:
+            subscription._put(event)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.channel)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.channel]
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker():
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                broker_class = import_string(
+                    getattr(settings, 'EVENT_BROKER', 'taskforge.pubsub.InProcessBroker')
+                )
+                _broker = broker_class(history=getattr(settings, 'EVENT_HISTORY', 500))
+    return _broker
@@ -0,0 +1,74 @@
+"""
+Registry of hot queries whose plans ``manage.py audit_query_plans`` checks.
+
+Apps register querysets from a ``hot_queries`` module::
+
+    from taskforge.query_audit import register_hot_query
+
+    @register_hot_query('tasks.by_project_status')
+    def tasks_by_project_status():
+        return Task.objects.filter(project_id=..., status='TODO')
+"""
+import re
+
+from django.db import connection
+from django.utils.module_loading import autodiscover_modules
+
+
+HOT_QUERIES = {}
+
+
+def register_hot_query(name):
+    def decorator(func):
+        HOT_QUERIES[name] = func
+        return func
+    return decorator
+
+
+def load_hot_queries():
+    autodiscover_modules('hot_queries')
+    return HOT_QUERIES
+
+
+def explain(queryset):
+    """Run the backend's EXPLAIN on ``queryset`` and return (columns, rows)."""
+    sql, params = queryset.query.sql_with_params()
+    prefix = connection.ops.explain_query_prefix()
+    with connection.cursor() as cursor:
+        cursor.execute(f"{prefix} {sql}", params)
+        columns = [column[0] for column in cursor.description]
+        return columns, cursor.fetchall()
+
+
+def find_full_scans(columns, rows):
+    """Return the tables the plan reads with a full scan."""
+    vendor = connection.vendor
+    tables = []
+    
+    if vendor == 'mysql':
+        for row in rows:
+            entry = dict(zip(columns, row))
+            if entry.get('type') == 'ALL':
+                tables.append(entry.get('table'))
+    elif vendor == 'sqlite':
+        for row in rows:
+            detail = row[-1]
+            match = re.match(r'SCAN (?:TABLE )?(\w+)', detail)
+            if match and 'USING' not in detail and match.group(1) != 'CONSTANT':
+                tables.append(match.group(1))
+    elif vendor == 'postgresql':
+        for row in rows:
+            match = re.search(r'Seq Scan on (\w+)', row[0])
+            if match:
+                tables.append(match.group(1))
+    
+    return tables
+
+
+def sample_value(model, field_name):
+    """A real value for ``field_name`` so plans are not short-circuited."""
+    value = model._default_manager.order_by().values_list(field_name, flat=True).first()
+    if value is None:
+        import uuid
+        value = uuid.uuid4()
+    return value
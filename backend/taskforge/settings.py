@@ -25,10 +25,13 @@ INSTALLED_APPS = [
     
     'apps.accounts',
     'apps.projects',
-    'apps.tasks'
+    'apps.tasks',
+    'apps.jobs',
+    'apps.search'
 ]
 
 MIDDLEWARE = [
+    'taskforge.middleware.RequestMetricsMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -38,6 +41,7 @@ MIDDLEWARE = [
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'taskforge.middleware.VersionHeaderMiddleware',
+    'taskforge.middleware.AuditFlushMiddleware',
 ]
 
 ROOT_URLCONF = 'taskforge.urls'
@@ -107,6 +111,9 @@ USE_TZ = True
 STATIC_URL = 'static/'
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 
+MEDIA_URL = 'media/'
+MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
+
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
@@ -120,6 +127,10 @@ REST_FRAMEWORK = {
     ),
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 10,
+    'DEFAULT_RENDERER_CLASSES': (
+        'taskforge.instrumentation.TimedJSONRenderer',
+        'taskforge.instrumentation.TimedBrowsableAPIRenderer',
+    ),
 }
 
 
@@ -153,6 +164,120 @@ CORS_ALLOW_HEADERS = [
 JWT_SECRET = SECRET_KEY 
 JWT_ALGORITHM = 'HS256'
 JWT_EXPIRATION_DELTA = 60 * 60 * 24  
+# How long after expiry a token can still be exchanged at /api/auth/refresh-token/.
+JWT_REFRESH_GRACE = 60 * 60
+
+# Authenticated users are resolved through apps.accounts.user_cache. Set
+# AUTH_USER_CACHE_BACKEND to a CACHES alias to share entries across workers.
+AUTH_USER_CACHE_SIZE = 1024
+AUTH_USER_CACHE_TTL = 60
+AUTH_USER_CACHE_BACKEND = None
+
+TOKEN_REVOCATION_BACKEND = None
+TOKEN_REVOCATION_SYNC_INTERVAL = 30
+
+# Project detail and member list responses are cached per project version, and
+# answered with 304 when the client's ETag is current, only when this names a
+# CACHES alias shared by all web and job workers. A per-process cache would
+# keep serving other workers' stale copies until PROJECT_CACHE_TTL.
+PROJECT_CACHE_BACKEND = None
+PROJECT_CACHE_TTL = 300
+
+# Each user's project/role map, used for every permission check, is only
+# cached across requests when this names a CACHES alias shared by all web and
+# job workers (e.g. Redis or Memcached). Left unset, it is read from the
+# database once per request, so a removed member loses access immediately.
+MEMBERSHIP_CACHE_BACKEND = None
+MEMBERSHIP_CACHE_TTL = 300
+
+# Project change feed (GET /api/projects/<id>/events/, served by taskforge.asgi).
+# Events are relayed between processes (web workers, run_jobs, the overdue
+# sweep) through the FeedEvent table, polled every EVENT_POLL_INTERVAL seconds
+# by each process with subscribers and kept for EVENT_RETENTION seconds.
+# taskforge.pubsub.InProcessBroker only reaches subscribers in the publishing
+# process.
+EVENT_BROKER = 'apps.projects.broker.DatabaseBroker'
+EVENT_POLL_INTERVAL = 1.0
+EVENT_RETENTION = 3600
+EVENT_HISTORY = 500
+EVENT_STREAM_KEEPALIVE = 15
+EVENT_STREAM_MAX_AGE = 300
+
+# Delta sync (GET /api/sync/). Tombstones older than the retention are pruned
+# by `manage.py prune_sync_tombstones`; older sync tokens must resync fully.
+SYNC_PAGE_SIZE = 500
+SYNC_OVERLAP_SECONDS = 5
+SYNC_TOMBSTONE_RETENTION_DAYS = 30
+
+# TaskHistory / ProjectActivity writes: 'sync', 'commit' (one bulk insert per
+# request, after commit) or 'background' (flushed by a worker thread).
+AUDIT_MODE = 'commit'
+AUDIT_BATCH_SIZE = 500
+AUDIT_FLUSH_INTERVAL = 1.0
+AUDIT_QUEUE_SIZE = 10000
+
+# Search (GET /api/search/, /api/projects/search/). The index is kept up to
+# date on save; rebuild it with `manage.py rebuild_search_index` after bulk
+# loads that bypass model signals.
+SEARCH_MAX_TERMS = 8
+SEARCH_MAX_RESULTS = 50
+SEARCH_MAX_OFFSET = 200
+
+# Overdue sweep (`manage.py sweep_overdue_tasks --loop`): flags tasks whose
+# due date has passed, so Task.overdue and ProjectStats.overdue_tasks lag by
+# at most one interval.
+OVERDUE_SWEEP_INTERVAL = 60
+OVERDUE_SWEEP_BATCH_SIZE = 500
+
+# Background jobs (DB-backed queue, run by `manage.py run_jobs`). Failed jobs
+# are retried after JOB_RETRY_BACKOFF * 2**(attempt - 1) seconds. A running job
+# records a heartbeat every JOB_HEARTBEAT_INTERVAL seconds; one whose heartbeat
+# is older than JOB_TIMEOUT (its worker died) is handed to another worker.
+JOB_MAX_ATTEMPTS = 3
+JOB_RETRY_BACKOFF = 30
+JOB_RETRY_BACKOFF_MAX = 3600
+JOB_TIMEOUT = 300
+JOB_HEARTBEAT_INTERVAL = 30
+JOB_POLL_INTERVAL = 1.0
+JOB_WORKER_THREADS = 2
+JOB_WORKER_PROCESSES = 1
+JOB_INLINE_DELETE_MAX_TASKS = 500
+
+# Background task exports are downloadable by their owner from
+# /api/tasks/exports/<id>/ until `manage.py prune_exports` removes them.
+EXPORT_RETENTION_HOURS = 24
+
+# Files that need an access check (attachments, exports) are stored here
+# rather than in MEDIA_ROOT, so they are never reachable at MEDIA_URL.
+PRIVATE_MEDIA_ROOT = os.path.join(BASE_DIR, 'private')
+
+# Chunked attachment uploads. Parts are written to ATTACHMENT_UPLOAD_DIR (local
+# disk, outside MEDIA_ROOT) until the upload completes; sessions left behind
+# are removed by `manage.py prune_upload_sessions` after the expiry. Completed
+# files go to PRIVATE_MEDIA_ROOT. Set ATTACHMENT_SENDFILE to 'x-accel-redirect'
+# (nginx; ATTACHMENT_SENDFILE_PREFIX must be an `internal` location aliased to
+# PRIVATE_MEDIA_ROOT) or 'x-sendfile' (Apache/lighttpd) to let the front-end
+# server send downloads.
+ATTACHMENT_CHUNK_SIZE = 8 * 1024 * 1024
+ATTACHMENT_MAX_SIZE = 5 * 1024 ** 3
+ATTACHMENT_UPLOAD_DIR = os.path.join(BASE_DIR, 'uploads')
+ATTACHMENT_UPLOAD_EXPIRY_HOURS = 24
+ATTACHMENT_SENDFILE = None
+ATTACHMENT_SENDFILE_PREFIX = '/protected/'
+
+# Profile picture / avatar variants: square crops of each size (pixels), rendered
+# by the `accounts.image_variants` job after an upload and stored in
+# IMAGE_VARIANT_DIR under names derived from the source's SHA-256.
+# `manage.py regenerate_image_variants` rebuilds them all.
+IMAGE_VARIANTS = {'small': 64, 'medium': 256, 'large': 512}
+IMAGE_VARIANT_FORMAT = 'WEBP'
+IMAGE_VARIANT_QUALITY = 80
+IMAGE_VARIANT_DIR = 'variants'
+
+# Fraction of requests that get full query/render instrumentation;
+# every request is still counted in the latency histograms.
+REQUEST_METRICS_SAMPLE_RATE = 1.0
+REQUEST_METRICS_SERVER_TIMING = True
 
 
 EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
@@ -174,4 +299,5 @@ LOGGING = {
 }
 
 if os.environ.get('ENVIRONMENT') == 'production':
-    DEBUG = False
\ No newline at end of file
+    DEBUG = False
+    REQUEST_METRICS_SAMPLE_RATE = 0.05
\ No newline at end of file
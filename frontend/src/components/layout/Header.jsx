@@ -166,7 +166,7 @@ const Header = ({ user, onLogout, toggleSidebar }) => {
                 {user?.profile_picture ? (
                   <Avatar 
                     alt={`${user.first_name} ${user.last_name}`} 
-                    src={user.profile_picture}
+                    src={user.profile_picture_variants?.small || user.profile_picture}
                     sx={{ width: 32, height: 32 }}
                   />
                 ) : (
@@ -155,8 +155,15 @@ export const archiveProject = (id) => async (dispatch) => {
       throw new Error('Failed to archive project');
     }
     
+    // Archiving runs as a background job (202 with the job); wait for it,
+    // then reload the archived project.
+    const job = await waitForJob(await response.json());
+    if (job.status !== 'SUCCEEDED') {
+      throw new Error(job.error || 'Failed to archive project');
+    }
+    
     // Using updateProjectSuccess instead of having a dedicated action
-    const project = await response.json();
+    const project = await fetchProjectById(id);
     dispatch(updateProjectSuccess(project));
     return project;
   } catch (error) {
@@ -166,6 +173,34 @@ export const archiveProject = (id) => async (dispatch) => {
 };
 
 
+const JOB_POLL_INTERVAL = 1000;
+const JOB_POLL_TIMEOUT = 120000;
+
+// Poll a background job's url until it has SUCCEEDED or FAILED.
+async function waitForJob(job) {
+  const deadline = Date.now() + JOB_POLL_TIMEOUT;
+  
+  while (job.status !== 'SUCCEEDED' && job.status !== 'FAILED') {
+    if (Date.now() > deadline) {
+      throw new Error('Timed out waiting for the job to finish');
+    }
+    await new Promise(resolve => setTimeout(resolve, JOB_POLL_INTERVAL));
+    
+    const response = await fetch(job.url, {
+      headers: {
+        'Authorization': `Bearer ${getToken()}`,
+      },
+    });
+    if (!response.ok) {
+      throw new Error('Failed to fetch job status');
+    }
+    job = await response.json();
+  }
+  
+  return job;
+}
+
+
 export function fetchProjectById(id) {
   return fetch(`${API_URL}/projects/${id}/`, {
     headers: {